@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""Compare HTTP/1.1 and HTTP/2 for many concurrent `/responses` streams.
+
+Runs `AsyncClient.responses.stream(...)` against the local TLS stand-in server
+from `tests/_h2_server.py` and reports TCP connection count and latency
+percentiles for each transport. Requires the `h2` and `cryptography` packages.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+_ROOT = Path(__file__).resolve().parents[1]
+for _path in (_ROOT / "tests", _ROOT / "src"):
+    _path_str = str(_path)
+    if _path_str in sys.path:
+        sys.path.remove(_path_str)
+    sys.path.insert(0, _path_str)
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="HTTP/1.1 vs HTTP/2 stream benchmark")
+    parser.add_argument("--concurrency", type=int, default=500, help="Concurrent streams")
+    parser.add_argument("--chunks", type=int, default=20, help="SSE frames per stream")
+    parser.add_argument(
+        "--chunk-delay",
+        type=float,
+        default=0.01,
+        help="Server delay between frames in seconds",
+    )
+    return parser
+
+
+def _percentile(samples: list[float], fraction: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, round(fraction * (len(ordered) - 1))))
+    return ordered[index]
+
+
+async def _run_mode(*, http2: bool, concurrency: int, chunks: int, chunk_delay: float) -> None:
+    from _h2_server import LocalStreamServer
+    from oauth_codex import AsyncClient
+    from oauth_codex.core_types import OAuthTokens
+
+    class _StaticTokenStore:
+        def load(self) -> OAuthTokens:
+            return OAuthTokens(access_token="bench", expires_at=9_999_999_999)
+
+        def save(self, tokens: OAuthTokens) -> None:
+            return None
+
+        def delete(self) -> None:
+            return None
+
+    async with LocalStreamServer(chunks=chunks, chunk_delay=chunk_delay) as server:
+        os.environ["SSL_CERT_FILE"] = server.cafile
+        client = AsyncClient(
+            token_store=_StaticTokenStore(),
+            base_url=server.base_url,
+            http2=http2,
+            max_connections=concurrency,
+            max_keepalive_connections=concurrency,
+            pool_timeout=120.0,
+            timeout=120.0,
+        )
+
+        async def one() -> float:
+            started = time.perf_counter()
+            stream = await client.responses.stream(model="bench", input="hi")
+            async for _event in stream:
+                pass
+            return time.perf_counter() - started
+
+        wall_started = time.perf_counter()
+        try:
+            latencies = await asyncio.gather(*(one() for _ in range(concurrency)))
+        finally:
+            await client.close()
+        wall = time.perf_counter() - wall_started
+
+    label = "HTTP/2  " if http2 else "HTTP/1.1"
+    print(
+        f"{label} streams={concurrency} connections={server.connections} "
+        f"p50={statistics.median(latencies) * 1000:.1f}ms "
+        f"p99={_percentile(latencies, 0.99) * 1000:.1f}ms "
+        f"wall={wall:.2f}s"
+    )
+
+
+def main() -> int:
+    args = _build_parser().parse_args()
+    for http2 in (False, True):
+        asyncio.run(
+            _run_mode(
+                http2=http2,
+                concurrency=args.concurrency,
+                chunks=args.chunks,
+                chunk_delay=args.chunk_delay,
+            )
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""Compare JSON codecs on ~200 KB conversation payloads.
+
+Times request-body encoding and response decoding for each available codec
+(`stdlib`, `orjson`, `msgspec`), and the per-request cost of re-encoding the
+body on every attempt versus encoding it once and reusing the bytes.
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+_ROOT = Path(__file__).resolve().parents[1]
+_SRC = str(_ROOT / "src")
+if _SRC in sys.path:
+    sys.path.remove(_SRC)
+sys.path.insert(0, _SRC)
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="JSON codec benchmark")
+    parser.add_argument("--kilobytes", type=int, default=200, help="Approximate payload size")
+    parser.add_argument("--iterations", type=int, default=200, help="Timed runs per case")
+    parser.add_argument("--attempts", type=int, default=3, help="Attempts per request")
+    return parser
+
+
+def _conversation(kilobytes: int) -> dict[str, Any]:
+    turn = (
+        "Refactor the retry loop so the request body is built once. "
+        "Keep the behaviour of the existing tests — including unicode ✓. "
+    ) * 8
+    messages: list[dict[str, Any]] = []
+    while sum(len(m["content"][0]["text"]) for m in messages) < kilobytes * 1000:
+        role = "user" if len(messages) % 2 == 0 else "assistant"
+        kind = "input_text" if role == "user" else "output_text"
+        messages.append({"role": role, "content": [{"type": kind, "text": turn}]})
+    return {
+        "model": "gpt-5.3-codex",
+        "input": messages,
+        "instructions": "You are a careful reviewer.",
+        "max_output_tokens": 2048,
+        "metadata": {"session": "bench", "turns": len(messages)},
+    }
+
+
+def _median_us(fn: Callable[[], Any], iterations: int) -> float:
+    fn()
+    samples = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - started)
+    return statistics.median(samples) * 1e6
+
+
+def main() -> int:
+    from oauth_codex._json import get_codec
+
+    args = _build_parser().parse_args()
+    payload = _conversation(args.kilobytes)
+
+    print(f"payload={len(get_codec('stdlib').dumps(payload)) / 1000:.0f}KB")
+    for name in ("stdlib", "orjson", "msgspec"):
+        try:
+            codec = get_codec(name)
+        except ImportError:
+            print(f"{name:<8} not installed")
+            continue
+        body = codec.dumps(payload)
+        encode = _median_us(lambda: codec.dumps(payload), args.iterations)
+        decode = _median_us(lambda: codec.loads(body), args.iterations)
+
+        def per_attempt() -> None:
+            for _ in range(args.attempts):
+                codec.dumps(payload)
+
+        def once() -> None:
+            encoded = codec.dumps(payload)
+            for _ in range(args.attempts):
+                len(encoded)
+
+        reencode = _median_us(per_attempt, args.iterations)
+        reuse = _median_us(once, args.iterations)
+        print(
+            f"{name:<8} encode={encode:.0f}us decode={decode:.0f}us "
+            f"{args.attempts}-attempt body: re-encode={reencode:.0f}us once={reuse:.0f}us"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
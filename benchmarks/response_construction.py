@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""Measure `Response` construction cost for large response bodies.
+
+Times `response_from_engine` from `resources/responses/_helpers.py` on a
+decoded body with many output items, with full pydantic validation (the
+default) and with `trusted=True`, which builds the model without validating,
+then the same again followed by the `ChatCompletion` conversion used by
+`chat.completions.create`.
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+_ROOT = Path(__file__).resolve().parents[1]
+_SRC = str(_ROOT / "src")
+if _SRC in sys.path:
+    sys.path.remove(_SRC)
+sys.path.insert(0, _SRC)
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Response construction benchmark")
+    parser.add_argument("--items", type=int, default=500, help="Output items per response")
+    parser.add_argument("--iterations", type=int, default=200, help="Constructions per mode")
+    return parser
+
+
+def _body(items: int) -> dict[str, Any]:
+    output: list[dict[str, Any]] = []
+    for index in range(items):
+        if index % 3 == 2:
+            output.append(
+                {
+                    "type": "function_call",
+                    "id": f"fc_{index}",
+                    "call_id": f"call_{index}",
+                    "name": "lookup",
+                    "arguments": '{"query": "weather", "limit": 5}',
+                    "status": "completed",
+                }
+            )
+        else:
+            output.append(
+                {
+                    "type": "message",
+                    "id": f"msg_{index}",
+                    "role": "assistant",
+                    "status": "completed",
+                    "content": [
+                        {"type": "output_text", "text": f"Chunk {index} of the answer.", "annotations": []}
+                    ],
+                }
+            )
+    return {
+        "id": "resp_bench",
+        "output": output,
+        "output_text": "".join(f"Chunk {index} of the answer." for index in range(items)),
+        "usage": {"input_tokens": 1200, "output_tokens": 4800, "total_tokens": 6000},
+        "finish_reason": "stop",
+    }
+
+
+def main() -> int:
+    from oauth_codex.resources.chat.completions import _to_chat_completion
+    from oauth_codex.resources.responses._helpers import response_from_engine
+
+    args = _build_parser().parse_args()
+    body = _body(args.items)
+
+    def build(trusted: bool, chat: bool) -> None:
+        response = response_from_engine(body, trusted=trusted)
+        if chat:
+            _to_chat_completion(response=response, requested_model="gpt-5.3-codex")
+
+    results = {}
+    for label, trusted, chat in (
+        ("validated", False, False),
+        ("trusted", True, False),
+        ("chat", False, True),
+        ("chat+trusted", True, True),
+    ):
+        build(trusted, chat)
+        samples: list[float] = []
+        for _ in range(args.iterations):
+            started = time.perf_counter()
+            build(trusted, chat)
+            samples.append(time.perf_counter() - started)
+        results[label] = statistics.median(samples)
+        print(
+            f"{label:<12} items={args.items} iterations={args.iterations} "
+            f"median={results[label] * 1e6:.0f}us "
+            f"mean={statistics.fmean(samples) * 1e6:.0f}us"
+        )
+    print(f"speedup x{results['validated'] / results['trusted']:.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
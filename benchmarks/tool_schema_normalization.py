@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""Measure per-request tool normalization cost for a 30-tool agent.
+
+Times `_normalize_tools` from `resources/responses/responses.py` over callable
+tools, first with the schema cache cleared before every request (the cost
+before memoization) and then with schemas served from the cache.
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+_ROOT = Path(__file__).resolve().parents[1]
+_SRC = str(_ROOT / "src")
+if _SRC in sys.path:
+    sys.path.remove(_SRC)
+sys.path.insert(0, _SRC)
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Tool schema normalization benchmark")
+    parser.add_argument("--tools", type=int, default=30, help="Tools per request")
+    parser.add_argument("--requests", type=int, default=500, help="Requests per mode")
+    return parser
+
+
+def _make_tools(count: int) -> list[Callable[..., Any]]:
+    from pydantic import BaseModel
+
+    class Address(BaseModel):
+        street: str
+        city: str
+        postcode: str | None = None
+
+    class Order(BaseModel):
+        order_id: str
+        quantity: int
+        shipping: Address
+        notes: list[str] = []
+
+    def typed_tool(
+        query: str, limit: int = 10, tags: list[str] | None = None, exact: bool = False
+    ) -> str:
+        """Search the catalogue."""
+        return query
+
+    def model_tool(order: Order) -> str:
+        """Place an order."""
+        return order.order_id
+
+    def mixed_tool(city: str, days: int, units: dict[str, Any] | None = None) -> str:
+        """Look up the forecast."""
+        return city
+
+    templates = (typed_tool, model_tool, mixed_tool)
+    tools: list[Callable[..., Any]] = []
+    for index in range(count):
+        template = templates[index % len(templates)]
+        # Fresh function objects so every tool has its own cache entry.
+        tool = type(template)(
+            template.__code__,
+            template.__globals__,
+            f"{template.__name__}_{index}",
+            template.__defaults__,
+            template.__closure__,
+        )
+        tool.__annotations__ = dict(template.__annotations__)
+        tool.__doc__ = template.__doc__
+        tools.append(tool)
+    return tools
+
+
+def _run(tools: list[Callable[..., Any]], requests: int, *, cached: bool) -> list[float]:
+    import oauth_codex.tooling as tooling
+    from oauth_codex.resources.responses.responses import _normalize_tools
+
+    samples: list[float] = []
+    for _ in range(requests):
+        if not cached:
+            tooling._TOOL_SCHEMA_CACHE.clear()
+            tooling._BOUND_TOOL_SCHEMA_CACHE.clear()
+        started = time.perf_counter()
+        _normalize_tools(list(tools))
+        samples.append(time.perf_counter() - started)
+    return samples
+
+
+def main() -> int:
+    args = _build_parser().parse_args()
+    tools = _make_tools(args.tools)
+    _run(tools, 5, cached=True)
+
+    results = {}
+    for label, cached in (("uncached", False), ("cached", True)):
+        samples = _run(tools, args.requests, cached=cached)
+        results[label] = statistics.median(samples)
+        print(
+            f"{label:<8} tools={args.tools} requests={args.requests} "
+            f"median={results[label] * 1e6:.0f}us "
+            f"mean={statistics.fmean(samples) * 1e6:.0f}us"
+        )
+    print(f"speedup x{results['uncached'] / results['cached']:.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,15 +1,21 @@
 from __future__ import annotations
 
 from . import errors, types
+from ._circuit_breaker import CircuitBreaker, CircuitState
+from ._hedging import HedgePolicy
+from ._rate_limit import RateLimiter
+from ._retry import RetryPolicy
 from ._sdk_client import AsyncClient, Client
 
 from ._exceptions import (
     APIConnectionError,
     APIError,
+    APIPoolTimeoutError,
     APIStatusError,
     APITimeoutError,
     AuthenticationError,
     BadRequestError,
+    CircuitOpenError,
     CodexError,
     ConflictError,
     InternalServerError,
@@ -19,6 +25,8 @@ from ._exceptions import (
     UnprocessableEntityError,
 )
 from ._version import __title__, __version__
+from .resources.responses._batch import BatchCancelHandle, BatchProgress, BatchResult
+from .tooling import ToolSet
 from .core_types import listMessage
 
 __all__ = [
@@ -28,11 +36,22 @@ __all__ = [
     "__version__",
     "Client",
     "AsyncClient",
+    "RetryPolicy",
+    "RateLimiter",
+    "CircuitBreaker",
+    "CircuitState",
+    "HedgePolicy",
+    "BatchResult",
+    "BatchProgress",
+    "BatchCancelHandle",
+    "ToolSet",
     "listMessage",
     "CodexError",
     "APIError",
     "APIConnectionError",
     "APITimeoutError",
+    "APIPoolTimeoutError",
+    "CircuitOpenError",
     "APIStatusError",
     "BadRequestError",
     "AuthenticationError",
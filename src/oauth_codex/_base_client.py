@@ -2,22 +2,88 @@ from __future__ import annotations
 
 import asyncio
 import importlib
-import random
 import time
 from typing import Any, Mapping
 
 import httpx
 
+from ._circuit_breaker import CircuitBreaker, endpoint_key
+from ._json import JSONCodecName, encode_body, get_codec
+from ._rate_limit import RateLimiter, estimate_request_tokens
+from ._retry import RetryBudget, RetryPolicy
+
+DEFAULT_MAX_CONNECTIONS = 100
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 20
+DEFAULT_KEEPALIVE_EXPIRY = 5.0
+
+
+def _require_http2() -> None:
+    try:
+        import h2  # type: ignore  # noqa: F401
+    except ImportError as exc:
+        raise ImportError(
+            "http2=True requires the 'h2' package; install oauth-codex[http2]"
+        ) from exc
+
 
 class _BaseClientCommon:
     def __init__(
-        self, *, base_url: str = "", timeout: float = 60.0, max_retries: int = 2
+        self,
+        *,
+        base_url: str = "",
+        timeout: float = 60.0,
+        max_retries: int = 2,
+        max_connections: int | None = DEFAULT_MAX_CONNECTIONS,
+        max_keepalive_connections: int | None = DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry: float | None = DEFAULT_KEEPALIVE_EXPIRY,
+        pool_timeout: float | None = None,
+        http2: bool = False,
+        retry_policy: RetryPolicy | None = None,
+        rate_limiter: RateLimiter | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        json_codec: JSONCodecName = "auto",
     ) -> None:
+        if http2:
+            _require_http2()
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
         self.max_retries = max(0, int(max_retries))
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self.pool_timeout = pool_timeout
+        self.http2 = http2
+        self.retry_policy = retry_policy or RetryPolicy()
+        self._retry_budget = RetryBudget(
+            ratio=self.retry_policy.budget_ratio,
+            capacity=self.retry_policy.budget_capacity,
+        )
+        self.rate_limiter = rate_limiter
+        self.circuit_breaker = circuit_breaker
+        self.json_codec = get_codec(json_codec)
         self._exceptions_module: Any | None = None
 
+    def encode_json(self, json_data: Any) -> bytes:
+        return encode_body(self.json_codec, json_data)
+
+    def _json_request_body(
+        self,
+        headers: Mapping[str, str] | None,
+        json_data: Any,
+        encoded_json: bytes | None,
+    ) -> tuple[Mapping[str, str] | None, bytes | None]:
+        if encoded_json is None and json_data is None:
+            return headers, None
+        if encoded_json is None:
+            encoded_json = self.encode_json(json_data)
+        return {"Content-Type": "application/json", **(headers or {})}, encoded_json
+
+    def _build_timeout(self, timeout: float) -> httpx.Timeout:
+        pool = timeout if self.pool_timeout is None else self.pool_timeout
+        return httpx.Timeout(timeout, pool=pool)
+
     def _resolve_url(self, path: str) -> str:
         if path.startswith(("http://", "https://")):
             return path
@@ -25,12 +91,47 @@ class _BaseClientCommon:
         return f"{self.base_url}{normalized_path}" if self.base_url else normalized_path
 
     def _should_retry_status(self, status_code: int) -> bool:
-        return status_code in {408, 409, 429} or status_code >= 500
+        return self.retry_policy.should_retry_status(status_code)
+
+    def _retry_delay_seconds(
+        self, attempt: int, response: httpx.Response | None = None
+    ) -> float:
+        return self.retry_policy.delay_seconds(attempt, response)
 
-    def _retry_delay_seconds(self, attempt: int) -> float:
-        base = min(0.5 * (2**attempt), 8.0)
-        jitter = random.uniform(0.0, 0.25)
-        return base + jitter
+    def _next_retry_delay(
+        self,
+        attempt: int,
+        slept: float,
+        response: httpx.Response | None = None,
+        circuit_key: str | None = None,
+    ) -> float | None:
+        if attempt >= self.max_retries:
+            return None
+        if (
+            circuit_key is not None
+            and self.circuit_breaker is not None
+            and not self.circuit_breaker.is_closed(circuit_key)
+        ):
+            return None
+        if response is not None and not self.retry_policy.should_retry_response(response):
+            return None
+        delay = self._retry_delay_seconds(attempt, response)
+        if slept + delay > self.retry_policy.max_total_sleep:
+            return None
+        if not self._retry_budget.try_spend():
+            return None
+        return delay
+
+    def _before_circuit(self, key: str) -> None:
+        assert self.circuit_breaker is not None
+        self.circuit_breaker.before_request(key)
+
+    def _record_circuit(self, key: str, *, failed: bool) -> None:
+        assert self.circuit_breaker is not None
+        if failed:
+            self.circuit_breaker.record_failure(key)
+        else:
+            self.circuit_breaker.record_success(key)
 
     def _exceptions(self) -> Any:
         if self._exceptions_module is not None:
@@ -102,6 +203,11 @@ class _BaseClientCommon:
         timeout_cls = getattr(exceptions, "APITimeoutError", None)
         connection_cls = getattr(exceptions, "APIConnectionError", Exception)
 
+        if isinstance(error, httpx.PoolTimeout):
+            pool_timeout_cls = getattr(exceptions, "APIPoolTimeoutError", None)
+            if pool_timeout_cls is not None:
+                timeout_cls = pool_timeout_cls
+
         if isinstance(error, httpx.TimeoutException) and timeout_cls is not None:
             try:
                 return timeout_cls(error.request)
@@ -128,9 +234,40 @@ class SyncAPIClient(_BaseClientCommon):
         timeout: float = 60.0,
         max_retries: int = 2,
         http_client: httpx.Client | None = None,
+        max_connections: int | None = DEFAULT_MAX_CONNECTIONS,
+        max_keepalive_connections: int | None = DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry: float | None = DEFAULT_KEEPALIVE_EXPIRY,
+        pool_timeout: float | None = None,
+        http2: bool = False,
+        retry_policy: RetryPolicy | None = None,
+        rate_limiter: RateLimiter | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        json_codec: JSONCodecName = "auto",
     ) -> None:
-        super().__init__(base_url=base_url, timeout=timeout, max_retries=max_retries)
-        self._client = http_client or httpx.Client(timeout=timeout)
+        if http2 and http_client is not None:
+            raise ValueError(
+                "http2=True has no effect on an injected http_client; "
+                "create it with http2=True instead"
+            )
+        super().__init__(
+            base_url=base_url,
+            timeout=timeout,
+            max_retries=max_retries,
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+            pool_timeout=pool_timeout,
+            http2=http2,
+            retry_policy=retry_policy,
+            rate_limiter=rate_limiter,
+            circuit_breaker=circuit_breaker,
+            json_codec=json_codec,
+        )
+        self._client = http_client or httpx.Client(
+            timeout=self._build_timeout(timeout),
+            limits=self.limits,
+            http2=self.http2,
+        )
         self._owns_http_client = http_client is None
 
     def request(
@@ -141,6 +278,7 @@ class SyncAPIClient(_BaseClientCommon):
         params: Mapping[str, Any] | None = None,
         headers: Mapping[str, str] | None = None,
         json_data: Any = None,
+        encoded_json: bytes | None = None,
         data: Any = None,
         files: Any = None,
         timeout: float | None = None,
@@ -151,11 +289,34 @@ class SyncAPIClient(_BaseClientCommon):
             params=params,
             headers=headers,
             json_data=json_data,
+            encoded_json=encoded_json,
             data=data,
             files=files,
             timeout=timeout,
         )
 
+    def stream_request(
+        self,
+        method: str,
+        path: str,
+        *,
+        params: Mapping[str, Any] | None = None,
+        headers: Mapping[str, str] | None = None,
+        json_data: Any = None,
+        encoded_json: bytes | None = None,
+        timeout: float | None = None,
+    ) -> httpx.Response:
+        return self._request(
+            method,
+            path,
+            params=params,
+            headers=headers,
+            json_data=json_data,
+            encoded_json=encoded_json,
+            timeout=timeout,
+            stream=True,
+        )
+
     def _request(
         self,
         method: str,
@@ -164,39 +325,74 @@ class SyncAPIClient(_BaseClientCommon):
         params: Mapping[str, Any] | None = None,
         headers: Mapping[str, str] | None = None,
         json_data: Any = None,
+        encoded_json: bytes | None = None,
         data: Any = None,
         files: Any = None,
         timeout: float | None = None,
+        stream: bool = False,
     ) -> httpx.Response:
         url = self._resolve_url(path)
         request_timeout = self.timeout if timeout is None else timeout
+        # Encoded once and reused by every retry attempt.
+        headers, content = self._json_request_body(headers, json_data, encoded_json)
 
+        slept = 0.0
+        self._retry_budget.record_request()
+        token_cost = estimate_request_tokens(json_data) if self.rate_limiter else 0
+        circuit_key = endpoint_key(method, path) if self.circuit_breaker else None
         for attempt in range(self.max_retries + 1):
+            if circuit_key is not None:
+                self._before_circuit(circuit_key)
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire(token_cost)
             try:
-                response = self._client.request(
+                request = self._client.build_request(
                     method=method.upper(),
                     url=url,
                     params=params,
                     headers=headers,
-                    json=json_data,
+                    content=content,
                     data=data,
                     files=files,
-                    timeout=request_timeout,
+                    timeout=self._build_timeout(request_timeout),
                 )
+                response = self._client.send(request, stream=stream)
             except httpx.RequestError as exc:
-                if attempt < self.max_retries:
-                    time.sleep(self._retry_delay_seconds(attempt))
+                if circuit_key is not None and not isinstance(exc, httpx.PoolTimeout):
+                    self._record_circuit(circuit_key, failed=True)
+                # Waiting on a saturated local pool again only adds latency.
+                delay = None
+                if not isinstance(exc, httpx.PoolTimeout):
+                    delay = self._next_retry_delay(
+                        attempt, slept, circuit_key=circuit_key
+                    )
+                if delay is not None:
+                    time.sleep(delay)
+                    slept += delay
                     continue
                 raise self._build_connection_error(exc) from exc
 
-            if (
-                self._should_retry_status(response.status_code)
-                and attempt < self.max_retries
-            ):
-                time.sleep(self._retry_delay_seconds(attempt))
-                continue
+            if self.rate_limiter is not None:
+                self.rate_limiter.update_from_headers(response.headers)
+            if circuit_key is not None:
+                self._record_circuit(circuit_key, failed=response.status_code >= 500)
 
             if response.status_code >= 400:
+                delay = self._next_retry_delay(
+                    attempt, slept, response, circuit_key
+                )
+                if delay is not None:
+                    response.close()
+                    time.sleep(delay)
+                    slept += delay
+                    continue
+
+            if response.status_code >= 400:
+                if stream:
+                    try:
+                        response.read()
+                    finally:
+                        response.close()
                 raise self._build_status_error(response)
 
             return response
@@ -222,9 +418,40 @@ class AsyncAPIClient(_BaseClientCommon):
         timeout: float = 60.0,
         max_retries: int = 2,
         http_client: httpx.AsyncClient | None = None,
+        max_connections: int | None = DEFAULT_MAX_CONNECTIONS,
+        max_keepalive_connections: int | None = DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry: float | None = DEFAULT_KEEPALIVE_EXPIRY,
+        pool_timeout: float | None = None,
+        http2: bool = False,
+        retry_policy: RetryPolicy | None = None,
+        rate_limiter: RateLimiter | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        json_codec: JSONCodecName = "auto",
     ) -> None:
-        super().__init__(base_url=base_url, timeout=timeout, max_retries=max_retries)
-        self._client = http_client or httpx.AsyncClient(timeout=timeout)
+        if http2 and http_client is not None:
+            raise ValueError(
+                "http2=True has no effect on an injected http_client; "
+                "create it with http2=True instead"
+            )
+        super().__init__(
+            base_url=base_url,
+            timeout=timeout,
+            max_retries=max_retries,
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+            pool_timeout=pool_timeout,
+            http2=http2,
+            retry_policy=retry_policy,
+            rate_limiter=rate_limiter,
+            circuit_breaker=circuit_breaker,
+            json_codec=json_codec,
+        )
+        self._client = http_client or httpx.AsyncClient(
+            timeout=self._build_timeout(timeout),
+            limits=self.limits,
+            http2=self.http2,
+        )
         self._owns_http_client = http_client is None
 
     async def request(
@@ -235,6 +462,7 @@ class AsyncAPIClient(_BaseClientCommon):
         params: Mapping[str, Any] | None = None,
         headers: Mapping[str, str] | None = None,
         json_data: Any = None,
+        encoded_json: bytes | None = None,
         data: Any = None,
         files: Any = None,
         timeout: float | None = None,
@@ -245,11 +473,34 @@ class AsyncAPIClient(_BaseClientCommon):
             params=params,
             headers=headers,
             json_data=json_data,
+            encoded_json=encoded_json,
             data=data,
             files=files,
             timeout=timeout,
         )
 
+    async def stream_request(
+        self,
+        method: str,
+        path: str,
+        *,
+        params: Mapping[str, Any] | None = None,
+        headers: Mapping[str, str] | None = None,
+        json_data: Any = None,
+        encoded_json: bytes | None = None,
+        timeout: float | None = None,
+    ) -> httpx.Response:
+        return await self._request(
+            method,
+            path,
+            params=params,
+            headers=headers,
+            json_data=json_data,
+            encoded_json=encoded_json,
+            timeout=timeout,
+            stream=True,
+        )
+
     async def _request(
         self,
         method: str,
@@ -258,39 +509,73 @@ class AsyncAPIClient(_BaseClientCommon):
         params: Mapping[str, Any] | None = None,
         headers: Mapping[str, str] | None = None,
         json_data: Any = None,
+        encoded_json: bytes | None = None,
         data: Any = None,
         files: Any = None,
         timeout: float | None = None,
+        stream: bool = False,
     ) -> httpx.Response:
         url = self._resolve_url(path)
         request_timeout = self.timeout if timeout is None else timeout
+        # Encoded once and reused by every retry attempt.
+        headers, content = self._json_request_body(headers, json_data, encoded_json)
 
+        slept = 0.0
+        self._retry_budget.record_request()
+        token_cost = estimate_request_tokens(json_data) if self.rate_limiter else 0
+        circuit_key = endpoint_key(method, path) if self.circuit_breaker else None
         for attempt in range(self.max_retries + 1):
+            if circuit_key is not None:
+                self._before_circuit(circuit_key)
+            if self.rate_limiter is not None:
+                await self.rate_limiter.aacquire(token_cost)
             try:
-                response = await self._client.request(
+                request = self._client.build_request(
                     method=method.upper(),
                     url=url,
                     params=params,
                     headers=headers,
-                    json=json_data,
+                    content=content,
                     data=data,
                     files=files,
-                    timeout=request_timeout,
+                    timeout=self._build_timeout(request_timeout),
                 )
+                response = await self._client.send(request, stream=stream)
             except httpx.RequestError as exc:
-                if attempt < self.max_retries:
-                    await asyncio.sleep(self._retry_delay_seconds(attempt))
+                if circuit_key is not None and not isinstance(exc, httpx.PoolTimeout):
+                    self._record_circuit(circuit_key, failed=True)
+                delay = None
+                if not isinstance(exc, httpx.PoolTimeout):
+                    delay = self._next_retry_delay(
+                        attempt, slept, circuit_key=circuit_key
+                    )
+                if delay is not None:
+                    await asyncio.sleep(delay)
+                    slept += delay
                     continue
                 raise self._build_connection_error(exc) from exc
 
-            if (
-                self._should_retry_status(response.status_code)
-                and attempt < self.max_retries
-            ):
-                await asyncio.sleep(self._retry_delay_seconds(attempt))
-                continue
+            if self.rate_limiter is not None:
+                self.rate_limiter.update_from_headers(response.headers)
+            if circuit_key is not None:
+                self._record_circuit(circuit_key, failed=response.status_code >= 500)
+
+            if response.status_code >= 400:
+                delay = self._next_retry_delay(
+                    attempt, slept, response, circuit_key
+                )
+                if delay is not None:
+                    await response.aclose()
+                    await asyncio.sleep(delay)
+                    slept += delay
+                    continue
 
             if response.status_code >= 400:
+                if stream:
+                    try:
+                        await response.aread()
+                    finally:
+                        await response.aclose()
                 raise self._build_status_error(response)
 
             return response
@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import re
+import threading
+import time
+from dataclasses import dataclass
+from typing import Literal
+from urllib.parse import urlsplit
+
+from ._exceptions import CircuitOpenError
+
+CircuitStateName = Literal["closed", "open", "half_open"]
+
+
+# Object IDs minted by the API (`resp_...`, `file-...`, `vs_...`), all-digit
+# segments, and long opaque tokens such as UUIDs. Model names (`gpt-5`) and
+# version segments (`v1`) are kept so they get circuits of their own.
+_ID_SEGMENT = re.compile(
+    r"(?:resp|file|vs|vsfb|msg|fc|call|batch|chatcmpl|conv|item|run|thread)[_-][A-Za-z0-9_-]+"
+    r"|[0-9]+"
+    r"|(?=[A-Za-z_-]*[0-9])[A-Za-z0-9_-]{20,}"
+)
+
+
+def _template_segment(segment: str) -> str:
+    return "{id}" if _ID_SEGMENT.fullmatch(segment) else segment
+
+
+def endpoint_key(method: str, path: str) -> str:
+    """Return the circuit key for a request, e.g. `GET /vector_stores/{id}/files`."""
+    raw_path = urlsplit(path).path if "://" in path else path.split("?", 1)[0]
+    segments = [_template_segment(segment) for segment in raw_path.strip("/").split("/")]
+    return f"{method.upper()} /{'/'.join(segments)}"
+
+
+@dataclass(frozen=True)
+class CircuitState:
+    key: str
+    state: CircuitStateName
+    consecutive_failures: int
+    opened_at: float | None
+    retry_at: float | None
+
+
+class _Circuit:
+    def __init__(self) -> None:
+        self.state: CircuitStateName = "closed"
+        self.failures = 0
+        self.opened_at: float | None = None
+        self.half_open_since: float | None = None
+        self.probes_in_flight = 0
+
+
+class CircuitBreaker:
+    """Per-endpoint circuit breaker for `Client` / `AsyncClient`.
+
+    Endpoints are keyed by method and path template, with path segments
+    containing digits replaced by `{id}`. After `failure_threshold`
+    consecutive failures (5xx responses or connection errors) the circuit
+    opens and requests fail fast with `CircuitOpenError`. Once
+    `recovery_timeout` seconds have passed, up to `half_open_max_requests`
+    probes are admitted; a successful probe closes the circuit and a failed
+    one reopens it.
+    """
+
+    def __init__(
+        self,
+        *,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30.0,
+        half_open_max_requests: int = 1,
+    ) -> None:
+        self.failure_threshold = max(1, failure_threshold)
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_requests = max(1, half_open_max_requests)
+        self._circuits: dict[str, _Circuit] = {}
+        self._lock = threading.Lock()
+
+    def before_request(self, key: str) -> None:
+        now = time.time()
+        with self._lock:
+            circuit = self._circuits.get(key)
+            if circuit is None or circuit.state == "closed":
+                return
+            assert circuit.opened_at is not None
+            retry_at = circuit.opened_at + self.recovery_timeout
+            if circuit.state == "open":
+                if now < retry_at:
+                    raise CircuitOpenError(key, retry_at=retry_at)
+                circuit.state = "half_open"
+                circuit.half_open_since = now
+                circuit.probes_in_flight = 0
+            assert circuit.half_open_since is not None
+            if circuit.probes_in_flight >= self.half_open_max_requests:
+                # Probes that never reported back (e.g. cancelled) expire.
+                if now - circuit.half_open_since < self.recovery_timeout:
+                    raise CircuitOpenError(key, retry_at=retry_at)
+                circuit.half_open_since = now
+                circuit.probes_in_flight = 0
+            circuit.probes_in_flight += 1
+
+    def record_success(self, key: str) -> None:
+        if key not in self._circuits:
+            return
+        with self._lock:
+            self._circuits.pop(key, None)
+
+    def record_failure(self, key: str) -> None:
+        now = time.time()
+        with self._lock:
+            circuit = self._circuits.setdefault(key, _Circuit())
+            circuit.failures += 1
+            if circuit.state == "half_open" or circuit.failures >= self.failure_threshold:
+                circuit.state = "open"
+                circuit.opened_at = now
+                circuit.probes_in_flight = 0
+
+    def is_closed(self, key: str) -> bool:
+        circuit = self._circuits.get(key)
+        return circuit is None or circuit.state == "closed"
+
+    def state(self, method: str, path: str) -> CircuitStateName:
+        return self._snapshot_one(endpoint_key(method, path)).state
+
+    def snapshot(self) -> dict[str, CircuitState]:
+        with self._lock:
+            keys = list(self._circuits)
+        return {key: self._snapshot_one(key) for key in keys}
+
+    def reset(self) -> None:
+        with self._lock:
+            self._circuits.clear()
+
+    def _snapshot_one(self, key: str) -> CircuitState:
+        with self._lock:
+            circuit = self._circuits.get(key) or _Circuit()
+            state = circuit.state
+            retry_at = None
+            if circuit.opened_at is not None and state != "closed":
+                retry_at = circuit.opened_at + self.recovery_timeout
+                if state == "open" and time.time() >= retry_at:
+                    state = "half_open"
+            return CircuitState(
+                key=key,
+                state=state,
+                consecutive_failures=circuit.failures,
+                opened_at=circuit.opened_at,
+                retry_at=retry_at,
+            )
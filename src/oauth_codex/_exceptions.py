@@ -92,6 +92,31 @@ class APITimeoutError(APIConnectionError):
         super().__init__(message="Request timed out.", request=request)
 
 
+class APIPoolTimeoutError(APITimeoutError):
+    """Timed out waiting for a free connection in the client's connection pool."""
+
+    def __init__(self, request: httpx.Request | None = None) -> None:
+        APIConnectionError.__init__(
+            self,
+            message="Timed out waiting for a connection from the pool.",
+            request=request,
+        )
+
+
+class CircuitOpenError(APIError):
+    """Request rejected locally because the endpoint's circuit breaker is open.
+
+    Attributes:
+        key: Circuit key in the form `"METHOD /path/{id}"`.
+        retry_at: Unix time after which probe requests are admitted again.
+    """
+
+    def __init__(self, key: str, *, retry_at: float) -> None:
+        super().__init__(f"Circuit open for {key}; failing fast.", None, body=None)
+        self.key = key
+        self.retry_at = retry_at
+
+
 class BadRequestError(APIStatusError):
     """HTTP 400 response from the API."""
 
@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from collections import deque
+from collections.abc import Awaitable, Callable
+from typing import TypeVar
+
+from ._retry import RetryBudget
+
+T = TypeVar("T")
+
+
+class HedgePolicy:
+    """When `AsyncClient` sends a duplicate ("hedge") of a slow request.
+
+    The hedge delay is the `percentile` of recently observed latencies
+    (time to response, or to the first event of a stream), clamped to
+    `[min_delay, max_delay]`; `initial_delay` is used until `min_samples`
+    latencies are known. Hedges draw from their own budget: each request
+    deposits `budget_ratio` tokens (up to `budget_capacity`) and each hedge
+    spends one, so hedging adds at most that fraction of extra load.
+    Only requests that are safe to duplicate (`store=False`) are hedged.
+    """
+
+    def __init__(
+        self,
+        *,
+        percentile: float = 0.95,
+        initial_delay: float = 2.0,
+        min_delay: float = 0.05,
+        max_delay: float = 30.0,
+        window_size: int = 200,
+        min_samples: int = 20,
+        budget_ratio: float = 0.05,
+        budget_capacity: float = 5.0,
+    ) -> None:
+        if not 0.0 < percentile < 1.0:
+            raise ValueError("percentile must be between 0 and 1")
+        self.percentile = percentile
+        self.initial_delay = initial_delay
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.min_samples = max(1, min_samples)
+        self._latencies: deque[float] = deque(maxlen=max(1, window_size))
+        self._lock = threading.Lock()
+        self._budget = RetryBudget(ratio=budget_ratio, capacity=budget_capacity)
+
+    def delay(self) -> float:
+        with self._lock:
+            if len(self._latencies) < self.min_samples:
+                delay = self.initial_delay
+            else:
+                ordered = sorted(self._latencies)
+                index = min(len(ordered) - 1, int(self.percentile * len(ordered)))
+                delay = ordered[index]
+        return min(self.max_delay, max(self.min_delay, delay))
+
+    def record_latency(self, seconds: float) -> None:
+        with self._lock:
+            self._latencies.append(seconds)
+
+
+async def hedged(
+    policy: HedgePolicy,
+    attempt: Callable[[], Awaitable[T]],
+    release: Callable[[T], Awaitable[None]],
+) -> T:
+    """Run `attempt`, racing a second copy if the first is slower than the hedge delay.
+
+    The first successful result wins. The loser is cancelled, and `release`
+    is called on its result if it had already completed.
+    """
+    loop = asyncio.get_running_loop()
+    policy._budget.record_request()
+
+    # Latency is measured from the primary's start, so a winning hedge still
+    # reports the delay spent waiting before it was sent.
+    started = loop.time()
+    primary = asyncio.ensure_future(attempt())
+    pending: set[asyncio.Future[T]] = {primary}
+    try:
+        done, _ = await asyncio.wait(pending, timeout=policy.delay())
+        if not done and policy._budget.try_spend():
+            pending.add(asyncio.ensure_future(attempt()))
+
+        error: BaseException | None = None
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.exception() is None:
+                    result = task.result()
+                    policy.record_latency(loop.time() - started)
+                    for other in done - {task}:
+                        if other.exception() is None:
+                            await release(other.result())
+                    return result
+                error = task.exception()
+        assert error is not None
+        raise error
+    finally:
+        for task in pending:
+            task.cancel()
+        for task in pending:
+            try:
+                loser = await task
+            except BaseException:
+                continue
+            await release(loser)
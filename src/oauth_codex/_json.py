@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import json
+from math import isfinite
+from typing import Any, Callable, Literal
+
+from .tooling import _ToolSetSchemas
+
+JSONCodecName = Literal["auto", "stdlib", "orjson", "msgspec"]
+
+
+class JSONCodec:
+    name = "stdlib"
+
+    def dumps(self, value: Any) -> bytes:
+        # Same output as httpx's `json=`: compact, UTF-8, no NaN.
+        return json.dumps(
+            value, ensure_ascii=False, separators=(",", ":"), allow_nan=False
+        ).encode("utf-8")
+
+    def loads(self, data: bytes | str) -> Any:
+        return json.loads(data)
+
+
+def _has_non_finite(value: Any) -> bool:
+    stack = [value]
+    while stack:
+        item = stack.pop()
+        kind = type(item)
+        if kind is str or kind is int or kind is bool or item is None:
+            continue
+        if kind is float or isinstance(item, float):
+            if not isfinite(item):
+                return True
+        elif isinstance(item, dict):
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple)):
+            stack.extend(item)
+    return False
+
+
+def _reject_non_finite(codec: JSONCodec, value: Any, encoded: bytes) -> bytes:
+    # orjson and msgspec write NaN/Infinity as `null`. Only walk the value when
+    # the output has one, and let the stdlib encoder raise like `allow_nan=False`.
+    if b"null" in encoded and _has_non_finite(value):
+        return JSONCodec.dumps(codec, value)
+    return encoded
+
+
+class _OrjsonCodec(JSONCodec):
+    name = "orjson"
+
+    def __init__(self) -> None:
+        import orjson
+
+        self._dumps: Callable[[Any], bytes] = orjson.dumps
+        self._loads: Callable[[bytes | str], Any] = orjson.loads
+
+    def dumps(self, value: Any) -> bytes:
+        try:
+            encoded = self._dumps(value)
+        except TypeError:
+            # e.g. integers beyond 64 bits; the stdlib encoder handles them.
+            return super().dumps(value)
+        return _reject_non_finite(self, value, encoded)
+
+    def loads(self, data: bytes | str) -> Any:
+        return self._loads(data)
+
+
+class _MsgspecCodec(JSONCodec):
+    name = "msgspec"
+
+    def __init__(self) -> None:
+        import msgspec
+
+        self._encoder = msgspec.json.Encoder()
+        self._decoder = msgspec.json.Decoder()
+        self._encode_error: type[Exception] = msgspec.EncodeError
+
+    def dumps(self, value: Any) -> bytes:
+        try:
+            encoded = self._encoder.encode(value)
+        except (TypeError, OverflowError, self._encode_error):
+            return super().dumps(value)
+        return _reject_non_finite(self, value, encoded)
+
+    def loads(self, data: bytes | str) -> Any:
+        return self._decoder.decode(data)
+
+
+_CODECS: dict[str, type[JSONCodec]] = {
+    "stdlib": JSONCodec,
+    "orjson": _OrjsonCodec,
+    "msgspec": _MsgspecCodec,
+}
+
+
+def get_codec(name: JSONCodecName | str = "auto") -> JSONCodec:
+    if name == "auto":
+        for candidate in ("orjson", "msgspec"):
+            try:
+                return _CODECS[candidate]()
+            except ImportError:
+                continue
+        return JSONCodec()
+    codec_type = _CODECS.get(name)
+    if codec_type is None:
+        raise ValueError(
+            f"Unknown json_codec {name!r}; expected one of auto, stdlib, orjson, msgspec"
+        )
+    try:
+        return codec_type()
+    except ImportError as exc:
+        raise ImportError(
+            f"json_codec={name!r} requires the {name!r} package; "
+            f"install oauth-codex[{name}]"
+        ) from exc
+
+
+def encode_body(codec: JSONCodec, value: Any) -> bytes:
+    """Encode a request body, splicing in a `ToolSet`'s pre-encoded tools array."""
+    tools = value.get("tools") if isinstance(value, dict) else None
+    if not isinstance(tools, _ToolSetSchemas):
+        return codec.dumps(value)
+    tools_json = tools.encoded_by_codec.get(codec.name)
+    if tools_json is None:
+        tools_json = tools.encoded_by_codec[codec.name] = codec.dumps(tools)
+    head = codec.dumps({key: item for key, item in value.items() if key != "tools"})
+    separator = b"" if head == b"{}" else b","
+    return head[:-1] + separator + b'"tools":' + tools_json + b"}"
@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import asyncio
+import math
+import threading
+import time
+from typing import Any, Mapping
+
+from ._retry import _parse_duration
+
+# Rough characters-per-token ratio used to size requests before sending them.
+_CHARS_PER_TOKEN = 4
+
+
+def _text_length(value: Any) -> int:
+    if isinstance(value, str):
+        return len(value)
+    if isinstance(value, Mapping):
+        return sum(_text_length(item) for item in value.values())
+    if isinstance(value, (list, tuple)):
+        return sum(_text_length(item) for item in value)
+    return 0
+
+
+def estimate_request_tokens(json_data: Any) -> int:
+    """Estimate the tokens a request counts against a tokens-per-minute limit."""
+    if not isinstance(json_data, Mapping) or "input" not in json_data:
+        return 0
+    chars = _text_length(json_data.get("input")) + _text_length(json_data.get("instructions"))
+    output_tokens = json_data.get("max_output_tokens") or 0
+    if not isinstance(output_tokens, int):
+        output_tokens = 0
+    return math.ceil(chars / _CHARS_PER_TOKEN) + output_tokens
+
+
+class _Bucket:
+    def __init__(self, limit_per_minute: float | None) -> None:
+        self.configured_limit = limit_per_minute
+        self.limit = limit_per_minute
+        self.level = float(limit_per_minute or 0.0)
+        self.updated_at = time.monotonic()
+
+    def _refill(self, now: float) -> None:
+        if self.limit is None:
+            return
+        elapsed = max(0.0, now - self.updated_at)
+        self.level = min(self.limit, self.level + elapsed * self.limit / 60.0)
+        self.updated_at = now
+
+    def reserve(self, cost: float, now: float) -> float:
+        if self.limit is None or cost <= 0:
+            return 0.0
+        self._refill(now)
+        self.level -= cost
+        if self.level >= 0:
+            return 0.0
+        return -self.level * 60.0 / self.limit
+
+    def refund(self, cost: float, now: float) -> None:
+        if self.limit is None or cost <= 0:
+            return
+        self._refill(now)
+        self.level = min(self.limit, self.level + cost)
+
+    def learn(self, limit: float | None, remaining: float | None, reset: float | None, now: float) -> None:
+        if limit is not None and limit > 0:
+            if self.configured_limit is not None:
+                limit = min(limit, self.configured_limit)
+            if self.limit is None:
+                self.level = limit
+                self.updated_at = now
+            self.limit = limit
+        if self.limit is None or remaining is None:
+            return
+        self._refill(now)
+        # The server's view also counts in-flight work from other clients.
+        if remaining < self.level:
+            self.level = remaining
+            if remaining <= 0 and reset:
+                self.level = -reset * self.limit / 60.0
+
+
+class RateLimiter:
+    """Client-side pacing of requests and estimated tokens per minute.
+
+    Callers reserve capacity in arrival order and sleep until their
+    reservation is covered, so traffic is spread out instead of firing and
+    retrying after a `429`. Limits are learned from `x-ratelimit-*` response
+    headers when `learn_from_headers` is enabled; configured limits act as
+    an upper bound. One limiter may be shared by several clients.
+    """
+
+    def __init__(
+        self,
+        *,
+        requests_per_minute: float | None = None,
+        tokens_per_minute: float | None = None,
+        learn_from_headers: bool = True,
+    ) -> None:
+        self._requests = _Bucket(requests_per_minute)
+        self._tokens = _Bucket(tokens_per_minute)
+        self.learn_from_headers = learn_from_headers
+        self._lock = threading.Lock()
+
+    @property
+    def requests_per_minute(self) -> float | None:
+        return self._requests.limit
+
+    @property
+    def tokens_per_minute(self) -> float | None:
+        return self._tokens.limit
+
+    def acquire(self, tokens: int = 0) -> None:
+        delay = self._reserve(tokens)
+        if delay > 0:
+            time.sleep(delay)
+
+    async def aacquire(self, tokens: int = 0) -> None:
+        delay = self._reserve(tokens)
+        if delay <= 0:
+            return
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            self._refund(tokens)
+            raise
+
+    def update_from_headers(self, headers: Mapping[str, str]) -> None:
+        if not self.learn_from_headers:
+            return
+        now = time.monotonic()
+        with self._lock:
+            for kind, bucket in (("requests", self._requests), ("tokens", self._tokens)):
+                limit = _header_number(headers.get(f"x-ratelimit-limit-{kind}"))
+                remaining = _header_number(headers.get(f"x-ratelimit-remaining-{kind}"))
+                raw_reset = headers.get(f"x-ratelimit-reset-{kind}")
+                reset = _parse_duration(raw_reset) if raw_reset is not None else None
+                bucket.learn(limit, remaining, reset, now)
+
+    def _reserve(self, tokens: int) -> float:
+        now = time.monotonic()
+        with self._lock:
+            return max(self._requests.reserve(1, now), self._tokens.reserve(tokens, now))
+
+    def _refund(self, tokens: int) -> None:
+        now = time.monotonic()
+        with self._lock:
+            self._requests.refund(1, now)
+            self._tokens.refund(tokens, now)
+
+
+def _header_number(value: str | None) -> float | None:
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return None
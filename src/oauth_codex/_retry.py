@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import random
+import re
+import threading
+import time
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+
+import httpx
+
+_DURATION_PART = re.compile(r"(\d+(?:\.\d+)?)(ms|h|m|s)")
+_DURATION_UNITS = {"h": 3600.0, "m": 60.0, "s": 1.0, "ms": 0.001}
+
+
+def _parse_duration(value: str) -> float | None:
+    """Parse `x-ratelimit-reset-*` values such as `1s`, `6m0s` or `250ms`."""
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    position = 0
+    total = 0.0
+    for match in _DURATION_PART.finditer(value):
+        if match.start() != position:
+            return None
+        total += float(match.group(1)) * _DURATION_UNITS[match.group(2)]
+        position = match.end()
+    if position == 0 or position != len(value):
+        return None
+    return total
+
+
+def _parse_retry_after(value: str) -> float | None:
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at - time.time())
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """How `Client` / `AsyncClient` retry failed requests.
+
+    Server hints (`retry-after-ms`, `retry-after`, `x-ratelimit-reset-*`)
+    take precedence over exponential backoff. A request stops retrying once
+    its cumulative sleep would exceed `max_total_sleep`. Each client also
+    keeps a retry budget: every request deposits `budget_ratio` tokens, every
+    retry spends one, and at most `budget_capacity` tokens are held, so a
+    backend outage cannot multiply traffic by `max_retries + 1`.
+    """
+
+    retry_statuses: frozenset[int] = frozenset({408, 409, 429})
+    retry_server_errors: bool = True
+    initial_delay: float = 0.5
+    max_delay: float = 8.0
+    jitter: float = 0.25
+    max_total_sleep: float = 60.0
+    budget_ratio: float = 0.2
+    budget_capacity: float = 10.0
+
+    def should_retry_status(self, status_code: int) -> bool:
+        if status_code in self.retry_statuses:
+            return True
+        return self.retry_server_errors and status_code >= 500
+
+    def should_retry_response(self, response: httpx.Response) -> bool:
+        should_retry = response.headers.get("x-should-retry")
+        if should_retry == "true":
+            return True
+        if should_retry == "false":
+            return False
+        return self.should_retry_status(response.status_code)
+
+    def backoff_seconds(self, attempt: int) -> float:
+        base = min(self.initial_delay * (2**attempt), self.max_delay)
+        return base + random.uniform(0.0, self.jitter)
+
+    def server_delay_seconds(self, response: httpx.Response) -> float | None:
+        headers = response.headers
+        retry_after_ms = headers.get("retry-after-ms")
+        if retry_after_ms is not None:
+            try:
+                return max(0.0, float(retry_after_ms) / 1000.0)
+            except ValueError:
+                pass
+        retry_after = headers.get("retry-after")
+        if retry_after is not None:
+            delay = _parse_retry_after(retry_after)
+            if delay is not None:
+                return delay
+
+        resets: dict[str, float] = {}
+        for kind in ("requests", "tokens"):
+            raw = headers.get(f"x-ratelimit-reset-{kind}")
+            delay = _parse_duration(raw) if raw is not None else None
+            if delay is not None:
+                resets[kind] = delay
+        if not resets:
+            return None
+        exhausted = [
+            delay
+            for kind, delay in resets.items()
+            if headers.get(f"x-ratelimit-remaining-{kind}", "").strip() == "0"
+        ]
+        return max(exhausted) if exhausted else min(resets.values())
+
+    def delay_seconds(self, attempt: int, response: httpx.Response | None = None) -> float:
+        if response is not None:
+            server_delay = self.server_delay_seconds(response)
+            if server_delay is not None:
+                return server_delay
+        return self.backoff_seconds(attempt)
+
+
+class RetryBudget:
+    def __init__(self, *, ratio: float, capacity: float) -> None:
+        self._ratio = max(0.0, ratio)
+        self._capacity = max(0.0, capacity)
+        self._tokens = self._capacity
+        self._lock = threading.Lock()
+
+    @property
+    def available(self) -> float:
+        return self._tokens
+
+    def record_request(self) -> None:
+        with self._lock:
+            self._tokens = min(self._capacity, self._tokens + self._ratio)
+
+    def try_spend(self) -> bool:
+        with self._lock:
+            if self._tokens < 1.0:
+                return False
+            self._tokens -= 1.0
+            return True
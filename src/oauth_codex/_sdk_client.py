@@ -1,7 +1,7 @@
 from __future__ import annotations
 
-from collections.abc import AsyncIterator, Iterator, Mapping
-from typing import Any, cast
+from collections.abc import AsyncGenerator, AsyncIterator, Iterator, Mapping
+from typing import Any, NamedTuple, cast
 
 import httpx
 
@@ -12,13 +12,33 @@ from .resources.models import AsyncModels, Models
 from .resources.responses import AsyncResponses, Responses
 from .resources.vector_stores import AsyncVectorStores, VectorStores
 
-from ._base_client import AsyncAPIClient, SyncAPIClient
+from ._base_client import (
+    DEFAULT_KEEPALIVE_EXPIRY,
+    DEFAULT_MAX_CONNECTIONS,
+    DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+    AsyncAPIClient,
+    SyncAPIClient,
+)
+from ._circuit_breaker import CircuitBreaker
+from ._exceptions import AuthenticationError
+from ._hedging import HedgePolicy, hedged
+from ._json import JSONCodecName
+from ._rate_limit import RateLimiter
+from ._retry import RetryPolicy
+from ._token_estimate import TokenEstimator
+from ._streaming import aiter_sse_payloads, iter_sse_payloads
 from .auth._oauth import OAuthProvider
 from .auth._provider import AsyncAuthProvider, Headers, SyncAuthProvider
 from .auth.config import OAuthConfig
+from .auth.token_manager import DiscoveryCache
+from .cache import LRUResponseCache, ResponseCache, response_cache_key
 from .core_types import TokenStore
 
 DEFAULT_BASE_URL = "https://chatgpt.com/backend-api/codex"
+INPUT_TOKEN_COUNT_CACHE_SIZE = 4096
+# Server-side tokenization and tool accounting can change between releases, so
+# remembered counts expire instead of living for the whole process.
+INPUT_TOKEN_COUNT_CACHE_TTL_SECONDS = 600.0
 
 
 def _with_auth_headers(
@@ -32,68 +52,256 @@ def _with_auth_headers(
     if auth_headers:
         merged.update(auth_headers)
     return merged
+
+
 def _payload_without_none(values: dict[str, Any]) -> dict[str, Any]:
     payload = {k: v for k, v in values.items() if v is not None}
     payload.pop("self", None)
     return payload
 
 
+def _response_cache_key(
+    response_cache: ResponseCache | None, payload: dict[str, Any], cache: bool | None
+) -> str | None:
+    if response_cache is None or cache is False:
+        return None
+    return response_cache_key(payload)
+
+
+def _is_cacheable_response(body: Any) -> bool:
+    return (
+        isinstance(body, dict)
+        and not body.get("error")
+        and body.get("status") in (None, "completed")
+    )
+
+
 class _SyncEngine:
     def __init__(self, client: Client) -> None:
         self._client = client
+        self._input_token_counts = LRUResponseCache(
+            max_entries=INPUT_TOKEN_COUNT_CACHE_SIZE,
+            ttl_seconds=INPUT_TOKEN_COUNT_CACHE_TTL_SECONDS,
+        )
+        self._token_estimator = TokenEstimator()
 
     def responses_create(self, **kwargs: Any) -> Any:
+        cache = kwargs.pop("cache", None)
         payload = _payload_without_none(kwargs)
         if payload.get("stream"):
             return self._stream_responses(payload)
 
+        response_cache = self._client.response_cache
+        cache_key = _response_cache_key(response_cache, payload, cache)
+        if cache_key is not None:
+            cached = response_cache.get(cache_key)
+            if cached is not None:
+                return self._client.json_codec.loads(cached)
+
         response = self._client.request("POST", "/responses", json_data=payload)
-        return response.json()
+        body = self._client.json_codec.loads(response.content)
+        self._token_estimator.observe_usage(payload, body)
+        if cache_key is not None and _is_cacheable_response(body):
+            response_cache.set(cache_key, response.content)
+        return body
 
     def responses_input_tokens_count(self, **kwargs: Any) -> Any:
+        cache = kwargs.pop("cache", True)
         payload = _payload_without_none(kwargs)
+        cache_key = response_cache_key(payload) if cache else None
+        if cache_key is not None:
+            cached = self._input_token_counts.get(cache_key)
+            if cached is not None:
+                return self._client.json_codec.loads(cached)
+
         response = self._client.request(
             "POST", "/responses/input_tokens", json_data=payload
         )
-        return response.json()
+        if cache_key is not None:
+            self._input_token_counts.set(cache_key, response.content)
+        body = self._client.json_codec.loads(response.content)
+        self._observe_count(payload, body)
+        return body
+
+    def _observe_count(self, payload: dict[str, Any], body: Any) -> None:
+        actual = body.get("input_tokens") if isinstance(body, dict) else None
+        if isinstance(actual, int):
+            self._token_estimator.observe(
+                input=payload.get("input"),
+                actual_tokens=actual,
+                model=payload.get("model"),
+                tools=payload.get("tools"),
+            )
+
+    def estimate_input_tokens(self, **kwargs: Any) -> int:
+        return self._token_estimator.estimate(**kwargs)
+
+    def calibrate_input_tokens(self, **kwargs: Any) -> None:
+        self._token_estimator.observe(**kwargs)
 
     def _stream_responses(self, payload: dict[str, Any]) -> Iterator[Any]:
         payload = dict(payload)
         payload["stream"] = True
-        response = self._client.request("POST", "/responses", json_data=payload)
-        events = response.json()
-        if isinstance(events, list):
-            for event in events:
-                yield event
+        response = self._client.stream_request(
+            "POST",
+            "/responses",
+            headers={"Accept": "text/event-stream"},
+            json_data=payload,
+        )
+        try:
+            yield from iter_sse_payloads(response, loads=self._client.json_codec.loads)
+        finally:
+            response.close()
 
 
 class _AsyncEngine:
     def __init__(self, client: AsyncClient) -> None:
         self._client = client
+        self._input_token_counts = LRUResponseCache(
+            max_entries=INPUT_TOKEN_COUNT_CACHE_SIZE,
+            ttl_seconds=INPUT_TOKEN_COUNT_CACHE_TTL_SECONDS,
+        )
+        self._token_estimator = TokenEstimator()
 
     async def aresponses_create(self, **kwargs: Any) -> Any:
+        cache = kwargs.pop("cache", None)
         payload = _payload_without_none(kwargs)
         if payload.get("stream"):
             return self._stream_responses(payload)
 
-        response = await self._client.request("POST", "/responses", json_data=payload)
-        return response.json()
+        response_cache = self._client.response_cache
+        cache_key = _response_cache_key(response_cache, payload, cache)
+        if cache_key is not None:
+            cached = response_cache.get(cache_key)
+            if cached is not None:
+                return self._client.json_codec.loads(cached)
+
+        hedge_policy = self._client.hedge_policy
+        if hedge_policy is not None and payload.get("store") is False:
+            # Both hedged attempts send the same encoded body.
+            body_bytes = self._client.encode_json(payload)
+            response = await hedged(
+                hedge_policy,
+                lambda: self._client.request(
+                    "POST", "/responses", json_data=payload, encoded_json=body_bytes
+                ),
+                _release_response,
+            )
+        else:
+            response = await self._client.request(
+                "POST", "/responses", json_data=payload
+            )
+        body = self._client.json_codec.loads(response.content)
+        self._token_estimator.observe_usage(payload, body)
+        if cache_key is not None and _is_cacheable_response(body):
+            response_cache.set(cache_key, response.content)
+        return body
 
     async def aresponses_input_tokens_count(self, **kwargs: Any) -> Any:
+        cache = kwargs.pop("cache", True)
         payload = _payload_without_none(kwargs)
+        cache_key = response_cache_key(payload) if cache else None
+        if cache_key is not None:
+            cached = self._input_token_counts.get(cache_key)
+            if cached is not None:
+                return self._client.json_codec.loads(cached)
+
         response = await self._client.request(
             "POST", "/responses/input_tokens", json_data=payload
         )
-        return response.json()
+        if cache_key is not None:
+            self._input_token_counts.set(cache_key, response.content)
+        body = self._client.json_codec.loads(response.content)
+        self._observe_count(payload, body)
+        return body
+
+    def _observe_count(self, payload: dict[str, Any], body: Any) -> None:
+        actual = body.get("input_tokens") if isinstance(body, dict) else None
+        if isinstance(actual, int):
+            self._token_estimator.observe(
+                input=payload.get("input"),
+                actual_tokens=actual,
+                model=payload.get("model"),
+                tools=payload.get("tools"),
+            )
+
+    def estimate_input_tokens(self, **kwargs: Any) -> int:
+        return self._token_estimator.estimate(**kwargs)
+
+    def calibrate_input_tokens(self, **kwargs: Any) -> None:
+        self._token_estimator.observe(**kwargs)
 
     async def _stream_responses(self, payload: dict[str, Any]) -> AsyncIterator[Any]:
         payload = dict(payload)
         payload["stream"] = True
-        response = await self._client.request("POST", "/responses", json_data=payload)
-        events = response.json()
-        if isinstance(events, list):
-            for event in events:
+        hedge_policy = self._client.hedge_policy
+        if hedge_policy is None or payload.get("store") is not False:
+            response = await self._client.stream_request(
+                "POST",
+                "/responses",
+                headers={"Accept": "text/event-stream"},
+                json_data=payload,
+            )
+            try:
+                async for event in aiter_sse_payloads(
+                    response, loads=self._client.json_codec.loads
+                ):
+                    yield event
+            finally:
+                await response.aclose()
+            return
+
+        body_bytes = self._client.encode_json(payload)
+        stream = await hedged(
+            hedge_policy, lambda: self._open_stream(payload, body_bytes), _close_stream
+        )
+        try:
+            if stream.first is not _STREAM_END:
+                yield stream.first
+            async for event in stream.events:
                 yield event
+        finally:
+            await _close_stream(stream)
+
+    async def _open_stream(
+        self, payload: dict[str, Any], body_bytes: bytes
+    ) -> _OpenStream:
+        # Hedging races up to the first event, not just the response headers.
+        response = await self._client.stream_request(
+            "POST",
+            "/responses",
+            headers={"Accept": "text/event-stream"},
+            json_data=payload,
+            encoded_json=body_bytes,
+        )
+        events = aiter_sse_payloads(response, loads=self._client.json_codec.loads)
+        try:
+            first = await anext(events, _STREAM_END)
+        except BaseException:
+            await events.aclose()
+            await response.aclose()
+            raise
+        return _OpenStream(response, events, first)
+
+
+_STREAM_END = object()
+
+
+class _OpenStream(NamedTuple):
+    response: httpx.Response
+    events: AsyncGenerator[Any, None]
+    first: Any
+
+
+async def _close_stream(stream: _OpenStream) -> None:
+    try:
+        await stream.events.aclose()
+    finally:
+        await stream.response.aclose()
+
+
+async def _release_response(response: httpx.Response) -> None:
+    await response.aclose()
 
 
 class Client(SyncAPIClient):
@@ -105,14 +313,46 @@ class Client(SyncAPIClient):
         base_url: str | None = None,
         timeout: float = 60.0,
         max_retries: int = 2,
+        http_client: httpx.Client | None = None,
+        max_connections: int | None = DEFAULT_MAX_CONNECTIONS,
+        max_keepalive_connections: int | None = DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry: float | None = DEFAULT_KEEPALIVE_EXPIRY,
+        pool_timeout: float | None = None,
+        http2: bool = False,
+        retry_policy: RetryPolicy | None = None,
+        rate_limiter: RateLimiter | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        json_codec: JSONCodecName = "auto",
+        response_cache: ResponseCache | None = None,
+        trusted_responses: bool = False,
+        background_token_refresh: bool = False,
+        token_refresh_fraction: float = 0.8,
+        discovery_cache: DiscoveryCache | None = None,
+        share_http_client_with_auth: bool = False,
     ) -> None:
         super().__init__(
             base_url=(base_url or DEFAULT_BASE_URL),
             timeout=timeout,
             max_retries=max_retries,
+            http_client=http_client,
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+            pool_timeout=pool_timeout,
+            http2=http2,
+            retry_policy=retry_policy,
+            rate_limiter=rate_limiter,
+            circuit_breaker=circuit_breaker,
+            json_codec=json_codec,
         )
+        self.response_cache = response_cache
+        self.trusted_responses = trusted_responses
         self._token_store = token_store
         self._oauth_config = oauth_config
+        self._background_token_refresh = background_token_refresh
+        self._token_refresh_fraction = token_refresh_fraction
+        self._discovery_cache = discovery_cache
+        self._share_http_client_with_auth = share_http_client_with_auth
         self._responses: Responses | None = None
         self._files: Files | None = None
         self._models: Models | None = None
@@ -176,28 +416,76 @@ class Client(SyncAPIClient):
         params: Mapping[str, Any] | None = None,
         headers: Mapping[str, str] | None = None,
         json_data: Any = None,
+        encoded_json: bytes | None = None,
         data: Any = None,
         files: Any = None,
         timeout: float | None = None,
     ) -> httpx.Response:
         auth_headers = self.auth.get_headers()
         merged_headers = _with_auth_headers(headers, auth_headers)
-        return super().request(
-            method,
-            path,
-            params=params,
-            headers=merged_headers,
-            json_data=json_data,
-            data=data,
-            files=files,
-            timeout=timeout,
-        )
+        try:
+            return super().request(
+                method,
+                path,
+                params=params,
+                headers=merged_headers,
+                json_data=json_data,
+                encoded_json=encoded_json,
+                data=data,
+                files=files,
+                timeout=timeout,
+            )
+        except AuthenticationError:
+            self._invalidate_auth()
+            raise
+
+    def stream_request(
+        self,
+        method: str,
+        path: str,
+        *,
+        params: Mapping[str, Any] | None = None,
+        headers: Mapping[str, str] | None = None,
+        json_data: Any = None,
+        encoded_json: bytes | None = None,
+        timeout: float | None = None,
+    ) -> httpx.Response:
+        auth_headers = self.auth.get_headers()
+        merged_headers = _with_auth_headers(headers, auth_headers)
+        try:
+            return super().stream_request(
+                method,
+                path,
+                params=params,
+                headers=merged_headers,
+                json_data=json_data,
+                encoded_json=encoded_json,
+                timeout=timeout,
+            )
+        except AuthenticationError:
+            self._invalidate_auth()
+            raise
+
+    def close(self) -> None:
+        close = getattr(self._auth_provider, "close", None)
+        if callable(close):
+            close()
+        super().close()
+
+    def _invalidate_auth(self) -> None:
+        invalidate = getattr(self._auth_provider, "invalidate", None)
+        if callable(invalidate):
+            invalidate()
 
     def _build_auth_provider(self) -> SyncAuthProvider:
         return OAuthProvider(
             token_store=cast(Any, self._token_store),
             oauth_config=self._oauth_config,
             timeout=self.timeout,
+            background_refresh=self._background_token_refresh,
+            refresh_fraction=self._token_refresh_fraction,
+            discovery_cache=self._discovery_cache,
+            http_client=self._client if self._share_http_client_with_auth else None,
         )
 
 
@@ -210,14 +498,48 @@ class AsyncClient(AsyncAPIClient):
         base_url: str | None = None,
         timeout: float = 60.0,
         max_retries: int = 2,
+        http_client: httpx.AsyncClient | None = None,
+        max_connections: int | None = DEFAULT_MAX_CONNECTIONS,
+        max_keepalive_connections: int | None = DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry: float | None = DEFAULT_KEEPALIVE_EXPIRY,
+        pool_timeout: float | None = None,
+        http2: bool = False,
+        retry_policy: RetryPolicy | None = None,
+        rate_limiter: RateLimiter | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        json_codec: JSONCodecName = "auto",
+        response_cache: ResponseCache | None = None,
+        trusted_responses: bool = False,
+        hedge_policy: HedgePolicy | None = None,
+        background_token_refresh: bool = False,
+        token_refresh_fraction: float = 0.8,
+        discovery_cache: DiscoveryCache | None = None,
+        share_http_client_with_auth: bool = False,
     ) -> None:
         super().__init__(
             base_url=(base_url or DEFAULT_BASE_URL),
             timeout=timeout,
             max_retries=max_retries,
+            http_client=http_client,
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+            pool_timeout=pool_timeout,
+            http2=http2,
+            retry_policy=retry_policy,
+            rate_limiter=rate_limiter,
+            circuit_breaker=circuit_breaker,
+            json_codec=json_codec,
         )
+        self.hedge_policy = hedge_policy
+        self.response_cache = response_cache
+        self.trusted_responses = trusted_responses
         self._token_store = token_store
         self._oauth_config = oauth_config
+        self._background_token_refresh = background_token_refresh
+        self._token_refresh_fraction = token_refresh_fraction
+        self._discovery_cache = discovery_cache
+        self._share_http_client_with_auth = share_http_client_with_auth
         self._responses: AsyncResponses | None = None
         self._files: AsyncFiles | None = None
         self._models: AsyncModels | None = None
@@ -281,26 +603,76 @@ class AsyncClient(AsyncAPIClient):
         params: Mapping[str, Any] | None = None,
         headers: Mapping[str, str] | None = None,
         json_data: Any = None,
+        encoded_json: bytes | None = None,
         data: Any = None,
         files: Any = None,
         timeout: float | None = None,
     ) -> httpx.Response:
         auth_headers = await self.auth.aget_headers()
         merged_headers = _with_auth_headers(headers, auth_headers)
-        return await super().request(
-            method,
-            path,
-            params=params,
-            headers=merged_headers,
-            json_data=json_data,
-            data=data,
-            files=files,
-            timeout=timeout,
-        )
+        try:
+            return await super().request(
+                method,
+                path,
+                params=params,
+                headers=merged_headers,
+                json_data=json_data,
+                encoded_json=encoded_json,
+                data=data,
+                files=files,
+                timeout=timeout,
+            )
+        except AuthenticationError:
+            self._invalidate_auth()
+            raise
+
+    async def stream_request(
+        self,
+        method: str,
+        path: str,
+        *,
+        params: Mapping[str, Any] | None = None,
+        headers: Mapping[str, str] | None = None,
+        json_data: Any = None,
+        encoded_json: bytes | None = None,
+        timeout: float | None = None,
+    ) -> httpx.Response:
+        auth_headers = await self.auth.aget_headers()
+        merged_headers = _with_auth_headers(headers, auth_headers)
+        try:
+            return await super().stream_request(
+                method,
+                path,
+                params=params,
+                headers=merged_headers,
+                json_data=json_data,
+                encoded_json=encoded_json,
+                timeout=timeout,
+            )
+        except AuthenticationError:
+            self._invalidate_auth()
+            raise
+
+    async def close(self) -> None:
+        aclose = getattr(self._auth_provider, "aclose", None)
+        if callable(aclose):
+            await aclose()
+        await super().close()
+
+    def _invalidate_auth(self) -> None:
+        invalidate = getattr(self._auth_provider, "invalidate", None)
+        if callable(invalidate):
+            invalidate()
 
     def _build_auth_provider(self) -> AsyncAuthProvider:
         return OAuthProvider(
             token_store=cast(Any, self._token_store),
             oauth_config=self._oauth_config,
             timeout=self.timeout,
+            background_refresh=self._background_token_refresh,
+            refresh_fraction=self._token_refresh_fraction,
+            discovery_cache=self._discovery_cache,
+            async_http_client=(
+                self._client if self._share_http_client_with_auth else None
+            ),
         )
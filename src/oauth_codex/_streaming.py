@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import json
+from collections.abc import AsyncIterator, Callable, Iterator
+from dataclasses import dataclass
+from typing import Any
+
+import httpx
+
+SSE_DONE_SENTINEL = "[DONE]"
+
+
+@dataclass
+class ServerSentEvent:
+    event: str | None = None
+    data: str = ""
+    id: str | None = None
+    retry: int | None = None
+
+
+class SSEDecoder:
+    def __init__(self) -> None:
+        self._event: str | None = None
+        self._data: list[str] = []
+        self._last_event_id: str | None = None
+        self._retry: int | None = None
+
+    def decode(self, line: str) -> ServerSentEvent | None:
+        line = line.rstrip("\r\n")
+        if not line:
+            if self._event is None and not self._data:
+                return None
+            sse = ServerSentEvent(
+                event=self._event,
+                data="\n".join(self._data),
+                id=self._last_event_id,
+                retry=self._retry,
+            )
+            self._event = None
+            self._data = []
+            self._retry = None
+            return sse
+
+        if line.startswith(":"):
+            return None
+
+        field, _, value = line.partition(":")
+        if value.startswith(" "):
+            value = value[1:]
+
+        if field == "event":
+            self._event = value
+        elif field == "data":
+            self._data.append(value)
+        elif field == "id":
+            if "\0" not in value:
+                self._last_event_id = value
+        elif field == "retry":
+            try:
+                self._retry = int(value)
+            except ValueError:
+                pass
+        return None
+
+    def flush(self) -> ServerSentEvent | None:
+        return self.decode("")
+
+
+def is_event_stream(response: httpx.Response) -> bool:
+    content_type = response.headers.get("content-type", "")
+    return content_type.split(";", 1)[0].strip().lower() == "text/event-stream"
+
+
+def event_payload(
+    sse: ServerSentEvent, loads: Callable[[str], Any] = json.loads
+) -> dict[str, Any] | None:
+    data = sse.data.strip()
+    if not data or data == SSE_DONE_SENTINEL:
+        return None
+    payload = loads(data)
+    if not isinstance(payload, dict):
+        return None
+    if sse.event and "type" not in payload:
+        payload["type"] = sse.event
+    return payload
+
+
+def iter_sse_payloads(
+    response: httpx.Response, loads: Callable[[Any], Any] = json.loads
+) -> Iterator[dict[str, Any]]:
+    if not is_event_stream(response):
+        # Non-SSE fallback: the body is a single JSON array of events.
+        response.read()
+        events = loads(response.content) if response.content else None
+        if isinstance(events, list):
+            yield from (event for event in events if isinstance(event, dict))
+        return
+
+    decoder = SSEDecoder()
+    for line in response.iter_lines():
+        sse = decoder.decode(line)
+        if sse is None:
+            continue
+        if sse.data.strip() == SSE_DONE_SENTINEL:
+            return
+        payload = event_payload(sse, loads)
+        if payload is not None:
+            yield payload
+
+    sse = decoder.flush()
+    if sse is not None:
+        payload = event_payload(sse, loads)
+        if payload is not None:
+            yield payload
+
+
+async def aiter_sse_payloads(
+    response: httpx.Response, loads: Callable[[Any], Any] = json.loads
+) -> AsyncIterator[dict[str, Any]]:
+    if not is_event_stream(response):
+        await response.aread()
+        events = loads(response.content) if response.content else None
+        if isinstance(events, list):
+            for event in events:
+                if isinstance(event, dict):
+                    yield event
+        return
+
+    # Lines are pulled from the socket only as the consumer asks for the next
+    # event, so a slow consumer stops further reads instead of buffering.
+    decoder = SSEDecoder()
+    async for line in response.aiter_lines():
+        sse = decoder.decode(line)
+        if sse is None:
+            continue
+        if sse.data.strip() == SSE_DONE_SENTINEL:
+            return
+        payload = event_payload(sse, loads)
+        if payload is not None:
+            yield payload
+
+    sse = decoder.flush()
+    if sse is not None:
+        payload = event_payload(sse, loads)
+        if payload is not None:
+            yield payload
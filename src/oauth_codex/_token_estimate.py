@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+import json
+import math
+import threading
+from collections.abc import Mapping
+from typing import Any
+
+# Calibrated against GPT-family BPE vocabularies: English prose and source code
+# average ~4 ASCII characters per token, while non-ASCII scripts average ~3
+# UTF-8 bytes per token (about one token per CJK character, two Cyrillic or
+# Greek letters per token).
+_ASCII_CHARS_PER_TOKEN = 4.0
+_NON_ASCII_BYTES_PER_TOKEN = 3.0
+# Role and separator tokens the server adds around every input item.
+_ITEM_OVERHEAD_TOKENS = 4
+# Images and files are billed by the server on their own scale; inline data is
+# never worth scanning as text.
+_ATTACHMENT_TOKENS = 765
+_ATTACHMENT_TYPES = frozenset({"input_image", "input_file", "input_audio"})
+_METADATA_KEYS = frozenset({"type", "id", "call_id", "status"})
+# With these set, `usage.input_tokens` also counts server-side context that is
+# not part of `input`, so the observation says nothing about the estimate.
+_SERVER_CONTEXT_KEYS = ("previous_response_id", "conversation")
+
+_CALIBRATION_WEIGHT = 0.1
+_MIN_SCALE = 0.25
+_MAX_SCALE = 4.0
+
+
+def _text_tokens(text: str) -> float:
+    if text.isascii():
+        return len(text) / _ASCII_CHARS_PER_TOKEN
+    ascii_chars = len(text.encode("ascii", "ignore"))
+    non_ascii_bytes = len(text.encode("utf-8", "surrogatepass")) - ascii_chars
+    return (
+        ascii_chars / _ASCII_CHARS_PER_TOKEN
+        + non_ascii_bytes / _NON_ASCII_BYTES_PER_TOKEN
+    )
+
+
+def _collect(value: Any, texts: list[str]) -> float:
+    # Appends nested strings to `texts` so they can be measured in one pass;
+    # returns the tokens of everything that is not text.
+    other = 0.0
+    append = texts.append
+    stack = [value]
+    pop = stack.pop
+    while stack:
+        item = pop()
+        kind = type(item)
+        if kind is str:
+            append(item)
+        elif kind is dict or isinstance(item, Mapping):
+            if item.get("type") in _ATTACHMENT_TYPES:
+                other += _ATTACHMENT_TOKENS
+                continue
+            for key, child in item.items():
+                if key not in _METADATA_KEYS:
+                    stack.append(child)
+        elif kind is list or kind is tuple:
+            stack.extend(item)
+        elif isinstance(item, str):
+            append(item)
+        elif isinstance(item, (list, tuple)):
+            stack.extend(item)
+        elif isinstance(item, (int, float)) and not isinstance(item, bool):
+            other += 1.0
+    return other
+
+
+def _input_tokens(input: Any) -> float:
+    texts: list[str] = []
+    if isinstance(input, (list, tuple)):
+        tokens = _ITEM_OVERHEAD_TOKENS * len(input) + _collect(input, texts)
+    else:
+        tokens = _ITEM_OVERHEAD_TOKENS + _collect(input, texts)
+    return tokens + _text_tokens("".join(texts))
+
+
+def _tools_tokens(tools: Any) -> float:
+    if not tools:
+        return 0.0
+    text = json.dumps(tools, separators=(",", ":"), ensure_ascii=False, default=str)
+    return _text_tokens(text)
+
+
+class TokenEstimator:
+    """Offline input-token estimator with per-model self-calibration.
+
+    Uncalibrated estimates land within about ±25% of the server count for
+    English text and code, and within about ±50% for other scripts. Every
+    `observe()` nudges a per-model correction factor (an exponential moving
+    average of actual / estimated), so after a few dozen observations of
+    similar traffic estimates typically land within ±10%.
+
+    `observe_usage()` is a no-op until `estimate()` has been called once, so
+    clients that never estimate do not pay for a walk of every request.
+    """
+
+    def __init__(self) -> None:
+        self._scales: dict[str, float] = {}
+        self._samples: dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._in_use = False
+
+    def raw_estimate(
+        self,
+        *,
+        input: Any,
+        tools: Any = None,
+        instructions: str | None = None,
+    ) -> float:
+        tokens = _input_tokens(input) + _tools_tokens(tools)
+        if instructions:
+            tokens += _ITEM_OVERHEAD_TOKENS + _text_tokens(instructions)
+        return tokens
+
+    def estimate(
+        self,
+        *,
+        input: Any,
+        model: str | None = None,
+        tools: Any = None,
+        instructions: str | None = None,
+    ) -> int:
+        self._in_use = True
+        raw = self.raw_estimate(input=input, tools=tools, instructions=instructions)
+        return math.ceil(raw * self.scale(model))
+
+    def observe(
+        self,
+        *,
+        input: Any,
+        actual_tokens: int,
+        model: str | None = None,
+        tools: Any = None,
+        instructions: str | None = None,
+    ) -> None:
+        raw = self.raw_estimate(input=input, tools=tools, instructions=instructions)
+        if raw <= 0 or actual_tokens <= 0:
+            return
+        ratio = min(_MAX_SCALE, max(_MIN_SCALE, actual_tokens / raw))
+        key = model or ""
+        with self._lock:
+            samples = self._samples.get(key, 0)
+            if samples == 0:
+                scale = ratio
+            else:
+                previous = self._scales[key]
+                scale = previous + _CALIBRATION_WEIGHT * (ratio - previous)
+            self._scales[key] = scale
+            self._samples[key] = samples + 1
+
+    def observe_usage(self, payload: Mapping[str, Any], body: Any) -> None:
+        if not self._in_use or not isinstance(body, Mapping) or "input" not in payload:
+            return
+        if any(payload.get(key) for key in _SERVER_CONTEXT_KEYS):
+            return
+        usage = body.get("usage")
+        actual = usage.get("input_tokens") if isinstance(usage, Mapping) else None
+        if not isinstance(actual, int):
+            return
+        self.observe(
+            input=payload.get("input"),
+            actual_tokens=actual,
+            model=payload.get("model"),
+            tools=payload.get("tools"),
+            instructions=payload.get("instructions"),
+        )
+
+    def scale(self, model: str | None = None) -> float:
+        with self._lock:
+            return self._scales.get(model or "", 1.0)
+
+    def samples(self, model: str | None = None) -> int:
+        with self._lock:
+            return self._samples.get(model or "", 0)
@@ -8,6 +8,8 @@ from .store import (
     KeyringTokenStore,
 )
 from .token_manager import (
+    DEFAULT_DISCOVERY_CACHE_PATH,
+    DiscoveryCache,
     discover_endpoints,
     discover_endpoints_async,
     exchange_code_for_tokens,
@@ -22,6 +24,8 @@ __all__ = [
     "build_authorize_url",
     "generate_pkce_pair",
     "generate_state",
+    "DEFAULT_DISCOVERY_CACHE_PATH",
+    "DiscoveryCache",
     "discover_endpoints",
     "discover_endpoints_async",
     "exchange_code_for_tokens",
@@ -1,12 +1,15 @@
 from __future__ import annotations
 
 import asyncio
+import threading
+import time
 from collections.abc import Callable
 
 import httpx
 
 from oauth_codex._exceptions import AuthRequiredError, TokenRefreshError
 from oauth_codex.auth import (
+    DiscoveryCache,
     build_authorize_url,
     discover_endpoints,
     discover_endpoints_async,
@@ -24,6 +27,17 @@ from oauth_codex.store import FallbackTokenStore
 
 from ._provider import Headers
 
+# How long a still-usable access token is reused after a failed refresh
+# before the next request tries to refresh again.
+_REFRESH_RETRY_SECONDS = 5.0
+# Background refresher wake-up interval while there is nothing to schedule,
+# and its back-off after a failed attempt.
+_BACKGROUND_IDLE_SECONDS = 60.0
+_BACKGROUND_RETRY_SECONDS = 30.0
+# Auth traffic is a handful of discovery / refresh / login calls; keep its own
+# pool small and separate from the API client's.
+_AUTH_HTTP_LIMITS = httpx.Limits(max_connections=4, max_keepalive_connections=2)
+
 
 class OAuthProvider:
     def __init__(
@@ -35,54 +49,128 @@ class OAuthProvider:
         refresh_leeway_seconds: int = 30,
         prompt_callback: Callable[[str], str] | None = None,
         output_callback: Callable[[str], None] | None = None,
+        background_refresh: bool = False,
+        refresh_fraction: float = 0.8,
+        discovery_cache: DiscoveryCache | None = None,
+        http_client: httpx.Client | None = None,
+        async_http_client: httpx.AsyncClient | None = None,
     ) -> None:
+        if not 0.0 < refresh_fraction < 1.0:
+            raise ValueError("refresh_fraction must be between 0 and 1")
         self._token_store = token_store or FallbackTokenStore()
         self._oauth_config = load_oauth_config(oauth_config)
         self._timeout = timeout
         self._refresh_leeway_seconds = max(0, refresh_leeway_seconds)
         self._prompt_callback = prompt_callback or input
         self._output_callback = output_callback or print
+        self._cached_tokens: OAuthTokens | None = None
+        self._cached_headers: dict[str, str] | None = None
+        self._cached_refresh_at: float | None = None
+        self._sync_auth_lock = threading.Lock()
+        self._async_auth_lock: asyncio.Lock | None = None
+        self._async_auth_lock_loop: asyncio.AbstractEventLoop | None = None
+        self._background_refresh = background_refresh
+        self._refresh_fraction = refresh_fraction
+        self._background_thread: threading.Thread | None = None
+        self._background_task: asyncio.Task[None] | None = None
+        self._background_stop = threading.Event()
+        self._discovery_cache = discovery_cache
+        self._http_client = http_client
+        self._owns_http_client = http_client is None
+        self._http_client_lock = threading.Lock()
+        self._async_http_client = async_http_client
+        self._owns_async_http_client = async_http_client is None
+        self._async_http_client_loop: asyncio.AbstractEventLoop | None = None
 
     def ensure_valid(self, *, interactive: bool = True) -> None:
         self._ensure_authenticated_sync(interactive=interactive)
 
     def get_headers(self) -> Headers:
+        headers = self._fresh_cached_headers()
+        if headers is not None:
+            return headers
         tokens = self._ensure_authenticated_sync(interactive=True)
-        return self._auth_headers(tokens)
+        return self._cached_headers or self._auth_headers(tokens)
 
     async def aensure_valid(self, *, interactive: bool = True) -> None:
         await self._ensure_authenticated_async(interactive=interactive)
 
     async def aget_headers(self) -> Headers:
+        headers = self._fresh_cached_headers()
+        if headers is not None:
+            return headers
         tokens = await self._ensure_authenticated_async(interactive=True)
-        return self._auth_headers(tokens)
+        return self._cached_headers or self._auth_headers(tokens)
+
+    def close(self) -> None:
+        """Stop the background refresher and close the auth HTTP client it owns."""
+        self._background_stop.set()
+        thread = self._background_thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=self._timeout)
+        self._background_thread = None
+        with self._http_client_lock:
+            client = self._http_client
+            if self._owns_http_client and client is not None:
+                self._http_client = None
+                client.close()
+
+    async def aclose(self) -> None:
+        """Async variant of `close()` that also closes the owned async HTTP client."""
+        self._background_stop.set()
+        task = self._background_task
+        self._background_task = None
+        if task is not None and not task.done():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        client = self._async_http_client
+        if self._owns_async_http_client and client is not None:
+            self._async_http_client = None
+            self._async_http_client_loop = None
+            await client.aclose()
+        self.close()
+
+    def invalidate(self) -> None:
+        """Drop cached credentials so the next request reloads the token store.
+
+        Call this after the token store was changed outside this provider, for
+        example by another process that completed a login or refresh.
+        """
+        self._cached_tokens = None
+        self._cached_headers = None
+        self._cached_refresh_at = None
 
     def login(self) -> OAuthTokens:
-        with httpx.Client(timeout=self._timeout) as client:
-            self._oauth_config = discover_endpoints(client, self._oauth_config)
+        client = self._sync_http_client()
+        self._oauth_config = discover_endpoints(
+            client, self._oauth_config, cache=self._discovery_cache
+        )
 
-            code_verifier, code_challenge = generate_pkce_pair()
-            state = generate_state()
-            authorize_url = build_authorize_url(
-                self._oauth_config, state, code_challenge
-            )
+        code_verifier, code_challenge = generate_pkce_pair()
+        state = generate_state()
+        authorize_url = build_authorize_url(
+            self._oauth_config, state, code_challenge
+        )
 
-            self._output_callback("Open this URL in your browser and complete sign-in:")
-            self._output_callback(authorize_url)
-            callback_url = self._prompt_callback(
-                "Paste the full localhost callback URL: "
-            ).strip()
-
-            code = parse_callback_url(callback_url, state)
-            tokens = exchange_code_for_tokens(
-                client=client,
-                config=self._oauth_config,
-                code=code,
-                code_verifier=code_verifier,
-            )
+        self._output_callback("Open this URL in your browser and complete sign-in:")
+        self._output_callback(authorize_url)
+        callback_url = self._prompt_callback(
+            "Paste the full localhost callback URL: "
+        ).strip()
+
+        code = parse_callback_url(callback_url, state)
+        tokens = exchange_code_for_tokens(
+            client=client,
+            config=self._oauth_config,
+            code=code,
+            code_verifier=code_verifier,
+        )
 
         self._save_tokens_sync(tokens)
-        return tokens
+        return self._remember_tokens(tokens)
 
     def _auth_headers(self, tokens: OAuthTokens) -> dict[str, str]:
         headers = {"Authorization": f"Bearer {tokens.access_token}"}
@@ -90,6 +178,128 @@ class OAuthProvider:
             headers["ChatGPT-Account-ID"] = tokens.account_id
         return headers
 
+    def _fresh_cached_headers(self) -> dict[str, str] | None:
+        headers = self._cached_headers
+        if headers is None:
+            return None
+        refresh_at = self._cached_refresh_at
+        if refresh_at is not None and time.time() >= refresh_at:
+            return None
+        return headers
+
+    def _remember_tokens(
+        self, tokens: OAuthTokens, *, refresh_at: float | None = None
+    ) -> OAuthTokens:
+        self._cached_tokens = tokens
+        self._cached_headers = self._auth_headers(tokens)
+        if refresh_at is None and tokens.expires_at is not None:
+            refresh_at = tokens.expires_at - self._refresh_leeway_seconds
+        self._cached_refresh_at = refresh_at
+        return tokens
+
+    def _cached_tokens_if_fresh(self) -> OAuthTokens | None:
+        if self._fresh_cached_headers() is None:
+            return None
+        return self._cached_tokens
+
+    def _needs_refresh(self, tokens: OAuthTokens) -> bool:
+        return tokens.is_expired(leeway_seconds=self._refresh_leeway_seconds)
+
+    def _background_refresh_at(self, tokens: OAuthTokens) -> float | None:
+        if tokens.expires_at is None:
+            return None
+        issued_at = tokens.last_refresh
+        if issued_at is None or issued_at >= tokens.expires_at:
+            # Without an issue time assume a one-hour lifetime.
+            issued_at = tokens.expires_at - 3600.0
+        lifetime = tokens.expires_at - issued_at
+        return min(
+            issued_at + lifetime * self._refresh_fraction,
+            tokens.expires_at - self._refresh_leeway_seconds,
+        )
+
+    def _seconds_until_background_refresh(self) -> float:
+        tokens = self._cached_tokens
+        if tokens is None or not tokens.refresh_token:
+            return _BACKGROUND_IDLE_SECONDS
+        refresh_at = self._background_refresh_at(tokens)
+        if refresh_at is None:
+            return _BACKGROUND_IDLE_SECONDS
+        return max(0.0, refresh_at - time.time())
+
+    def _next_background_wait(self) -> float:
+        # Only wait 0 when a refresh is actually due, so the loop never spins.
+        seconds = self._seconds_until_background_refresh()
+        if seconds <= 0 and self._background_refresh_due() is None:
+            return _BACKGROUND_IDLE_SECONDS
+        return seconds
+
+    def _background_refresh_due(self) -> OAuthTokens | None:
+        tokens = self._cached_tokens
+        if tokens is None or not tokens.refresh_token:
+            return None
+        refresh_at = self._background_refresh_at(tokens)
+        if refresh_at is None or time.time() < refresh_at:
+            return None
+        return tokens
+
+    def _start_background_refresh_sync(self) -> None:
+        if not self._background_refresh or self._background_stop.is_set():
+            return
+        thread = self._background_thread
+        if thread is not None and thread.is_alive():
+            return
+        self._background_thread = threading.Thread(
+            target=self._background_refresh_loop_sync,
+            name="oauth-codex-token-refresh",
+            daemon=True,
+        )
+        self._background_thread.start()
+
+    def _background_refresh_loop_sync(self) -> None:
+        while not self._background_stop.wait(self._next_background_wait()):
+            try:
+                with self._sync_auth_lock:
+                    tokens = self._background_refresh_due()
+                    if tokens is None:
+                        continue
+                    self._remember_tokens(self._refresh_and_persist_sync(tokens))
+            except Exception:
+                # The request path still refreshes lazily if this keeps failing.
+                if self._background_stop.wait(_BACKGROUND_RETRY_SECONDS):
+                    return
+
+    def _start_background_refresh_async(self) -> None:
+        if not self._background_refresh or self._background_stop.is_set():
+            return
+        task = self._background_task
+        if task is not None and not task.done():
+            return
+        self._background_task = asyncio.get_running_loop().create_task(
+            self._background_refresh_loop_async(),
+            name="oauth-codex-token-refresh",
+        )
+
+    async def _background_refresh_loop_async(self) -> None:
+        while not self._background_stop.is_set():
+            await asyncio.sleep(self._next_background_wait())
+            try:
+                async with self._async_lock():
+                    tokens = self._background_refresh_due()
+                    if tokens is None:
+                        continue
+                    refreshed = await self._refresh_and_persist_async(tokens)
+                    self._remember_tokens(refreshed)
+            except Exception:
+                await asyncio.sleep(_BACKGROUND_RETRY_SECONDS)
+
+    def _async_lock(self) -> asyncio.Lock:
+        loop = asyncio.get_running_loop()
+        if self._async_auth_lock is None or self._async_auth_lock_loop is not loop:
+            self._async_auth_lock = asyncio.Lock()
+            self._async_auth_lock_loop = loop
+        return self._async_auth_lock
+
     def _load_tokens_sync(self) -> OAuthTokens | None:
         return self._token_store.load()
 
@@ -103,38 +313,84 @@ class OAuthProvider:
         await asyncio.to_thread(self._token_store.save, tokens)
 
     def _delete_tokens_sync(self) -> None:
+        self.invalidate()
         self._token_store.delete()
 
     async def _delete_tokens_async(self) -> None:
+        self.invalidate()
         await asyncio.to_thread(self._token_store.delete)
 
+    def _sync_http_client(self) -> httpx.Client:
+        with self._http_client_lock:
+            if self._http_client is None:
+                self._http_client = httpx.Client(
+                    timeout=self._timeout, limits=_AUTH_HTTP_LIMITS
+                )
+            return self._http_client
+
+    def _async_http_client_for_loop(self) -> httpx.AsyncClient:
+        if not self._owns_async_http_client:
+            assert self._async_http_client is not None
+            return self._async_http_client
+        # Pooled connections belong to the loop that opened them.
+        loop = asyncio.get_running_loop()
+        if self._async_http_client is None or self._async_http_client_loop is not loop:
+            self._async_http_client = httpx.AsyncClient(
+                timeout=self._timeout, limits=_AUTH_HTTP_LIMITS
+            )
+            self._async_http_client_loop = loop
+        return self._async_http_client
+
     def _refresh_and_persist_sync(self, tokens: OAuthTokens) -> OAuthTokens:
-        with httpx.Client(timeout=self._timeout) as client:
-            self._oauth_config = discover_endpoints(client, self._oauth_config)
-            refreshed = refresh_tokens(client, self._oauth_config, tokens)
+        client = self._sync_http_client()
+        self._oauth_config = discover_endpoints(
+            client, self._oauth_config, cache=self._discovery_cache
+        )
+        refreshed = refresh_tokens(client, self._oauth_config, tokens)
         self._save_tokens_sync(refreshed)
         return refreshed
 
     async def _refresh_and_persist_async(self, tokens: OAuthTokens) -> OAuthTokens:
-        async with httpx.AsyncClient(timeout=self._timeout) as client:
-            self._oauth_config = await discover_endpoints_async(
-                client, self._oauth_config
-            )
-            refreshed = await refresh_tokens_async(client, self._oauth_config, tokens)
+        client = self._async_http_client_for_loop()
+        self._oauth_config = await discover_endpoints_async(
+            client, self._oauth_config, cache=self._discovery_cache
+        )
+        refreshed = await refresh_tokens_async(client, self._oauth_config, tokens)
         await self._save_tokens_async(refreshed)
         return refreshed
 
     def _ensure_authenticated_sync(self, *, interactive: bool) -> OAuthTokens:
+        tokens = self._cached_tokens_if_fresh()
+        if tokens is not None:
+            return tokens
+        # Single-flight: the first thread refreshes while the others wait here
+        # and then pick up its result from the cache.
+        with self._sync_auth_lock:
+            tokens = self._cached_tokens_if_fresh()
+            if tokens is not None:
+                return tokens
+            tokens = self._authenticate_sync(interactive=interactive)
+        self._start_background_refresh_sync()
+        return tokens
+
+    def _authenticate_sync(self, *, interactive: bool) -> OAuthTokens:
         tokens = self._load_tokens_sync()
         if not tokens:
             if not interactive:
                 raise AuthRequiredError("No stored OAuth credentials available")
             tokens = self.login()
 
-        if tokens.is_expired(leeway_seconds=self._refresh_leeway_seconds):
+        if self._needs_refresh(tokens):
             try:
                 tokens = self._refresh_and_persist_sync(tokens)
             except TokenRefreshError as exc:
+                if not tokens.is_expired():
+                    return self._remember_tokens(
+                        tokens, refresh_at=time.time() + _REFRESH_RETRY_SECONDS
+                    )
+                current = self._load_tokens_sync()
+                if current is not None and not self._needs_refresh(current):
+                    return self._remember_tokens(current)
                 self._delete_tokens_sync()
                 if not interactive:
                     raise AuthRequiredError(
@@ -142,19 +398,38 @@ class OAuthProvider:
                     ) from exc
                 tokens = self.login()
 
-        return tokens
+        return self._remember_tokens(tokens)
 
     async def _ensure_authenticated_async(self, *, interactive: bool) -> OAuthTokens:
+        tokens = self._cached_tokens_if_fresh()
+        if tokens is not None:
+            return tokens
+        async with self._async_lock():
+            tokens = self._cached_tokens_if_fresh()
+            if tokens is not None:
+                return tokens
+            tokens = await self._authenticate_async(interactive=interactive)
+        self._start_background_refresh_async()
+        return tokens
+
+    async def _authenticate_async(self, *, interactive: bool) -> OAuthTokens:
         tokens = await self._load_tokens_async()
         if not tokens:
             if not interactive:
                 raise AuthRequiredError("No stored OAuth credentials available")
             tokens = await asyncio.to_thread(self.login)
 
-        if tokens.is_expired(leeway_seconds=self._refresh_leeway_seconds):
+        if self._needs_refresh(tokens):
             try:
                 tokens = await self._refresh_and_persist_async(tokens)
             except TokenRefreshError as exc:
+                if not tokens.is_expired():
+                    return self._remember_tokens(
+                        tokens, refresh_at=time.time() + _REFRESH_RETRY_SECONDS
+                    )
+                current = await self._load_tokens_async()
+                if current is not None and not self._needs_refresh(current):
+                    return self._remember_tokens(current)
                 await self._delete_tokens_async()
                 if not interactive:
                     raise AuthRequiredError(
@@ -162,4 +437,4 @@ class OAuthProvider:
                     ) from exc
                 tokens = await asyncio.to_thread(self.login)
 
-        return tokens
+        return self._remember_tokens(tokens)
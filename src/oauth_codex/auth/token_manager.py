@@ -2,7 +2,13 @@ from __future__ import annotations
 
 import base64
 import json
+import os
+import tempfile
+import threading
 import time
+from dataclasses import replace
+from email.utils import parsedate_to_datetime
+from pathlib import Path
 from typing import Any
 from urllib.parse import parse_qs, urlparse
 
@@ -15,53 +21,218 @@ from .._exceptions import (
     TokenRefreshError,
 )
 from ..core_types import OAuthTokens
+from ..store import DEFAULT_FILE_PATH
 from .config import OAuthConfig
 
 
-def discover_endpoints(client: httpx.Client, config: OAuthConfig) -> OAuthConfig:
+DEFAULT_DISCOVERY_TTL_SECONDS = 3600.0
+DEFAULT_DISCOVERY_CACHE_PATH = DEFAULT_FILE_PATH.parent / "discovery.json"
+
+_DISCOVERY_FIELDS = ("authorization_endpoint", "token_endpoint")
+
+
+class DiscoveryCache:
+    """Per-`discovery_url` cache of OAuth authorization server metadata.
+
+    Entries expire according to the response's `Cache-Control` / `Expires`
+    headers, falling back to `ttl_seconds`. With a `path`, entries are also
+    persisted as JSON so other processes skip the discovery round trip.
+    Entries hold only the endpoints the discovery document advertised;
+    configured fallbacks are applied when an entry is read.
+    """
+
+    def __init__(
+        self,
+        *,
+        path: str | Path | None = None,
+        ttl_seconds: float = DEFAULT_DISCOVERY_TTL_SECONDS,
+    ) -> None:
+        self.path = Path(path).expanduser() if path is not None else None
+        self.ttl_seconds = ttl_seconds
+        self._entries: dict[str, tuple[float, dict[str, str]]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, discovery_url: str) -> dict[str, str] | None:
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(discovery_url)
+            if entry is None and self.path is not None:
+                entry = self._read_disk().get(discovery_url)
+                if entry is not None:
+                    self._entries[discovery_url] = entry
+            if entry is None:
+                return None
+            expires_at, endpoints = entry
+            if expires_at <= now:
+                self._entries.pop(discovery_url, None)
+                return None
+            return endpoints
+
+    def put(self, discovery_url: str, endpoints: dict[str, str], *, expires_at: float) -> None:
+        with self._lock:
+            self._entries[discovery_url] = (expires_at, dict(endpoints))
+            if self.path is not None:
+                entries = self._read_disk()
+                entries[discovery_url] = (expires_at, dict(endpoints))
+                self._write_disk(entries)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            if self.path is not None:
+                try:
+                    self.path.unlink(missing_ok=True)
+                except OSError:
+                    pass
+
+    def expires_at(self, response: httpx.Response) -> float | None:
+        """Return the expiry time for `response`, or `None` if it must not be cached."""
+        now = time.time()
+        directives = _cache_control_directives(response.headers.get("cache-control", ""))
+        if "no-store" in directives or "no-cache" in directives:
+            return None
+        max_age = _parse_seconds(directives.get("max-age"))
+        if max_age is not None:
+            age = _parse_seconds(response.headers.get("age")) or 0.0
+            lifetime = max_age - age
+            return now + lifetime if lifetime > 0 else None
+        expires = response.headers.get("expires")
+        if expires is not None:
+            try:
+                expires_at = parsedate_to_datetime(expires).timestamp()
+            except (TypeError, ValueError):
+                return None
+            return expires_at if expires_at > now else None
+        return now + self.ttl_seconds
+
+    def _read_disk(self) -> dict[str, tuple[float, dict[str, str]]]:
+        assert self.path is not None
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict):
+            return {}
+        entries: dict[str, tuple[float, dict[str, str]]] = {}
+        for url, item in data.items():
+            try:
+                endpoints = _discovered_endpoints(item["endpoints"])
+                entries[url] = (float(item["expires_at"]), endpoints)
+            except (KeyError, TypeError, ValueError):
+                continue
+        return entries
+
+    def _write_disk(self, entries: dict[str, tuple[float, dict[str, str]]]) -> None:
+        assert self.path is not None
+        payload = {
+            url: {"expires_at": expires_at, "endpoints": endpoints}
+            for url, (expires_at, endpoints) in entries.items()
+        }
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                mode="w", encoding="utf-8", dir=str(self.path.parent), delete=False
+            ) as fp:
+                tmp_path = Path(fp.name)
+                fp.write(json.dumps(payload, ensure_ascii=True, indent=2))
+            os.replace(tmp_path, self.path)
+        except OSError:
+            return
+
+
+_default_discovery_cache = DiscoveryCache()
+
+
+def _cache_control_directives(value: str) -> dict[str, str | None]:
+    directives: dict[str, str | None] = {}
+    for part in value.split(","):
+        name, _, arg = part.strip().partition("=")
+        if name:
+            directives[name.lower()] = arg.strip('"') or None
+    return directives
+
+
+def _parse_seconds(value: str | None) -> float | None:
+    if value is None:
+        return None
     try:
-        response = client.get(config.discovery_url)
-        response.raise_for_status()
-        payload = response.json()
-    except Exception:
-        return config
+        seconds = float(value)
+    except ValueError:
+        return None
+    return max(0.0, seconds)
 
-    auth_endpoint = payload.get("authorization_endpoint") or config.authorization_endpoint
-    token_endpoint = payload.get("token_endpoint") or config.token_endpoint
 
-    return OAuthConfig(
-        client_id=config.client_id,
-        scope=config.scope,
-        audience=config.audience,
-        redirect_uri=config.redirect_uri,
-        discovery_url=config.discovery_url,
+def _apply_discovery(config: OAuthConfig, endpoints: dict[str, str]) -> OAuthConfig:
+    auth_endpoint = endpoints.get("authorization_endpoint") or config.authorization_endpoint
+    token_endpoint = endpoints.get("token_endpoint") or config.token_endpoint
+    if (
+        auth_endpoint == config.authorization_endpoint
+        and token_endpoint == config.token_endpoint
+    ):
+        return config
+    return replace(
+        config,
         authorization_endpoint=auth_endpoint,
         token_endpoint=token_endpoint,
-        originator=config.originator,
     )
 
 
-async def discover_endpoints_async(client: httpx.AsyncClient, config: OAuthConfig) -> OAuthConfig:
+def _discovered_endpoints(payload: Any) -> dict[str, str]:
+    if not isinstance(payload, dict):
+        return {}
+    return {
+        key: payload[key]
+        for key in _DISCOVERY_FIELDS
+        if isinstance(payload.get(key), str) and payload[key]
+    }
+
+
+def _remember_discovery(
+    cache: DiscoveryCache, config: OAuthConfig, response: httpx.Response
+) -> OAuthConfig:
+    endpoints = _discovered_endpoints(response.json())
+    expires_at = cache.expires_at(response)
+    if expires_at is not None:
+        cache.put(config.discovery_url, endpoints, expires_at=expires_at)
+    return _apply_discovery(config, endpoints)
+
+
+def discover_endpoints(
+    client: httpx.Client,
+    config: OAuthConfig,
+    *,
+    cache: DiscoveryCache | None = None,
+) -> OAuthConfig:
+    cache = cache or _default_discovery_cache
+    cached = cache.get(config.discovery_url)
+    if cached is not None:
+        return _apply_discovery(config, cached)
+
     try:
-        response = await client.get(config.discovery_url)
+        response = client.get(config.discovery_url)
         response.raise_for_status()
-        payload = response.json()
+        return _remember_discovery(cache, config, response)
     except Exception:
         return config
 
-    auth_endpoint = payload.get("authorization_endpoint") or config.authorization_endpoint
-    token_endpoint = payload.get("token_endpoint") or config.token_endpoint
 
-    return OAuthConfig(
-        client_id=config.client_id,
-        scope=config.scope,
-        audience=config.audience,
-        redirect_uri=config.redirect_uri,
-        discovery_url=config.discovery_url,
-        authorization_endpoint=auth_endpoint,
-        token_endpoint=token_endpoint,
-        originator=config.originator,
-    )
+async def discover_endpoints_async(
+    client: httpx.AsyncClient,
+    config: OAuthConfig,
+    *,
+    cache: DiscoveryCache | None = None,
+) -> OAuthConfig:
+    cache = cache or _default_discovery_cache
+    cached = cache.get(config.discovery_url)
+    if cached is not None:
+        return _apply_discovery(config, cached)
+
+    try:
+        response = await client.get(config.discovery_url)
+        response.raise_for_status()
+        return _remember_discovery(cache, config, response)
+    except Exception:
+        return config
 
 
 def parse_callback_url(callback_url: str, expected_state: str) -> str:
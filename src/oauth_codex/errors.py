@@ -1,12 +1,14 @@
 from ._exceptions import (
     APIConnectionError,
     APIError,
+    APIPoolTimeoutError,
     APIResponseValidationError,
     APIStatusError,
     APITimeoutError,
     AuthRequiredError,
     AuthenticationError,
     BadRequestError,
+    CircuitOpenError,
     ConflictError,
     ContinuityError,
     InternalServerError,
@@ -37,8 +39,10 @@ __all__ = [
     "APIError",
     "APIConnectionError",
     "APITimeoutError",
+    "APIPoolTimeoutError",
     "APIStatusError",
     "APIResponseValidationError",
+    "CircuitOpenError",
     "BadRequestError",
     "AuthenticationError",
     "PermissionDeniedError",
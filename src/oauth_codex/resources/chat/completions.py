@@ -1,17 +1,30 @@
 from __future__ import annotations
 
+import asyncio
 import json
 import inspect
 import time
 import uuid
-from typing import Any
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Iterator,
+    Literal,
+    Mapping,
+    NamedTuple,
+    overload,
+)
 
 from oauth_codex.tooling import (
-    build_strict_response_format,
+    ToolSet,
+    cached_strict_response_format,
     callable_to_tool_schema,
     to_responses_tools,
 )
 from oauth_codex.types.chat.completions import ChatCompletion
+from oauth_codex.types.responses import ResponseStreamEvent
 
 PydanticBaseModel: Any = None
 try:
@@ -30,11 +43,13 @@ def _is_pydantic_model_type(value: Any) -> bool:
 
 def _normalize_response_format(response_format: Any) -> Any:
     if _is_pydantic_model_type(response_format):
-        return build_strict_response_format(response_format)
+        return cached_strict_response_format(response_format)
     return response_format
 
 
 def _normalize_tools(tools: Any) -> Any:
+    if isinstance(tools, ToolSet):
+        return tools
     if not isinstance(tools, list):
         return tools
 
@@ -47,20 +62,28 @@ def _normalize_tools(tools: Any) -> Any:
     return normalized
 
 
-def _parse_text_with_model(response_format: type[Any], text: str) -> Any:
+def _parse_text_with_model(
+    response_format: type[Any], text: str, loads: Callable[[str], Any]
+) -> Any:
     try:
         return response_format.model_validate_json(text)
     except Exception:
-        return response_format.model_validate(json.loads(text))
+        return response_format.model_validate(loads(text))
+
+
+def _response_field(response: Any, name: str) -> Any:
+    if isinstance(response, dict):
+        return response.get(name)
+    return getattr(response, name, None)
 
 
-def _extract_output_text(response_data: dict[str, Any]) -> str:
-    output_text = response_data.get("output_text")
+def _extract_output_text(response: Any) -> str:
+    output_text = _response_field(response, "output_text")
     if isinstance(output_text, str):
         return output_text
 
     chunks: list[str] = []
-    output = response_data.get("output")
+    output = _response_field(response, "output")
     if not isinstance(output, list):
         return ""
 
@@ -86,9 +109,9 @@ def _extract_output_text(response_data: dict[str, Any]) -> str:
     return "".join(chunks)
 
 
-def _extract_tool_calls(response_data: dict[str, Any]) -> list[dict[str, Any]]:
+def _extract_tool_calls(response: Any) -> list[dict[str, Any]]:
     tool_calls: list[dict[str, Any]] = []
-    output = response_data.get("output")
+    output = _response_field(response, "output")
     if not isinstance(output, list):
         return tool_calls
 
@@ -164,7 +187,9 @@ def _build_function_call_output_item(
     }
 
 
-def _build_tool_function_map(tools: list[Any]) -> dict[str, Any]:
+def _build_tool_function_map(tools: list[Any] | ToolSet) -> Mapping[str, Any]:
+    if isinstance(tools, ToolSet):
+        return tools.functions
     tool_map = {}
     for tool in tools:
         if callable(tool):
@@ -177,7 +202,7 @@ def _build_tool_function_map(tools: list[Any]) -> dict[str, Any]:
     return tool_map
 
 
-def _parse_tool_arguments(arguments: Any) -> dict[str, Any]:
+def _parse_tool_arguments(arguments: Any, loads: Callable[[str], Any]) -> dict[str, Any]:
     if isinstance(arguments, dict):
         return arguments
     if not isinstance(arguments, str) or not arguments.strip():
@@ -186,9 +211,9 @@ def _parse_tool_arguments(arguments: Any) -> dict[str, Any]:
         )
 
     try:
-        parsed = json.loads(arguments)
+        parsed = loads(arguments)
         if isinstance(parsed, str):
-            parsed = json.loads(parsed)
+            parsed = loads(parsed)
         if isinstance(parsed, dict):
             return parsed
         raise ValueError("Parsed arguments is not a dictionary")
@@ -202,40 +227,332 @@ def _run_tool_function(*, fn: Any, arguments: Any) -> Any:
     return fn(arguments)
 
 
+class _ToolCall(NamedTuple):
+    name: str
+    fn: Any
+    arguments: Any
+    call_id: str
+
+
+def _resolve_tool_call(
+    fn_name: str,
+    arguments: Any,
+    call_id: str,
+    tool_functions: Mapping[str, Any],
+    loads: Callable[[str], Any],
+) -> _ToolCall:
+    fn = tool_functions.get(fn_name)
+    if fn is None:
+        raise ValueError(f"No callable tool provided for '{fn_name}'")
+    return _ToolCall(fn_name, fn, _parse_tool_arguments(arguments, loads), call_id)
+
+
+def _resolve_tool_calls(
+    tool_calls: list[Any], tool_functions: Mapping[str, Any], loads: Callable[[str], Any]
+) -> list[_ToolCall]:
+    return [
+        _resolve_tool_call(
+            tool_call.function.name,
+            tool_call.function.arguments,
+            tool_call.id,
+            tool_functions,
+            loads,
+        )
+        for tool_call in tool_calls
+    ]
+
+
+def _run_sync_tool(call: _ToolCall) -> Any:
+    output = _run_tool_function(fn=call.fn, arguments=call.arguments)
+    if inspect.isawaitable(output):
+        raise TypeError(
+            f"Tool '{call.name}' returned an awaitable; use arun_tools for async tools"
+        )
+    return output
+
+
+def _run_sync_tools(calls: list[_ToolCall], concurrency: int) -> list[Any]:
+    if len(calls) == 1 or concurrency == 1:
+        return [_run_sync_tool(call) for call in calls]
+    with ThreadPoolExecutor(
+        max_workers=min(concurrency, len(calls)), thread_name_prefix="oauth-codex-tool"
+    ) as pool:
+        return list(pool.map(_run_sync_tool, calls))
+
+
+async def _run_async_tool(semaphore: asyncio.Semaphore, call: _ToolCall) -> Any:
+    async with semaphore:
+        output = _run_tool_function(fn=call.fn, arguments=call.arguments)
+        if inspect.isawaitable(output):
+            output = await output
+        return output
+
+
+async def _run_async_tools(calls: list[_ToolCall], concurrency: int) -> list[Any]:
+    semaphore = asyncio.Semaphore(concurrency)
+    tasks: list[asyncio.Task[Any]] = []
+    try:
+        async with asyncio.TaskGroup() as group:
+            for call in calls:
+                tasks.append(group.create_task(_run_async_tool(semaphore, call)))
+    except BaseExceptionGroup:
+        # Surface the failing tool's own exception, as a serial loop would.
+        for task in tasks:
+            if task.done() and not task.cancelled() and task.exception() is not None:
+                raise task.exception() from None  # type: ignore[misc]
+        raise
+    return [task.result() for task in tasks]
+
+
+class _StreamedToolCalls:
+    """Assembles tool calls from `tool_call_*` stream events."""
+
+    def __init__(self) -> None:
+        self._names: dict[str, str] = {}
+        self._arguments: dict[str, list[str]] = {}
+
+    def feed(self, event: ResponseStreamEvent) -> tuple[str, Any, str] | None:
+        raw = event.raw if isinstance(event.raw, dict) else {}
+        item = raw.get("item") if isinstance(raw.get("item"), dict) else raw
+        call_id = event.call_id or item.get("call_id")
+        if event.type == "tool_call_started":
+            if call_id and isinstance(item.get("name"), str):
+                self._names[call_id] = item["name"]
+        elif event.type == "tool_call_arguments_delta":
+            if call_id and event.delta:
+                self._arguments.setdefault(call_id, []).append(event.delta)
+        elif event.type == "tool_call_done":
+            if not isinstance(call_id, str) or not call_id:
+                raise ValueError("tool_call_done event is missing call_id")
+            name = item.get("name") or self._names.pop(call_id, None)
+            chunks = self._arguments.pop(call_id, [])
+            arguments = item.get("arguments")
+            if arguments is None:
+                arguments = "".join(chunks)
+            if not isinstance(name, str):
+                raise ValueError(f"tool_call_done for '{call_id}' is missing the tool name")
+            return name, arguments, call_id
+        return None
+
+
+def _tool_output_event(
+    call: _ToolCall, item: dict[str, Any], response_id: str | None
+) -> ResponseStreamEvent:
+    return ResponseStreamEvent(
+        type="tool_call_output",
+        call_id=call.call_id,
+        response_id=response_id,
+        raw={"name": call.name, "output": item["output"]},
+    )
+
+
+def _stream_request_kwargs(
+    model: str, tools: Any, kwargs: dict[str, Any]
+) -> dict[str, Any]:
+    request_kwargs = dict(kwargs)
+    # Chat-only option; streamed rounds yield events, not completions.
+    request_kwargs.pop("include_raw_response", None)
+    if "response_format" in request_kwargs:
+        request_kwargs["response_format"] = _normalize_response_format(
+            request_kwargs["response_format"]
+        )
+    request_kwargs.update(model=model, tools=_normalize_tools(tools), stream=True)
+    return request_kwargs
+
+
+def _require_round_response_id(response_id: str | None) -> str:
+    if response_id is None:
+        raise RuntimeError(
+            "run_tools stream ended with tool calls but no event carried a "
+            "response_id to continue from"
+        )
+    return response_id
+
+
+def _stream_tool_rounds(
+    responses: Any,
+    *,
+    model: str,
+    messages: list[dict[str, Any]],
+    tools: Any,
+    tool_functions: Mapping[str, Any],
+    max_rounds: int,
+    tool_concurrency: int,
+    loads: Callable[[str], Any],
+    kwargs: dict[str, Any],
+) -> Iterator[ResponseStreamEvent]:
+    request_kwargs = _stream_request_kwargs(model, tools, kwargs)
+    previous_response_id = request_kwargs.pop("previous_response_id", None)
+    round_input = [dict(message) for message in messages]
+    pool = ThreadPoolExecutor(
+        max_workers=tool_concurrency, thread_name_prefix="oauth-codex-tool"
+    )
+    pending: list[tuple[_ToolCall, Future[Any]]] = []
+    try:
+        for _ in range(max_rounds):
+            events = responses.create(
+                input=round_input,
+                previous_response_id=previous_response_id,
+                **request_kwargs,
+            )
+            tracker = _StreamedToolCalls()
+            pending = []
+            response_id: str | None = None
+            try:
+                for event in events:
+                    response_id = event.response_id or response_id
+                    done = tracker.feed(event)
+                    if done is not None:
+                        call = _resolve_tool_call(*done, tool_functions, loads)
+                        # Start the tool now; generation keeps streaming meanwhile.
+                        pending.append((call, pool.submit(_run_sync_tool, call)))
+                    yield event
+            finally:
+                close = getattr(events, "close", None)
+                if callable(close):
+                    close()
+
+            if not pending:
+                return
+            response_id = _require_round_response_id(response_id)
+            round_input = []
+            for call, future in pending:
+                item = _build_function_call_output_item(
+                    tool_call_id=call.call_id, output=future.result()
+                )
+                yield _tool_output_event(call, item, response_id)
+                round_input.append(item)
+            previous_response_id = response_id
+
+        raise RuntimeError(
+            "run_tools exceeded max_rounds without reaching a final response"
+        )
+    finally:
+        # The consumer may stop mid-round; drop queued tools rather than run
+        # them for results nobody will read.
+        for _, future in pending:
+            future.cancel()
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+async def _astream_tool_rounds(
+    responses: Any,
+    *,
+    model: str,
+    messages: list[dict[str, Any]],
+    tools: Any,
+    tool_functions: Mapping[str, Any],
+    max_rounds: int,
+    tool_concurrency: int,
+    loads: Callable[[str], Any],
+    kwargs: dict[str, Any],
+) -> AsyncIterator[ResponseStreamEvent]:
+    request_kwargs = _stream_request_kwargs(model, tools, kwargs)
+    previous_response_id = request_kwargs.pop("previous_response_id", None)
+    round_input = [dict(message) for message in messages]
+    semaphore = asyncio.Semaphore(tool_concurrency)
+    pending: list[tuple[_ToolCall, asyncio.Task[Any]]] = []
+    try:
+        for _ in range(max_rounds):
+            events = await responses.create(
+                input=round_input,
+                previous_response_id=previous_response_id,
+                **request_kwargs,
+            )
+            tracker = _StreamedToolCalls()
+            pending = []
+            response_id: str | None = None
+            try:
+                async for event in events:
+                    response_id = event.response_id or response_id
+                    done = tracker.feed(event)
+                    if done is not None:
+                        call = _resolve_tool_call(*done, tool_functions, loads)
+                        # Start the tool now; generation keeps streaming meanwhile.
+                        task = asyncio.ensure_future(_run_async_tool(semaphore, call))
+                        pending.append((call, task))
+                    yield event
+            finally:
+                aclose = getattr(events, "aclose", None)
+                if callable(aclose):
+                    await aclose()
+
+            if not pending:
+                return
+            response_id = _require_round_response_id(response_id)
+            round_input = []
+            for call, task in pending:
+                item = _build_function_call_output_item(
+                    tool_call_id=call.call_id, output=await task
+                )
+                yield _tool_output_event(call, item, response_id)
+                round_input.append(item)
+            previous_response_id = response_id
+
+        raise RuntimeError(
+            "arun_tools exceeded max_rounds without reaching a final response"
+        )
+    finally:
+        unfinished = [task for _, task in pending if not task.done()]
+        for task in unfinished:
+            task.cancel()
+        if unfinished:
+            await asyncio.gather(*unfinished, return_exceptions=True)
+
+
 def _to_chat_completion(
     *,
-    response_data: dict[str, Any],
+    response: Any,
     requested_model: str,
+    include_raw_response: bool = False,
 ) -> ChatCompletion:
-    tool_calls = _extract_tool_calls(response_data)
-    output_text = _extract_output_text(response_data)
+    # Read the response's attributes directly: a `to_dict` dump walks every
+    # output item, so it is only paid for when `raw_response` is requested.
+    tool_calls = _extract_tool_calls(response)
+    output_text = _extract_output_text(response)
 
     content: str | None = output_text
     if not content and tool_calls:
         content = None
 
-    finish_reason = response_data.get("finish_reason")
+    finish_reason = _response_field(response, "finish_reason")
     if not isinstance(finish_reason, str):
         finish_reason = "tool_calls" if tool_calls else "stop"
 
-    usage_data = response_data.get("usage")
+    usage = _response_field(response, "usage")
     prompt_tokens = 0
     completion_tokens = 0
+    total_tokens: Any = None
 
-    if isinstance(usage_data, dict):
+    if usage is not None:
         prompt_tokens = int(
-            usage_data.get("prompt_tokens") or usage_data.get("input_tokens") or 0
+            _response_field(usage, "prompt_tokens")
+            or _response_field(usage, "input_tokens")
+            or 0
         )
         completion_tokens = int(
-            usage_data.get("completion_tokens") or usage_data.get("output_tokens") or 0
+            _response_field(usage, "completion_tokens")
+            or _response_field(usage, "output_tokens")
+            or 0
+        )
+        total_tokens = _response_field(usage, "total_tokens")
+    total_tokens = int(total_tokens or prompt_tokens + completion_tokens)
+
+    raw_response = None
+    if include_raw_response:
+        raw_response = (
+            response
+            if isinstance(response, dict)
+            else response.to_dict(exclude_unset=False, exclude_none=False)
         )
-    total_tokens = prompt_tokens + completion_tokens
 
+    # Validating this small dict is cheaper than nested `model_construct`
+    # calls once a completion carries many tool calls.
     return ChatCompletion.model_validate(
         {
-            "id": response_data.get("id") or f"chatcmpl-{uuid.uuid4().hex}",
-            "created": int(response_data.get("created") or time.time()),
-            "model": response_data.get("model") or requested_model,
+            "id": _response_field(response, "id") or f"chatcmpl-{uuid.uuid4().hex}",
+            "created": int(_response_field(response, "created") or time.time()),
+            "model": _response_field(response, "model") or requested_model,
             "choices": [
                 {
                     "index": 0,
@@ -250,12 +567,10 @@ def _to_chat_completion(
             "usage": {
                 "prompt_tokens": prompt_tokens,
                 "completion_tokens": completion_tokens,
-                "total_tokens": int(usage_data.get("total_tokens") or total_tokens)
-                if isinstance(usage_data, dict)
-                else total_tokens,
+                "total_tokens": total_tokens,
             },
-            "system_fingerprint": response_data.get("system_fingerprint"),
-            "raw_response": response_data,
+            "system_fingerprint": _response_field(response, "system_fingerprint"),
+            "raw_response": raw_response,
         }
     )
 
@@ -268,6 +583,7 @@ class Completions:
         self, *, model: str, messages: list[dict[str, Any]], **kwargs: Any
     ) -> ChatCompletion:
         payload = dict(kwargs)
+        include_raw_response = bool(payload.pop("include_raw_response", False))
         if "response_format" in payload:
             payload["response_format"] = _normalize_response_format(
                 payload["response_format"]
@@ -278,8 +594,11 @@ class Completions:
         payload["input"] = messages
 
         response = self._client.responses.create(**payload)
-        response_data = response.to_dict(exclude_unset=False, exclude_none=False)
-        return _to_chat_completion(response_data=response_data, requested_model=model)
+        return _to_chat_completion(
+            response=response,
+            requested_model=model,
+            include_raw_response=include_raw_response,
+        )
 
     def parse(
         self,
@@ -303,7 +622,9 @@ class Completions:
         if completion.choices:
             text = completion.choices[0].message.content or ""
 
-        parsed = _parse_text_with_model(response_format, text)
+        parsed = _parse_text_with_model(
+            response_format, text, self._client.json_codec.loads
+        )
         setattr(completion, "parsed", parsed)
         for choice in completion.choices:
             setattr(choice.message, "parsed", parsed)
@@ -311,28 +632,68 @@ class Completions:
 
 
 class BetaCompletions(Completions):
+    @overload
     def run_tools(
         self,
         *,
         model: str,
         messages: list[dict[str, Any]],
-        tools: list[Any],
+        tools: list[Any] | ToolSet,
         max_rounds: int = 10,
+        tool_concurrency: int = 1,
+        stream: Literal[False] = False,
         **kwargs: Any,
-    ) -> ChatCompletion:
+    ) -> ChatCompletion: ...
+
+    @overload
+    def run_tools(
+        self,
+        *,
+        model: str,
+        messages: list[dict[str, Any]],
+        tools: list[Any] | ToolSet,
+        max_rounds: int = 10,
+        tool_concurrency: int = 1,
+        stream: Literal[True],
+        **kwargs: Any,
+    ) -> Iterator[ResponseStreamEvent]: ...
+
+    def run_tools(
+        self,
+        *,
+        model: str,
+        messages: list[dict[str, Any]],
+        tools: list[Any] | ToolSet,
+        max_rounds: int = 10,
+        tool_concurrency: int = 1,
+        stream: bool = False,
+        **kwargs: Any,
+    ) -> ChatCompletion | Iterator[ResponseStreamEvent]:
         if max_rounds < 1:
             raise ValueError("max_rounds must be >= 1")
+        if tool_concurrency < 1:
+            raise ValueError("tool_concurrency must be >= 1")
 
-        if kwargs.get("stream"):
-            raise ValueError("run_tools does not support stream=True")
-
-        if not isinstance(tools, list) or not tools:
-            raise ValueError("tools must be a non-empty list")
+        if not isinstance(tools, (list, ToolSet)) or not tools:
+            raise ValueError("tools must be a non-empty list or ToolSet")
 
         tool_functions = _build_tool_function_map(tools)
         if not tool_functions:
             raise ValueError("run_tools requires callable tools")
 
+        if stream:
+            return _stream_tool_rounds(
+                self._client.responses,
+                model=model,
+                messages=messages,
+                tools=tools,
+                tool_functions=tool_functions,
+                max_rounds=max_rounds,
+                tool_concurrency=tool_concurrency,
+                loads=self._client.json_codec.loads,
+                kwargs=kwargs,
+            )
+
         round_input = [dict(message) for message in messages]
         request_kwargs = dict(kwargs)
         previous_response_id = request_kwargs.pop("previous_response_id", None)
@@ -357,29 +718,14 @@ class BetaCompletions(Completions):
                 return completion
 
             previous_response_id = completion.id
-            next_input: list[dict[str, Any]] = []
-
-            for tool_call in tool_calls:
-                fn_name = tool_call.function.name
-                fn = tool_functions.get(fn_name)
-                if fn is None:
-                    raise ValueError(f"No callable tool provided for '{fn_name}'")
-
-                arguments = _parse_tool_arguments(tool_call.function.arguments)
-                output = _run_tool_function(fn=fn, arguments=arguments)
-                if inspect.isawaitable(output):
-                    raise TypeError(
-                        f"Tool '{fn_name}' returned an awaitable; use arun_tools for async tools"
-                    )
-
-                next_input.append(
-                    _build_function_call_output_item(
-                        tool_call_id=tool_call.id,
-                        output=output,
-                    )
-                )
-
-            round_input = next_input
+            calls = _resolve_tool_calls(
+                tool_calls, tool_functions, self._client.json_codec.loads
+            )
+            outputs = _run_sync_tools(calls, tool_concurrency)
+            round_input = [
+                _build_function_call_output_item(tool_call_id=call.call_id, output=output)
+                for call, output in zip(calls, outputs)
+            ]
 
         raise RuntimeError(
             "run_tools exceeded max_rounds without reaching a final response"
@@ -394,6 +740,7 @@ class AsyncCompletions:
         self, *, model: str, messages: list[dict[str, Any]], **kwargs: Any
     ) -> ChatCompletion:
         payload = dict(kwargs)
+        include_raw_response = bool(payload.pop("include_raw_response", False))
         if "response_format" in payload:
             payload["response_format"] = _normalize_response_format(
                 payload["response_format"]
@@ -404,8 +751,11 @@ class AsyncCompletions:
         payload["input"] = messages
 
         response = await self._client.responses.create(**payload)
-        response_data = response.to_dict(exclude_unset=False, exclude_none=False)
-        return _to_chat_completion(response_data=response_data, requested_model=model)
+        return _to_chat_completion(
+            response=response,
+            requested_model=model,
+            include_raw_response=include_raw_response,
+        )
 
     async def aparse(
         self,
@@ -429,7 +779,9 @@ class AsyncCompletions:
         if completion.choices:
             text = completion.choices[0].message.content or ""
 
-        parsed = _parse_text_with_model(response_format, text)
+        parsed = _parse_text_with_model(
+            response_format, text, self._client.json_codec.loads
+        )
         setattr(completion, "parsed", parsed)
         for choice in completion.choices:
             setattr(choice.message, "parsed", parsed)
@@ -437,28 +789,68 @@ class AsyncCompletions:
 
 
 class AsyncBetaCompletions(AsyncCompletions):
+    @overload
     async def arun_tools(
         self,
         *,
         model: str,
         messages: list[dict[str, Any]],
-        tools: list[Any],
+        tools: list[Any] | ToolSet,
         max_rounds: int = 10,
+        tool_concurrency: int = 8,
+        stream: Literal[False] = False,
         **kwargs: Any,
-    ) -> ChatCompletion:
+    ) -> ChatCompletion: ...
+
+    @overload
+    async def arun_tools(
+        self,
+        *,
+        model: str,
+        messages: list[dict[str, Any]],
+        tools: list[Any] | ToolSet,
+        max_rounds: int = 10,
+        tool_concurrency: int = 8,
+        stream: Literal[True],
+        **kwargs: Any,
+    ) -> AsyncIterator[ResponseStreamEvent]: ...
+
+    async def arun_tools(
+        self,
+        *,
+        model: str,
+        messages: list[dict[str, Any]],
+        tools: list[Any] | ToolSet,
+        max_rounds: int = 10,
+        tool_concurrency: int = 8,
+        stream: bool = False,
+        **kwargs: Any,
+    ) -> ChatCompletion | AsyncIterator[ResponseStreamEvent]:
         if max_rounds < 1:
             raise ValueError("max_rounds must be >= 1")
+        if tool_concurrency < 1:
+            raise ValueError("tool_concurrency must be >= 1")
 
-        if kwargs.get("stream"):
-            raise ValueError("arun_tools does not support stream=True")
-
-        if not isinstance(tools, list) or not tools:
-            raise ValueError("tools must be a non-empty list")
+        if not isinstance(tools, (list, ToolSet)) or not tools:
+            raise ValueError("tools must be a non-empty list or ToolSet")
 
         tool_functions = _build_tool_function_map(tools)
         if not tool_functions:
             raise ValueError("arun_tools requires callable tools")
 
+        if stream:
+            return _astream_tool_rounds(
+                self._client.responses,
+                model=model,
+                messages=messages,
+                tools=tools,
+                tool_functions=tool_functions,
+                max_rounds=max_rounds,
+                tool_concurrency=tool_concurrency,
+                loads=self._client.json_codec.loads,
+                kwargs=kwargs,
+            )
+
         round_input = [dict(message) for message in messages]
         request_kwargs = dict(kwargs)
         previous_response_id = request_kwargs.pop("previous_response_id", None)
@@ -483,27 +875,14 @@ class AsyncBetaCompletions(AsyncCompletions):
                 return completion
 
             previous_response_id = completion.id
-            next_input: list[dict[str, Any]] = []
-
-            for tool_call in tool_calls:
-                fn_name = tool_call.function.name
-                fn = tool_functions.get(fn_name)
-                if fn is None:
-                    raise ValueError(f"No callable tool provided for '{fn_name}'")
-
-                arguments = _parse_tool_arguments(tool_call.function.arguments)
-                output = _run_tool_function(fn=fn, arguments=arguments)
-                if inspect.isawaitable(output):
-                    output = await output
-
-                next_input.append(
-                    _build_function_call_output_item(
-                        tool_call_id=tool_call.id,
-                        output=output,
-                    )
-                )
-
-            round_input = next_input
+            calls = _resolve_tool_calls(
+                tool_calls, tool_functions, self._client.json_codec.loads
+            )
+            outputs = await _run_async_tools(calls, tool_concurrency)
+            round_input = [
+                _build_function_call_output_item(tool_call_id=call.call_id, output=output)
+                for call, output in zip(calls, outputs)
+            ]
 
         raise RuntimeError(
             "arun_tools exceeded max_rounds without reaching a final response"
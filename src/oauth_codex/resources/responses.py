@@ -5,7 +5,7 @@ from typing import Any
 
 from oauth_codex._models import BaseModel
 from oauth_codex.tooling import (
-    build_strict_response_format,
+    cached_strict_response_format,
     callable_to_tool_schema,
     to_responses_tools,
 )
@@ -27,7 +27,7 @@ def _is_pydantic_model_type(value: Any) -> bool:
 
 def _normalize_response_format(response_format: Any) -> Any:
     if _is_pydantic_model_type(response_format):
-        return build_strict_response_format(response_format)
+        return cached_strict_response_format(response_format)
     return response_format
 
 
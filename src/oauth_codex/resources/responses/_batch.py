@@ -0,0 +1,239 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from collections.abc import (
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Iterable,
+    Iterator,
+    Mapping,
+    Sized,
+)
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Any
+
+from ...types.responses import Response
+
+
+@dataclass(frozen=True)
+class BatchResult:
+    """Outcome of one `batch_create` item; exactly one of `response` / `error` is set."""
+
+    index: int
+    request: dict[str, Any]
+    response: Response | None = None
+    error: BaseException | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+@dataclass(frozen=True)
+class BatchProgress:
+    total: int | None
+    completed: int
+    succeeded: int
+    failed: int
+
+
+class BatchCancelHandle:
+    """Stops a running `batch_create`.
+
+    After `cancel()` no further requests are sent. The sync client lets
+    in-flight requests finish and yields their results; the async client
+    cancels them.
+    """
+
+    def __init__(self) -> None:
+        self._event = threading.Event()
+        self._callbacks: list[Callable[[], None]] = []
+        self._lock = threading.Lock()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def cancel(self) -> None:
+        with self._lock:
+            if self._event.is_set():
+                return
+            self._event.set()
+            callbacks = list(self._callbacks)
+        for callback in callbacks:
+            callback()
+
+    def _on_cancel(self, callback: Callable[[], None]) -> Callable[[], None]:
+        with self._lock:
+            if not self._event.is_set():
+                self._callbacks.append(callback)
+                return lambda: self._remove_callback(callback)
+        callback()
+        return lambda: None
+
+    def _remove_callback(self, callback: Callable[[], None]) -> None:
+        with self._lock:
+            if callback in self._callbacks:
+                self._callbacks.remove(callback)
+
+
+def _batch_request(request: Mapping[str, Any]) -> dict[str, Any]:
+    kwargs = dict(request)
+    if kwargs.pop("stream", False):
+        raise ValueError("batch_create does not support stream=True")
+    return kwargs
+
+
+class _Progress:
+    def __init__(
+        self,
+        requests: Iterable[Mapping[str, Any]],
+        on_progress: Callable[[BatchProgress], None] | None,
+    ) -> None:
+        self.total = len(requests) if isinstance(requests, Sized) else None
+        self.on_progress = on_progress
+        self.succeeded = 0
+        self.failed = 0
+
+    def record(self, result: BatchResult) -> None:
+        if result.ok:
+            self.succeeded += 1
+        else:
+            self.failed += 1
+        if self.on_progress is not None:
+            self.on_progress(
+                BatchProgress(
+                    total=self.total,
+                    completed=self.succeeded + self.failed,
+                    succeeded=self.succeeded,
+                    failed=self.failed,
+                )
+            )
+
+
+class _Ordering:
+    def __init__(self, ordered: bool) -> None:
+        self.ordered = ordered
+        self.next_index = 0
+        self.buffered: dict[int, BatchResult] = {}
+
+    def push(self, result: BatchResult) -> list[BatchResult]:
+        if not self.ordered:
+            return [result]
+        self.buffered[result.index] = result
+        ready: list[BatchResult] = []
+        while self.next_index in self.buffered:
+            ready.append(self.buffered.pop(self.next_index))
+            self.next_index += 1
+        return ready
+
+
+def iter_batch(
+    create: Callable[..., Any],
+    requests: Iterable[Mapping[str, Any]],
+    *,
+    concurrency: int,
+    ordered: bool,
+    on_progress: Callable[[BatchProgress], None] | None,
+    cancel: BatchCancelHandle | None,
+) -> Iterator[BatchResult]:
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+    progress = _Progress(requests, on_progress)
+    ordering = _Ordering(ordered)
+    pending_items = enumerate(requests)
+
+    def run_one(index: int, request: Mapping[str, Any]) -> BatchResult:
+        kwargs = dict(request)
+        try:
+            kwargs = _batch_request(request)
+            return BatchResult(index=index, request=kwargs, response=create(**kwargs))
+        except Exception as exc:
+            return BatchResult(index=index, request=kwargs, error=exc)
+
+    pool = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="oauth-codex-batch")
+    in_flight: set[Future[BatchResult]] = set()
+    try:
+        while True:
+            while len(in_flight) < concurrency and not (cancel and cancel.cancelled):
+                item = next(pending_items, None)
+                if item is None:
+                    break
+                in_flight.add(pool.submit(run_one, *item))
+            if not in_flight:
+                return
+            done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in sorted(done, key=lambda f: f.result().index):
+                result = future.result()
+                progress.record(result)
+                yield from ordering.push(result)
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+async def aiter_batch(
+    create: Callable[..., Awaitable[Any]],
+    requests: Iterable[Mapping[str, Any]],
+    *,
+    concurrency: int,
+    ordered: bool,
+    on_progress: Callable[[BatchProgress], None] | None,
+    cancel: BatchCancelHandle | None,
+) -> AsyncIterator[BatchResult]:
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+    progress = _Progress(requests, on_progress)
+    ordering = _Ordering(ordered)
+    pending_items = enumerate(requests)
+    loop = asyncio.get_running_loop()
+    cancelled = loop.create_future()
+    unregister: Callable[[], None] = lambda: None
+    if cancel is not None:
+        unregister = cancel._on_cancel(
+            lambda: loop.call_soon_threadsafe(
+                lambda: cancelled.done() or cancelled.set_result(None)
+            )
+        )
+
+    async def run_one(index: int, request: Mapping[str, Any]) -> BatchResult:
+        kwargs = dict(request)
+        try:
+            kwargs = _batch_request(request)
+            return BatchResult(index=index, request=kwargs, response=await create(**kwargs))
+        except Exception as exc:
+            return BatchResult(index=index, request=kwargs, error=exc)
+
+    in_flight: set[asyncio.Future[Any]] = set()
+    try:
+        while not cancelled.done():
+            while len(in_flight) < concurrency:
+                item = next(pending_items, None)
+                if item is None:
+                    break
+                in_flight.add(asyncio.ensure_future(run_one(*item)))
+            if not in_flight:
+                return
+            done, in_flight = await asyncio.wait(
+                in_flight | {cancelled}, return_when=asyncio.FIRST_COMPLETED
+            )
+            in_flight.discard(cancelled)
+            done.discard(cancelled)
+            for task in sorted(done, key=lambda t: t.result().index):
+                result = task.result()
+                progress.record(result)
+                for ready in ordering.push(result):
+                    yield ready
+        # Cancelled: hand back completed results stranded behind cancelled ones.
+        for index in sorted(ordering.buffered):
+            yield ordering.buffered.pop(index)
+    finally:
+        unregister()
+        for task in in_flight:
+            task.cancel()
+        if in_flight:
+            await asyncio.gather(*in_flight, return_exceptions=True)
+        if not cancelled.done():
+            cancelled.cancel()
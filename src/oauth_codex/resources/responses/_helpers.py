@@ -22,8 +22,35 @@ def usage_from_engine(usage: Any) -> TokenUsage | None:
     )
 
 
-def response_from_engine(resp: Any) -> Response:
+def _trusted_usage(usage: Any) -> TokenUsage | None:
+    if isinstance(usage, dict):
+        return TokenUsage.model_construct(**usage)
+    return usage_from_engine(usage)
+
+
+def _trusted_response(resp: dict[str, Any]) -> Response:
+    # Bodies decoded from our own backend already have the declared shapes, so
+    # skip validating (and copying) every output item. Unset fields keep their
+    # defaults; `usage` is still turned into a `TokenUsage`.
+    return Response.model_construct(
+        id=resp.get("id", "") or "",
+        output=resp.get("output", []) or [],
+        output_text=resp.get("output_text", "") or "",
+        usage=_trusted_usage(resp.get("usage", None)),
+        error=resp.get("error", None),
+        reasoning_summary=resp.get("reasoning_summary", None),
+        reasoning_items=resp.get("reasoning_items", []) or [],
+        encrypted_reasoning_content=resp.get("encrypted_reasoning_content", None),
+        finish_reason=resp.get("finish_reason", None),
+        previous_response_id=resp.get("previous_response_id", None),
+        raw_response=resp.get("raw_response", None),
+    )
+
+
+def response_from_engine(resp: Any, *, trusted: bool = False) -> Response:
     if isinstance(resp, dict):
+        if trusted:
+            return _trusted_response(resp)
         return Response(
             id=resp.get("id", ""),
             output=resp.get("output", []) or [],
@@ -79,10 +106,20 @@ def event_from_engine(event: Any) -> ResponseStreamEvent:
 
 
 def iter_engine_events(events: Iterator[Any]) -> Iterator[ResponseStreamEvent]:
-    for event in events:
-        yield event_from_engine(event)
+    try:
+        for event in events:
+            yield event_from_engine(event)
+    finally:
+        close = getattr(events, "close", None)
+        if callable(close):
+            close()
 
 
 async def aiter_engine_events(events: AsyncIterator[Any]) -> AsyncIterator[ResponseStreamEvent]:
-    async for event in events:
-        yield event_from_engine(event)
+    try:
+        async for event in events:
+            yield event_from_engine(event)
+    finally:
+        aclose = getattr(events, "aclose", None)
+        if callable(aclose):
+            await aclose()
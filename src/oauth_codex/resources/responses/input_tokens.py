@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 from ..._resource import AsyncAPIResource, SyncAPIResource
@@ -9,6 +12,7 @@ from .._wrappers import (
     to_raw_response_wrapper,
     to_streamed_response_wrapper,
 )
+from ...cache import response_cache_key
 from ...types.responses import InputTokenCountResponse
 
 
@@ -18,6 +22,24 @@ def _count_result_value(result: Any, field: str) -> Any:
     return getattr(result, field, None)
 
 
+def _count_response(result: Any) -> InputTokenCountResponse:
+    return InputTokenCountResponse(
+        input_tokens=_count_result_value(result, "input_tokens"),
+        cached_tokens=_count_result_value(result, "cached_tokens"),
+        total_tokens=_count_result_value(result, "total_tokens"),
+    )
+
+
+def _unique_inputs(inputs: Iterable[Any]) -> tuple[list[str], dict[str, Any]]:
+    keys: list[str] = []
+    unique: dict[str, Any] = {}
+    for item in inputs:
+        key = response_cache_key(item)
+        keys.append(key)
+        unique.setdefault(key, item)
+    return keys, unique
+
+
 class InputTokens(SyncAPIResource):
     def count(
         self,
@@ -25,17 +47,65 @@ class InputTokens(SyncAPIResource):
         input: Any,
         model: str | None = None,
         tools: list[Any] | None = None,
+        cache: bool = True,
         **_: Any,
     ) -> InputTokenCountResponse:
         result = self._client._engine.responses_input_tokens_count(
             model=model or "",
             input=input,
             tools=tools,
+            cache=cache,
         )
-        return InputTokenCountResponse(
-            input_tokens=_count_result_value(result, "input_tokens"),
-            cached_tokens=_count_result_value(result, "cached_tokens"),
-            total_tokens=_count_result_value(result, "total_tokens"),
+        return _count_response(result)
+
+    def count_many(
+        self,
+        inputs: Iterable[Any],
+        *,
+        model: str | None = None,
+        tools: list[Any] | None = None,
+        concurrency: int = 8,
+        cache: bool = True,
+    ) -> list[InputTokenCountResponse]:
+        keys, unique = _unique_inputs(inputs)
+        if not unique:
+            return []
+
+        def count_one(item: Any) -> InputTokenCountResponse:
+            return self.count(input=item, model=model, tools=tools, cache=cache)
+
+        workers = max(1, min(concurrency, len(unique)))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            counts = dict(zip(unique, pool.map(count_one, unique.values())))
+        return [counts[key] for key in keys]
+
+    def estimate(
+        self,
+        *,
+        input: Any,
+        model: str | None = None,
+        tools: list[Any] | None = None,
+        instructions: str | None = None,
+    ) -> int:
+        return self._client._engine.estimate_input_tokens(
+            input=input, model=model, tools=tools, instructions=instructions
+        )
+
+    def calibrate(
+        self,
+        *,
+        input: Any,
+        actual_tokens: int,
+        model: str | None = None,
+        tools: list[Any] | None = None,
+        instructions: str | None = None,
+    ) -> None:
+        self._client._engine.calibrate_input_tokens(
+            input=input,
+            actual_tokens=actual_tokens,
+            model=model,
+            tools=tools,
+            instructions=instructions,
         )
 
     @property
@@ -54,17 +124,64 @@ class AsyncInputTokens(AsyncAPIResource):
         input: Any,
         model: str | None = None,
         tools: list[Any] | None = None,
+        cache: bool = True,
         **_: Any,
     ) -> InputTokenCountResponse:
         result = await self._client._engine.aresponses_input_tokens_count(
             model=model or "",
             input=input,
             tools=tools,
+            cache=cache,
         )
-        return InputTokenCountResponse(
-            input_tokens=_count_result_value(result, "input_tokens"),
-            cached_tokens=_count_result_value(result, "cached_tokens"),
-            total_tokens=_count_result_value(result, "total_tokens"),
+        return _count_response(result)
+
+    async def count_many(
+        self,
+        inputs: Iterable[Any],
+        *,
+        model: str | None = None,
+        tools: list[Any] | None = None,
+        concurrency: int = 8,
+        cache: bool = True,
+    ) -> list[InputTokenCountResponse]:
+        keys, unique = _unique_inputs(inputs)
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+
+        async def count_one(item: Any) -> InputTokenCountResponse:
+            async with semaphore:
+                return await self.count(input=item, model=model, tools=tools, cache=cache)
+
+        results = await asyncio.gather(*(count_one(item) for item in unique.values()))
+        counts = dict(zip(unique, results))
+        return [counts[key] for key in keys]
+
+    def estimate(
+        self,
+        *,
+        input: Any,
+        model: str | None = None,
+        tools: list[Any] | None = None,
+        instructions: str | None = None,
+    ) -> int:
+        return self._client._engine.estimate_input_tokens(
+            input=input, model=model, tools=tools, instructions=instructions
+        )
+
+    def calibrate(
+        self,
+        *,
+        input: Any,
+        actual_tokens: int,
+        model: str | None = None,
+        tools: list[Any] | None = None,
+        instructions: str | None = None,
+    ) -> None:
+        self._client._engine.calibrate_input_tokens(
+            input=input,
+            actual_tokens=actual_tokens,
+            model=model,
+            tools=tools,
+            instructions=instructions,
         )
 
     @property
@@ -1,12 +1,22 @@
 from __future__ import annotations
 
-import json
-from typing import Any, AsyncIterator, Iterator, Literal, cast, overload
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Iterable,
+    Iterator,
+    Literal,
+    Mapping,
+    cast,
+    overload,
+)
 
 from ..._resource import AsyncAPIResource, SyncAPIResource
 from ...core_types import Message, ToolInput, ToolResult, TruncationMode, ValidationMode
 from ...tooling import (
-    build_strict_response_format,
+    ToolSet,
+    cached_strict_response_format,
     callable_to_tool_schema,
     to_responses_tools,
 )
@@ -17,6 +27,13 @@ from .._wrappers import (
     to_raw_response_wrapper,
     to_streamed_response_wrapper,
 )
+from ._batch import (
+    BatchCancelHandle,
+    BatchProgress,
+    BatchResult,
+    aiter_batch,
+    iter_batch,
+)
 from ._helpers import aiter_engine_events, iter_engine_events, response_from_engine
 from .input_tokens import (
     AsyncInputTokens,
@@ -44,11 +61,13 @@ def _is_pydantic_model_type(value: Any) -> bool:
 
 def _normalize_response_format(response_format: Any) -> Any:
     if _is_pydantic_model_type(response_format):
-        return build_strict_response_format(response_format)
+        return cached_strict_response_format(response_format)
     return response_format
 
 
-def _normalize_tools(tools: list[ToolInput] | None) -> list[Any] | None:
+def _normalize_tools(tools: list[ToolInput] | ToolSet | None) -> list[Any] | None:
+    if isinstance(tools, ToolSet):
+        return tools.schemas
     if not isinstance(tools, list):
         return tools
 
@@ -61,11 +80,13 @@ def _normalize_tools(tools: list[ToolInput] | None) -> list[Any] | None:
     return normalized
 
 
-def _parse_text_with_model(response_format: type[Any], text: str) -> Any:
+def _parse_text_with_model(
+    response_format: type[Any], text: str, loads: Callable[[str], Any]
+) -> Any:
     try:
         return response_format.model_validate_json(text)
     except Exception:
-        return response_format.model_validate(json.loads(text))
+        return response_format.model_validate(loads(text))
 
 
 class Responses(SyncAPIResource):
@@ -80,7 +101,7 @@ class Responses(SyncAPIResource):
         model: str,
         input: str | Message | list[Message] | None = None,
         messages: list[Message] | None = None,
-        tools: list[ToolInput] | None = None,
+        tools: list[ToolInput] | ToolSet | None = None,
         tool_results: list[ToolResult] | None = None,
         response_format: dict[str, Any] | type[Any] | None = None,
         tool_choice: str | dict[str, Any] | None = None,
@@ -103,6 +124,7 @@ class Responses(SyncAPIResource):
         service_tier: str | None = None,
         stream: Literal[False] = False,
         validation_mode: ValidationMode | None = None,
+        cache: bool | None = None,
         **extra: Any,
     ) -> Response: ...
 
@@ -113,7 +135,7 @@ class Responses(SyncAPIResource):
         model: str,
         input: str | Message | list[Message] | None = None,
         messages: list[Message] | None = None,
-        tools: list[ToolInput] | None = None,
+        tools: list[ToolInput] | ToolSet | None = None,
         tool_results: list[ToolResult] | None = None,
         response_format: dict[str, Any] | type[Any] | None = None,
         tool_choice: str | dict[str, Any] | None = None,
@@ -136,6 +158,7 @@ class Responses(SyncAPIResource):
         service_tier: str | None = None,
         stream: Literal[True],
         validation_mode: ValidationMode | None = None,
+        cache: bool | None = None,
         **extra: Any,
     ) -> Iterator[ResponseStreamEvent]: ...
 
@@ -145,7 +168,7 @@ class Responses(SyncAPIResource):
         model: str,
         input: str | Message | list[Message] | None = None,
         messages: list[Message] | None = None,
-        tools: list[ToolInput] | None = None,
+        tools: list[ToolInput] | ToolSet | None = None,
         tool_results: list[ToolResult] | None = None,
         response_format: dict[str, Any] | type[Any] | None = None,
         tool_choice: str | dict[str, Any] | None = None,
@@ -168,6 +191,7 @@ class Responses(SyncAPIResource):
         service_tier: str | None = None,
         stream: bool = False,
         validation_mode: ValidationMode | None = None,
+        cache: bool | None = None,
         **extra: Any,
     ) -> Response | Iterator[ResponseStreamEvent]:
         response_format = _normalize_response_format(response_format)
@@ -199,11 +223,12 @@ class Responses(SyncAPIResource):
             service_tier=service_tier,
             stream=stream,
             validation_mode=validation_mode,
+            cache=cache,
             **extra,
         )
         if stream:
             return iter_engine_events(out)
-        return response_from_engine(out)
+        return response_from_engine(out, trusted=self._client.trusted_responses)
 
     def parse(
         self,
@@ -224,7 +249,9 @@ class Responses(SyncAPIResource):
         if not isinstance(response, Response):
             raise TypeError("parse does not support stream=True")
 
-        parsed = _parse_text_with_model(response_format, response.output_text)
+        parsed = _parse_text_with_model(
+            response_format, response.output_text, self._client.json_codec.loads
+        )
         setattr(response, "parsed", parsed)
         return response
 
@@ -234,7 +261,7 @@ class Responses(SyncAPIResource):
         model: str,
         input: str | Message | list[Message] | None = None,
         messages: list[Message] | None = None,
-        tools: list[ToolInput] | None = None,
+        tools: list[ToolInput] | ToolSet | None = None,
         tool_results: list[ToolResult] | None = None,
         response_format: dict[str, Any] | type[Any] | None = None,
         tool_choice: str | dict[str, Any] | None = None,
@@ -288,6 +315,24 @@ class Responses(SyncAPIResource):
             **extra,
         )
 
+    def batch_create(
+        self,
+        requests: Iterable[Mapping[str, Any]],
+        *,
+        concurrency: int = 8,
+        ordered: bool = True,
+        on_progress: Callable[[BatchProgress], None] | None = None,
+        cancel: BatchCancelHandle | None = None,
+    ) -> Iterator[BatchResult]:
+        return iter_batch(
+            self.create,
+            requests,
+            concurrency=concurrency,
+            ordered=ordered,
+            on_progress=on_progress,
+            cancel=cancel,
+        )
+
     @property
     def with_raw_response(self) -> Any:
         return ResponsesWithRawResponse(self)
@@ -309,7 +354,7 @@ class AsyncResponses(AsyncAPIResource):
         model: str,
         input: str | Message | list[Message] | None = None,
         messages: list[Message] | None = None,
-        tools: list[ToolInput] | None = None,
+        tools: list[ToolInput] | ToolSet | None = None,
         tool_results: list[ToolResult] | None = None,
         response_format: dict[str, Any] | type[Any] | None = None,
         tool_choice: str | dict[str, Any] | None = None,
@@ -332,6 +377,7 @@ class AsyncResponses(AsyncAPIResource):
         service_tier: str | None = None,
         stream: Literal[False] = False,
         validation_mode: ValidationMode | None = None,
+        cache: bool | None = None,
         **extra: Any,
     ) -> Response: ...
 
@@ -342,7 +388,7 @@ class AsyncResponses(AsyncAPIResource):
         model: str,
         input: str | Message | list[Message] | None = None,
         messages: list[Message] | None = None,
-        tools: list[ToolInput] | None = None,
+        tools: list[ToolInput] | ToolSet | None = None,
         tool_results: list[ToolResult] | None = None,
         response_format: dict[str, Any] | type[Any] | None = None,
         tool_choice: str | dict[str, Any] | None = None,
@@ -365,6 +411,7 @@ class AsyncResponses(AsyncAPIResource):
         service_tier: str | None = None,
         stream: Literal[True],
         validation_mode: ValidationMode | None = None,
+        cache: bool | None = None,
         **extra: Any,
     ) -> AsyncIterator[ResponseStreamEvent]: ...
 
@@ -374,7 +421,7 @@ class AsyncResponses(AsyncAPIResource):
         model: str,
         input: str | Message | list[Message] | None = None,
         messages: list[Message] | None = None,
-        tools: list[ToolInput] | None = None,
+        tools: list[ToolInput] | ToolSet | None = None,
         tool_results: list[ToolResult] | None = None,
         response_format: dict[str, Any] | type[Any] | None = None,
         tool_choice: str | dict[str, Any] | None = None,
@@ -397,6 +444,7 @@ class AsyncResponses(AsyncAPIResource):
         service_tier: str | None = None,
         stream: bool = False,
         validation_mode: ValidationMode | None = None,
+        cache: bool | None = None,
         **extra: Any,
     ) -> Response | AsyncIterator[ResponseStreamEvent]:
         response_format = _normalize_response_format(response_format)
@@ -428,11 +476,12 @@ class AsyncResponses(AsyncAPIResource):
             service_tier=service_tier,
             stream=stream,
             validation_mode=validation_mode,
+            cache=cache,
             **extra,
         )
         if stream:
             return aiter_engine_events(out)
-        return response_from_engine(out)
+        return response_from_engine(out, trusted=self._client.trusted_responses)
 
     async def aparse(
         self,
@@ -453,7 +502,9 @@ class AsyncResponses(AsyncAPIResource):
         if not isinstance(response, Response):
             raise TypeError("aparse does not support stream=True")
 
-        parsed = _parse_text_with_model(response_format, response.output_text)
+        parsed = _parse_text_with_model(
+            response_format, response.output_text, self._client.json_codec.loads
+        )
         setattr(response, "parsed", parsed)
         return response
 
@@ -463,7 +514,7 @@ class AsyncResponses(AsyncAPIResource):
         model: str,
         input: str | Message | list[Message] | None = None,
         messages: list[Message] | None = None,
-        tools: list[ToolInput] | None = None,
+        tools: list[ToolInput] | ToolSet | None = None,
         tool_results: list[ToolResult] | None = None,
         response_format: dict[str, Any] | type[Any] | None = None,
         tool_choice: str | dict[str, Any] | None = None,
@@ -517,6 +568,24 @@ class AsyncResponses(AsyncAPIResource):
             **extra,
         )
 
+    async def batch_create(
+        self,
+        requests: Iterable[Mapping[str, Any]],
+        *,
+        concurrency: int = 8,
+        ordered: bool = True,
+        on_progress: Callable[[BatchProgress], None] | None = None,
+        cancel: BatchCancelHandle | None = None,
+    ) -> AsyncIterator[BatchResult]:
+        return aiter_batch(
+            self.create,
+            requests,
+            concurrency=concurrency,
+            ordered=ordered,
+            on_progress=on_progress,
+            cancel=cancel,
+        )
+
     @property
     def with_raw_response(self) -> Any:
         return AsyncResponsesWithRawResponse(self)
@@ -3,8 +3,12 @@ from __future__ import annotations
 import copy
 import inspect
 import json
-from types import UnionType
-from typing import Any, get_args, get_origin, get_type_hints
+import threading
+import weakref
+from collections import OrderedDict
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from types import MappingProxyType, UnionType
+from typing import Any, cast, get_args, get_origin, get_type_hints
 
 from .core_types import ToolInput, ToolResult, ToolSchema
 from .errors import SDKRequestError
@@ -172,7 +176,122 @@ def _ensure_strict_json_schema(
     return json_schema
 
 
+def _copy_json(value: Any) -> Any:
+    # Schemas are plain JSON trees; this is much cheaper than copy.deepcopy.
+    if isinstance(value, dict):
+        return {key: _copy_json(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_copy_json(item) for item in value]
+    return value
+
+
+def _read_only(self: Any, *args: Any, **kwargs: Any) -> Any:
+    raise TypeError("cached response_format is read-only; copy it before modifying")
+
+
+class _FrozenDict(dict):  # type: ignore[type-arg]
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    def __copy__(self) -> dict[str, Any]:
+        return dict(self)
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> Any:
+        return _copy_json(self)
+
+    def __reduce__(self) -> Any:
+        return (dict, (_copy_json(self),))
+
+
+class _FrozenList(list):  # type: ignore[type-arg]
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _read_only
+    append = extend = insert = pop = remove = clear = sort = reverse = _read_only
+
+    def __copy__(self) -> list[Any]:
+        return list(self)
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> Any:
+        return _copy_json(self)
+
+    def __reduce__(self) -> Any:
+        return (list, (_copy_json(self),))
+
+
+class _ToolSetSchemas(_FrozenList):
+    """A `ToolSet`'s frozen `tools` array together with its JSON encodings."""
+
+    encoded_json: bytes
+    encoded_by_codec: dict[str, bytes]
+
+    def __init__(self, schemas: Iterable[Any], encoded_json: bytes) -> None:
+        super().__init__(schemas)
+        self.encoded_json = encoded_json
+        # Keyed by codec name; each codec encodes the array at most once.
+        self.encoded_by_codec = {"stdlib": encoded_json}
+
+
+def _freeze_json(value: Any) -> Any:
+    if isinstance(value, dict):
+        return _FrozenDict((key, _freeze_json(item)) for key, item in value.items())
+    if isinstance(value, list):
+        return _FrozenList(_freeze_json(item) for item in value)
+    return value
+
+
+# Compiled strict formats: per model class (weakly, so dynamic models can be
+# collected) and per canonical JSON of a dict schema (bounded LRU).
+_STRICT_MODEL_FORMAT_CACHE: weakref.WeakKeyDictionary[type[Any], dict[str, Any]] = (
+    weakref.WeakKeyDictionary()
+)
+_STRICT_DICT_FORMAT_CACHE: OrderedDict[str, dict[str, Any]] = OrderedDict()
+_STRICT_DICT_FORMAT_CACHE_SIZE = 256
+_STRICT_FORMAT_CACHE_LOCK = threading.Lock()
+
+
+def cached_strict_response_format(
+    output_schema: type[Any] | dict[str, Any],
+) -> dict[str, Any]:
+    """Like `build_strict_response_format`, but returns a shared read-only result.
+
+    The schema is compiled once per model class or dict schema; later calls
+    only do a cache lookup. Copy the result before modifying it.
+    """
+    if _is_pydantic_model_type(output_schema):
+        model_type = cast(type[Any], output_schema)
+        with _STRICT_FORMAT_CACHE_LOCK:
+            cached = _STRICT_MODEL_FORMAT_CACHE.get(model_type)
+        if cached is None:
+            cached = _freeze_json(_compile_strict_response_format(model_type))
+            with _STRICT_FORMAT_CACHE_LOCK:
+                _STRICT_MODEL_FORMAT_CACHE[model_type] = cached
+        return cached
+
+    if not isinstance(output_schema, dict):
+        return _compile_strict_response_format(output_schema)
+    try:
+        fingerprint = json.dumps(output_schema, sort_keys=True, separators=(",", ":"))
+    except (TypeError, ValueError):
+        return _freeze_json(_compile_strict_response_format(output_schema))
+    with _STRICT_FORMAT_CACHE_LOCK:
+        cached = _STRICT_DICT_FORMAT_CACHE.get(fingerprint)
+        if cached is not None:
+            _STRICT_DICT_FORMAT_CACHE.move_to_end(fingerprint)
+            return cached
+    cached = _freeze_json(_compile_strict_response_format(output_schema))
+    with _STRICT_FORMAT_CACHE_LOCK:
+        _STRICT_DICT_FORMAT_CACHE[fingerprint] = cached
+        while len(_STRICT_DICT_FORMAT_CACHE) > _STRICT_DICT_FORMAT_CACHE_SIZE:
+            _STRICT_DICT_FORMAT_CACHE.popitem(last=False)
+    return cached
+
+
 def build_strict_response_format(output_schema: type[Any] | dict[str, Any]) -> dict[str, Any]:
+    return cast(dict[str, Any], _copy_json(cached_strict_response_format(output_schema)))
+
+
+def _compile_strict_response_format(
+    output_schema: type[Any] | dict[str, Any],
+) -> dict[str, Any]:
     name = "output"
     description: str | None = None
 
@@ -283,7 +402,38 @@ def _python_type_to_schema(annotation: Any) -> dict[str, Any]:
     return {"type": "string"}
 
 
+# Generated schemas per function object; weak keys let unloaded tools go away.
+_TOOL_SCHEMA_CACHE: weakref.WeakKeyDictionary[Any, ToolSchema] = weakref.WeakKeyDictionary()
+_BOUND_TOOL_SCHEMA_CACHE: weakref.WeakKeyDictionary[Any, ToolSchema] = (
+    weakref.WeakKeyDictionary()
+)
+_TOOL_SCHEMA_CACHE_LOCK = threading.Lock()
+
+
 def callable_to_tool_schema(func: Any) -> ToolSchema:
+    # Bound methods are recreated on every attribute access, so key them by the
+    # underlying function instead of the short-lived method object.
+    if inspect.ismethod(func):
+        cache, key = _BOUND_TOOL_SCHEMA_CACHE, func.__func__
+    else:
+        cache, key = _TOOL_SCHEMA_CACHE, func
+    try:
+        with _TOOL_SCHEMA_CACHE_LOCK:
+            schema = cache.get(key)
+    except TypeError:
+        # Unhashable or not weak-referenceable callables are not cached.
+        return _build_tool_schema(func)
+    if schema is None:
+        schema = _build_tool_schema(func)
+        try:
+            with _TOOL_SCHEMA_CACHE_LOCK:
+                cache[key] = schema
+        except TypeError:
+            pass
+    return _copy_json(schema)
+
+
+def _build_tool_schema(func: Any) -> ToolSchema:
     signature = inspect.signature(func)
     try:
         resolved_hints = get_type_hints(func)
@@ -441,3 +591,61 @@ def tool_results_to_response_items(tool_results: list[ToolResult] | None) -> lis
             }
         )
     return items
+
+
+class ToolSet:
+    """Tools compiled once for reuse across requests.
+
+    Callables are turned into Responses API function tools up front, and dict
+    tools are kept as given. The result can be passed anywhere `tools=` is
+    accepted, including `beta.chat.completions.run_tools` / `arun_tools`,
+    without re-inspecting the callables or rebuilding the dispatch table.
+    """
+
+    def __init__(self, tools: Iterable[ToolInput]) -> None:
+        schemas: list[Any] = []
+        functions: dict[str, Callable[..., Any]] = {}
+        for tool in tools:
+            if callable(tool):
+                schema = to_responses_tools([callable_to_tool_schema(tool)])[0]
+                name = schema["name"]
+                if name in functions:
+                    raise ValueError(f"Duplicate tool name: {name!r}")
+                functions[name] = tool
+                schemas.append(schema)
+            elif isinstance(tool, dict):
+                schemas.append(tool)
+            else:
+                raise TypeError("Tool must be a callable or dict schema")
+        frozen = _freeze_json(schemas)
+        # Request encoding splices these bytes in instead of re-encoding the tools.
+        self._json = json.dumps(
+            frozen, separators=(",", ":"), ensure_ascii=False, allow_nan=False
+        ).encode("utf-8")
+        self._schemas = _ToolSetSchemas(frozen, self._json)
+        self._functions = MappingProxyType(functions)
+
+    @property
+    def schemas(self) -> list[Any]:
+        """The read-only `tools` array sent with each request."""
+        return self._schemas
+
+    @property
+    def functions(self) -> Mapping[str, Callable[..., Any]]:
+        """Callable tools by name."""
+        return self._functions
+
+    @property
+    def json(self) -> bytes:
+        """The `tools` array serialized once as compact JSON."""
+        return self._json
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self._schemas)
+
+    def __len__(self) -> int:
+        return len(self._schemas)
+
+    def __repr__(self) -> str:
+        names = [schema.get("name", schema.get("type")) for schema in self._schemas]
+        return f"ToolSet({names!r})"
@@ -0,0 +1,211 @@
+from __future__ import annotations
+
+import asyncio
+import datetime
+import ipaddress
+import json
+import ssl
+import tempfile
+from pathlib import Path
+from typing import Any
+
+import h11
+import h2.config
+import h2.connection
+import h2.events
+from cryptography import x509
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import ec
+from cryptography.x509.oid import NameOID
+
+
+def _write_self_signed_cert(directory: Path) -> tuple[Path, Path]:
+    key = ec.generate_private_key(ec.SECP256R1())
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, "localhost")])
+    now = datetime.datetime.now(datetime.timezone.utc)
+    cert = (
+        x509.CertificateBuilder()
+        .subject_name(name)
+        .issuer_name(name)
+        .public_key(key.public_key())
+        .serial_number(x509.random_serial_number())
+        .not_valid_before(now - datetime.timedelta(minutes=5))
+        .not_valid_after(now + datetime.timedelta(days=1))
+        .add_extension(
+            x509.SubjectAlternativeName(
+                [
+                    x509.DNSName("localhost"),
+                    x509.IPAddress(ipaddress.ip_address("127.0.0.1")),
+                ]
+            ),
+            critical=False,
+        )
+        .add_extension(x509.BasicConstraints(ca=True, path_length=None), critical=True)
+        .sign(key, hashes.SHA256())
+    )
+    cert_path = directory / "cert.pem"
+    key_path = directory / "key.pem"
+    cert_path.write_bytes(cert.public_bytes(serialization.Encoding.PEM))
+    key_path.write_bytes(
+        key.private_bytes(
+            serialization.Encoding.PEM,
+            serialization.PrivateFormat.PKCS8,
+            serialization.NoEncryption(),
+        )
+    )
+    return cert_path, key_path
+
+
+class LocalStreamServer:
+    """TLS stand-in for the `/responses` SSE endpoint speaking h2 and HTTP/1.1.
+
+    The protocol is chosen per connection through ALPN. Every request is
+    answered with `chunks` text deltas followed by a `done` event, waiting
+    `chunk_delay` seconds between frames.
+    """
+
+    def __init__(self, *, chunks: int = 3, chunk_delay: float = 0.0) -> None:
+        self.chunks = chunks
+        self.chunk_delay = chunk_delay
+        self.connections = 0
+        self.protocols: list[str] = []
+        self.requests = 0
+        self._tmpdir: tempfile.TemporaryDirectory[str] | None = None
+        self._server: asyncio.AbstractServer | None = None
+        self.cafile = ""
+        self.port = 0
+
+    @property
+    def base_url(self) -> str:
+        return f"https://localhost:{self.port}"
+
+    async def __aenter__(self) -> LocalStreamServer:
+        self._tmpdir = tempfile.TemporaryDirectory()
+        cert_path, key_path = _write_self_signed_cert(Path(self._tmpdir.name))
+        self.cafile = str(cert_path)
+
+        context = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
+        context.load_cert_chain(cert_path, key_path)
+        context.set_alpn_protocols(["h2", "http/1.1"])
+
+        self._server = await asyncio.start_server(
+            self._handle, "127.0.0.1", 0, ssl=context, backlog=2048
+        )
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        if self._tmpdir is not None:
+            self._tmpdir.cleanup()
+
+    def _frames(self) -> list[bytes]:
+        events: list[dict[str, Any]] = [
+            {"type": "text_delta", "delta": f"chunk-{index}"}
+            for index in range(self.chunks)
+        ]
+        events.append({"type": "done"})
+        return [f"data: {json.dumps(event)}\n\n".encode() for event in events]
+
+    async def _handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        self.connections += 1
+        ssl_object = writer.get_extra_info("ssl_object")
+        protocol = ssl_object.selected_alpn_protocol() if ssl_object else None
+        self.protocols.append(protocol or "http/1.1")
+        try:
+            if protocol == "h2":
+                await self._serve_h2(reader, writer)
+            else:
+                await self._serve_h11(reader, writer)
+        except (ConnectionError, asyncio.IncompleteReadError, ssl.SSLError):
+            pass
+        finally:
+            writer.close()
+
+    async def _serve_h2(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        conn = h2.connection.H2Connection(
+            config=h2.config.H2Configuration(client_side=False)
+        )
+        conn.initiate_connection()
+        writer.write(conn.data_to_send())
+        tasks: set[asyncio.Task[None]] = set()
+
+        async def respond(stream_id: int) -> None:
+            conn.send_headers(
+                stream_id,
+                [(":status", "200"), ("content-type", "text/event-stream")],
+            )
+            writer.write(conn.data_to_send())
+            for frame in self._frames():
+                if self.chunk_delay:
+                    await asyncio.sleep(self.chunk_delay)
+                conn.send_data(stream_id, frame)
+                writer.write(conn.data_to_send())
+            conn.end_stream(stream_id)
+            writer.write(conn.data_to_send())
+            await writer.drain()
+
+        while True:
+            data = await reader.read(65535)
+            if not data:
+                break
+            for event in conn.receive_data(data):
+                if isinstance(event, h2.events.DataReceived):
+                    conn.acknowledge_received_data(
+                        event.flow_controlled_length, event.stream_id
+                    )
+                elif isinstance(event, h2.events.StreamEnded):
+                    self.requests += 1
+                    task = asyncio.create_task(respond(event.stream_id))
+                    tasks.add(task)
+                    task.add_done_callback(tasks.discard)
+                elif isinstance(event, h2.events.ConnectionTerminated):
+                    return
+            writer.write(conn.data_to_send())
+            await writer.drain()
+
+    async def _serve_h11(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        conn = h11.Connection(h11.SERVER)
+        while True:
+            event = conn.next_event()
+            if event is h11.NEED_DATA:
+                data = await reader.read(65535)
+                conn.receive_data(data)
+                if not data:
+                    return
+                continue
+            if isinstance(event, h11.ConnectionClosed):
+                return
+            if not isinstance(event, h11.EndOfMessage):
+                continue
+
+            self.requests += 1
+            writer.write(
+                conn.send(
+                    h11.Response(
+                        status_code=200,
+                        headers=[
+                            ("content-type", "text/event-stream"),
+                            ("transfer-encoding", "chunked"),
+                        ],
+                    )
+                )
+            )
+            for frame in self._frames():
+                if self.chunk_delay:
+                    await asyncio.sleep(self.chunk_delay)
+                writer.write(conn.send(h11.Data(data=frame)))
+                await writer.drain()
+            writer.write(conn.send(h11.EndOfMessage()))
+            await writer.drain()
+            if conn.our_state is not h11.DONE:
+                return
+            conn.start_next_cycle()
@@ -7,6 +7,7 @@ import pytest
 import oauth_codex
 from conftest import InMemoryTokenStore
 from oauth_codex.core_types import OAuthTokens
+from oauth_codex.types.responses import Response
 
 
 def _client() -> Any:
@@ -40,12 +41,8 @@ def _async_client() -> Any:
     )
 
 
-class _StubResponse:
-    def __init__(self, payload: dict[str, Any]) -> None:
-        self._payload = payload
-
-    def to_dict(self, **_kwargs: Any) -> dict[str, Any]:
-        return self._payload
+def _response(payload: dict[str, Any]) -> Response:
+    return Response.model_validate(payload)
 
 
 def test_run_tools_uses_previous_response_id_and_function_call_output(
@@ -59,7 +56,7 @@ def test_run_tools_uses_previous_response_id_and_function_call_output(
         call_count["n"] += 1
         captured_calls.append(dict(kwargs))
         if call_count["n"] == 1:
-            return _StubResponse(
+            return _response(
                 {
                     "id": "resp_1",
                     "model": "gpt-5.3-codex",
@@ -74,7 +71,7 @@ def test_run_tools_uses_previous_response_id_and_function_call_output(
                     "finish_reason": "tool_calls",
                 }
             )
-        return _StubResponse(
+        return _response(
             {
                 "id": "resp_2",
                 "model": "gpt-5.3-codex",
@@ -118,7 +115,7 @@ def test_run_tools_keeps_first_previous_response_id_then_rolls_forward(
         call_count["n"] += 1
         captured_calls.append(dict(kwargs))
         if call_count["n"] == 1:
-            return _StubResponse(
+            return _response(
                 {
                     "id": "resp_after_first",
                     "model": "gpt-5.3-codex",
@@ -132,7 +129,7 @@ def test_run_tools_keeps_first_previous_response_id_then_rolls_forward(
                     ],
                 }
             )
-        return _StubResponse(
+        return _response(
             {
                 "id": "resp_done",
                 "model": "gpt-5.3-codex",
@@ -169,7 +166,7 @@ def test_run_tools_serializes_non_string_tool_output(
         call_count["n"] += 1
         captured_calls.append(dict(kwargs))
         if call_count["n"] == 1:
-            return _StubResponse(
+            return _response(
                 {
                     "id": "resp_1",
                     "model": "gpt-5.3-codex",
@@ -183,7 +180,7 @@ def test_run_tools_serializes_non_string_tool_output(
                     ],
                 }
             )
-        return _StubResponse(
+        return _response(
             {
                 "id": "resp_2",
                 "model": "gpt-5.3-codex",
@@ -221,7 +218,7 @@ async def test_arun_tools_contract_matches_responses_loop(
         call_count["n"] += 1
         captured_calls.append(dict(kwargs))
         if call_count["n"] == 1:
-            return _StubResponse(
+            return _response(
                 {
                     "id": "resp_async_1",
                     "model": "gpt-5.3-codex",
@@ -236,7 +233,7 @@ async def test_arun_tools_contract_matches_responses_loop(
                     "finish_reason": "tool_calls",
                 }
             )
-        return _StubResponse(
+        return _response(
             {
                 "id": "resp_async_2",
                 "model": "gpt-5.3-codex",
@@ -279,7 +276,7 @@ def test_run_tools_handles_multi_round_and_multi_tool_calls(
         call_count["n"] += 1
         captured_calls.append(dict(kwargs))
         if call_count["n"] == 1:
-            return _StubResponse(
+            return _response(
                 {
                     "id": "resp_round_1",
                     "model": "gpt-5.3-codex",
@@ -301,7 +298,7 @@ def test_run_tools_handles_multi_round_and_multi_tool_calls(
                 }
             )
         if call_count["n"] == 2:
-            return _StubResponse(
+            return _response(
                 {
                     "id": "resp_round_2",
                     "model": "gpt-5.3-codex",
@@ -316,7 +313,7 @@ def test_run_tools_handles_multi_round_and_multi_tool_calls(
                     "finish_reason": "tool_calls",
                 }
             )
-        return _StubResponse(
+        return _response(
             {
                 "id": "resp_final",
                 "model": "gpt-5.3-codex",
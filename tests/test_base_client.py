@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import sys
+
+import httpx
+import pytest
+
+from conftest import InMemoryTokenStore
+from oauth_codex import APIPoolTimeoutError, APITimeoutError, AsyncClient, Client
+from oauth_codex.core_types import OAuthTokens
+
+
+def _tokens() -> OAuthTokens:
+    return OAuthTokens(access_token="a", refresh_token="r", expires_at=9_999_999_999)
+
+
+def test_client_applies_pool_configuration_to_owned_http_client() -> None:
+    client = Client(
+        token_store=InMemoryTokenStore(_tokens()),
+        timeout=30.0,
+        max_connections=250,
+        max_keepalive_connections=50,
+        keepalive_expiry=15.0,
+        pool_timeout=2.5,
+    )
+
+    pool = client._client._transport._pool
+    assert pool._max_connections == 250
+    assert pool._max_keepalive_connections == 50
+    assert pool._keepalive_expiry == 15.0
+    assert client._client.timeout.pool == 2.5
+    assert client._client.timeout.read == 30.0
+
+
+def test_client_keeps_injected_http_client_open_on_close() -> None:
+    http_client = httpx.Client()
+    client = Client(token_store=InMemoryTokenStore(_tokens()), http_client=http_client)
+
+    client.close()
+
+    assert client._client is http_client
+    assert not http_client.is_closed
+
+
+def test_pool_timeout_raises_dedicated_error_without_retrying() -> None:
+    attempts = {"n": 0}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        attempts["n"] += 1
+        raise httpx.PoolTimeout("pool exhausted", request=request)
+
+    client = Client(
+        token_store=InMemoryTokenStore(_tokens()),
+        http_client=httpx.Client(transport=httpx.MockTransport(handler)),
+        max_retries=3,
+    )
+
+    with pytest.raises(APIPoolTimeoutError) as exc_info:
+        client.request("GET", "/models")
+
+    assert isinstance(exc_info.value, APITimeoutError)
+    assert attempts["n"] == 1
+
+
+@pytest.mark.asyncio
+async def test_async_client_applies_pool_configuration() -> None:
+    client = AsyncClient(
+        token_store=InMemoryTokenStore(_tokens()),
+        max_connections=500,
+        max_keepalive_connections=100,
+    )
+
+    pool = client._client._transport._pool
+    assert pool._max_connections == 500
+    assert pool._max_keepalive_connections == 100
+    await client.close()
+
+
+def test_http2_without_h2_installed_raises_import_error(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setitem(sys.modules, "h2", None)
+
+    with pytest.raises(ImportError, match="oauth-codex\\[http2\\]"):
+        Client(token_store=InMemoryTokenStore(_tokens()), http2=True)
+
+
+def test_http2_with_injected_http_client_raises() -> None:
+    with pytest.raises(ValueError, match="http_client"):
+        Client(token_store=InMemoryTokenStore(_tokens()), http_client=httpx.Client(), http2=True)
+    with pytest.raises(ValueError, match="http_client"):
+        AsyncClient(
+            token_store=InMemoryTokenStore(_tokens()),
+            http_client=httpx.AsyncClient(),
+            http2=True,
+        )
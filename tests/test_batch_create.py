@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+import time
+from typing import Any
+
+import httpx
+import pytest
+
+from conftest import InMemoryTokenStore
+from oauth_codex import (
+    AsyncClient,
+    BadRequestError,
+    BatchCancelHandle,
+    BatchProgress,
+    Client,
+)
+from oauth_codex.core_types import OAuthTokens
+
+
+def _tokens() -> OAuthTokens:
+    return OAuthTokens(access_token="a", refresh_token="r", expires_at=9_999_999_999)
+
+
+def _reply(request: httpx.Request) -> httpx.Response:
+    body = json.loads(request.content)
+    if body["input"] == "bad":
+        return httpx.Response(400, json={"error": {"message": "bad input"}})
+    return httpx.Response(200, json={"id": f"resp_{body['input']}", "output_text": body["input"]})
+
+
+def test_sync_batch_create_returns_ordered_results_with_per_item_errors() -> None:
+    active = {"now": 0, "peak": 0}
+    lock = threading.Lock()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        with lock:
+            active["now"] += 1
+            active["peak"] = max(active["peak"], active["now"])
+        time.sleep(0.02)
+        with lock:
+            active["now"] -= 1
+        return _reply(request)
+
+    client = Client(
+        token_store=InMemoryTokenStore(_tokens()),
+        http_client=httpx.Client(transport=httpx.MockTransport(handler)),
+        max_retries=0,
+    )
+    requests = [{"model": "gpt-5.3-codex", "input": str(i)} for i in range(10)]
+    requests[3]["input"] = "bad"
+    progress: list[BatchProgress] = []
+
+    results = list(
+        client.responses.batch_create(requests, concurrency=4, on_progress=progress.append)
+    )
+
+    assert [result.index for result in results] == list(range(10))
+    assert results[0].response is not None and results[0].response.id == "resp_0"
+    assert not results[3].ok and isinstance(results[3].error, BadRequestError)
+    assert all(result.ok for i, result in enumerate(results) if i != 3)
+    assert 1 < active["peak"] <= 4
+    assert progress[-1] == BatchProgress(total=10, completed=10, succeeded=9, failed=1)
+
+
+def test_sync_batch_create_stops_after_cancel() -> None:
+    client = Client(
+        token_store=InMemoryTokenStore(_tokens()),
+        http_client=httpx.Client(transport=httpx.MockTransport(_reply)),
+    )
+    cancel = BatchCancelHandle()
+    requests = ({"model": "m", "input": str(i)} for i in range(100))
+
+    seen = []
+    for result in client.responses.batch_create(requests, concurrency=2, cancel=cancel):
+        seen.append(result.index)
+        cancel.cancel()
+
+    assert len(seen) <= 2
+
+
+@pytest.mark.asyncio
+async def test_async_batch_create_as_completed() -> None:
+    async def handler(request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        await asyncio.sleep(0.05 if body["input"] == "0" else 0.0)
+        return _reply(request)
+
+    client = AsyncClient(
+        token_store=InMemoryTokenStore(_tokens()),
+        http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+    )
+    requests: list[dict[str, Any]] = [{"model": "m", "input": str(i)} for i in range(3)]
+
+    batch = await client.responses.batch_create(requests, concurrency=3, ordered=False)
+    indexes = [result.index async for result in batch]
+
+    assert sorted(indexes) == [0, 1, 2]
+    assert indexes[-1] == 0
+
+
+@pytest.mark.asyncio
+async def test_async_batch_cancel_cancels_in_flight_requests() -> None:
+    cancelled = {"n": 0}
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled["n"] += 1
+            raise
+        return _reply(request)
+
+    client = AsyncClient(
+        token_store=InMemoryTokenStore(_tokens()),
+        http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+    )
+    cancel = BatchCancelHandle()
+    asyncio.get_running_loop().call_later(0.05, cancel.cancel)
+
+    batch = await client.responses.batch_create(
+        [{"model": "m", "input": str(i)} for i in range(10)], concurrency=3, cancel=cancel
+    )
+    results = [result async for result in batch]
+
+    assert results == []
+    assert cancelled["n"] == 3
+
+
+@pytest.mark.asyncio
+async def test_batch_create_rejects_streaming_items() -> None:
+    client = AsyncClient(
+        token_store=InMemoryTokenStore(_tokens()),
+        http_client=httpx.AsyncClient(transport=httpx.MockTransport(_reply)),
+    )
+
+    batch = await client.responses.batch_create([{"model": "m", "input": "x", "stream": True}])
+    (result,) = [item async for item in batch]
+
+    assert isinstance(result.error, ValueError)
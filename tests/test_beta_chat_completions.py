@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import asyncio
+import threading
+import time
 from typing import Any, cast
 
 import pytest
@@ -7,6 +10,7 @@ import pytest
 import oauth_codex
 from conftest import InMemoryTokenStore
 from oauth_codex.core_types import OAuthTokens
+from oauth_codex.types.responses import Response, ResponseStreamEvent
 
 
 def _client() -> Any:
@@ -36,12 +40,8 @@ def _async_client() -> Any:
     )
 
 
-class _StubResponse:
-    def __init__(self, payload: dict[str, Any]) -> None:
-        self._payload = payload
-
-    def to_dict(self, **_kwargs: Any) -> dict[str, Any]:
-        return self._payload
+def _response(payload: dict[str, Any]) -> Response:
+    return Response.model_validate(payload)
 
 
 def test_chat_create_returns_tool_calls_without_auto_execution(
@@ -50,7 +50,7 @@ def test_chat_create_returns_tool_calls_without_auto_execution(
     client = _client()
 
     def fake_create(**_kwargs: Any) -> Any:
-        return _StubResponse(
+        return _response(
             {
                 "id": "resp_1",
                 "model": "gpt-5.3-codex",
@@ -87,6 +87,43 @@ def test_chat_create_returns_tool_calls_without_auto_execution(
     assert completion.choices[0].finish_reason == "tool_calls"
 
 
+def test_chat_create_builds_completion_from_response_attributes(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    client = _client()
+    captured: list[dict[str, Any]] = []
+
+    def fake_create(**kwargs: Any) -> Any:
+        captured.append(kwargs)
+        return _response(
+            {
+                "id": "resp_1",
+                "output_text": "hello",
+                "usage": {"input_tokens": 3, "output_tokens": 2},
+            }
+        )
+
+    monkeypatch.setattr(client.responses, "create", fake_create)
+    messages = [{"role": "user", "content": "hi"}]
+
+    completion = client.chat.completions.create(model="gpt-5.3-codex", messages=messages)
+    with_raw = client.chat.completions.create(
+        model="gpt-5.3-codex", messages=messages, include_raw_response=True
+    )
+
+    assert "include_raw_response" not in captured[1]
+    assert completion.id == "resp_1"
+    assert completion.model == "gpt-5.3-codex"
+    assert completion.choices[0].message.content == "hello"
+    assert completion.choices[0].finish_reason == "stop"
+    assert completion.usage is not None
+    assert completion.usage.total_tokens == 5
+    assert completion.raw_response is None
+    assert with_raw.raw_response is not None
+    assert with_raw.raw_response["output_text"] == "hello"
+    assert type(completion).model_validate(completion.to_dict()) == completion
+
+
 def test_beta_run_tools_executes_callables(monkeypatch: pytest.MonkeyPatch) -> None:
     client = _client()
     captured_calls: list[dict[str, Any]] = []
@@ -96,7 +133,7 @@ def test_beta_run_tools_executes_callables(monkeypatch: pytest.MonkeyPatch) -> N
         call_count["n"] += 1
         captured_calls.append(dict(kwargs))
         if call_count["n"] == 1:
-            return _StubResponse(
+            return _response(
                 {
                     "id": "resp_1",
                     "model": "gpt-5.3-codex",
@@ -111,7 +148,7 @@ def test_beta_run_tools_executes_callables(monkeypatch: pytest.MonkeyPatch) -> N
                     "usage": {"input_tokens": 1, "output_tokens": 1},
                 }
             )
-        return _StubResponse(
+        return _response(
             {
                 "id": "resp_2",
                 "model": "gpt-5.3-codex",
@@ -156,7 +193,7 @@ async def test_beta_arun_tools_supports_async_callables(
         call_count["n"] += 1
         captured_calls.append(dict(kwargs))
         if call_count["n"] == 1:
-            return _StubResponse(
+            return _response(
                 {
                     "id": "resp_1",
                     "model": "gpt-5.3-codex",
@@ -171,7 +208,7 @@ async def test_beta_arun_tools_supports_async_callables(
                     "usage": {"input_tokens": 1, "output_tokens": 1},
                 }
             )
-        return _StubResponse(
+        return _response(
             {
                 "id": "resp_2",
                 "model": "gpt-5.3-codex",
@@ -202,3 +239,387 @@ async def test_beta_arun_tools_supports_async_callables(
         and item.get("output") == "7"
         for item in second_round_messages
     )
+
+
+def test_beta_run_tools_accepts_toolset(monkeypatch: pytest.MonkeyPatch) -> None:
+    client = _client()
+    captured_calls: list[dict[str, Any]] = []
+
+    def fake_create(**kwargs: Any) -> Any:
+        captured_calls.append(dict(kwargs))
+        if len(captured_calls) == 1:
+            return _response(
+                {
+                    "id": "resp_1",
+                    "model": "gpt-5.3-codex",
+                    "output": [
+                        {
+                            "type": "function_call",
+                            "call_id": "call_1",
+                            "name": "add",
+                            "arguments": '{"a":1,"b":2}',
+                        }
+                    ],
+                }
+            )
+        return _response({"id": "resp_2", "output_text": "3", "finish_reason": "stop"})
+
+    monkeypatch.setattr(client.responses, "create", fake_create)
+
+    def add(a: int, b: int) -> int:
+        return a + b
+
+    tools = oauth_codex.ToolSet([add])
+    completion = client.beta.chat.completions.run_tools(
+        model="gpt-5.3-codex",
+        messages=[{"role": "user", "content": "add"}],
+        tools=tools,
+    )
+
+    assert completion.choices[0].message.content == "3"
+    assert all(call["tools"] is tools for call in captured_calls)
+    assert captured_calls[1]["input"][0]["output"] == "3"
+
+
+def _parallel_round_stub(calls: list[dict[str, Any]]) -> Any:
+    def respond(**kwargs: Any) -> Any:
+        calls.append(dict(kwargs))
+        if len(calls) > 1:
+            return _response({"id": "resp_2", "output_text": "done"})
+        return _response(
+            {
+                "id": "resp_1",
+                "output": [
+                    {
+                        "type": "function_call",
+                        "call_id": f"call_{delay}",
+                        "name": "wait",
+                        "arguments": f'{{"delay": {delay}}}',
+                    }
+                    for delay in (0.3, 0.1, 0.2)
+                ],
+            }
+        )
+
+    return respond
+
+
+def test_beta_run_tools_runs_round_in_parallel(monkeypatch: pytest.MonkeyPatch) -> None:
+    client = _client()
+    calls: list[dict[str, Any]] = []
+    monkeypatch.setattr(client.responses, "create", _parallel_round_stub(calls))
+
+    def wait(delay: float) -> float:
+        time.sleep(delay)
+        return delay
+
+    started = time.perf_counter()
+    client.beta.chat.completions.run_tools(
+        model="gpt-5.3-codex",
+        messages=[{"role": "user", "content": "go"}],
+        tools=[wait],
+        tool_concurrency=8,
+    )
+    elapsed = time.perf_counter() - started
+
+    assert elapsed < 0.5
+    assert [(item["call_id"], item["output"]) for item in calls[1]["input"]] == [
+        ("call_0.3", "0.3"),
+        ("call_0.1", "0.1"),
+        ("call_0.2", "0.2"),
+    ]
+
+
+def test_beta_run_tools_runs_sync_tools_serially_by_default(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    client = _client()
+    calls: list[dict[str, Any]] = []
+    monkeypatch.setattr(client.responses, "create", _parallel_round_stub(calls))
+    threads: set[int] = set()
+
+    def wait(delay: float) -> float:
+        threads.add(threading.get_ident())
+        return delay
+
+    client.beta.chat.completions.run_tools(
+        model="gpt-5.3-codex", messages=[{"role": "user", "content": "go"}], tools=[wait]
+    )
+
+    assert threads == {threading.get_ident()}
+    assert [item["output"] for item in calls[1]["input"]] == ["0.3", "0.1", "0.2"]
+
+
+@pytest.mark.asyncio
+async def test_beta_arun_tools_runs_round_concurrently(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    client = _async_client()
+    calls: list[dict[str, Any]] = []
+    respond = _parallel_round_stub(calls)
+
+    async def fake_create(**kwargs: Any) -> Any:
+        return respond(**kwargs)
+
+    monkeypatch.setattr(client.responses, "create", fake_create)
+
+    async def wait(delay: float) -> float:
+        await asyncio.sleep(delay)
+        return delay
+
+    started = time.perf_counter()
+    await client.beta.chat.completions.arun_tools(
+        model="gpt-5.3-codex", messages=[{"role": "user", "content": "go"}], tools=[wait]
+    )
+    parallel = time.perf_counter() - started
+
+    calls.clear()
+    started = time.perf_counter()
+    await client.beta.chat.completions.arun_tools(
+        model="gpt-5.3-codex",
+        messages=[{"role": "user", "content": "go"}],
+        tools=[wait],
+        tool_concurrency=1,
+    )
+    serial = time.perf_counter() - started
+
+    assert parallel < 0.5 <= serial
+    assert [item["output"] for item in calls[1]["input"]] == ["0.3", "0.1", "0.2"]
+
+
+@pytest.mark.asyncio
+async def test_beta_arun_tools_raises_tool_error_directly(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    client = _async_client()
+    calls: list[dict[str, Any]] = []
+    respond = _parallel_round_stub(calls)
+
+    async def fake_create(**kwargs: Any) -> Any:
+        return respond(**kwargs)
+
+    monkeypatch.setattr(client.responses, "create", fake_create)
+
+    async def wait(delay: float) -> float:
+        if delay == 0.1:
+            raise KeyError("boom")
+        return delay
+
+    with pytest.raises(KeyError, match="boom"):
+        await client.beta.chat.completions.arun_tools(
+            model="gpt-5.3-codex", messages=[{"role": "user", "content": "go"}], tools=[wait]
+        )
+
+
+def _streamed_tool_round(request_index: int) -> list[dict[str, Any]]:
+    if request_index > 0:
+        return [
+            {"type": "response_started", "response_id": "resp_2"},
+            {"type": "text_delta", "delta": "sum is 3"},
+            {"type": "done"},
+        ]
+    return [
+        {"type": "response_started", "response_id": "resp_1"},
+        {"type": "tool_call_started", "call_id": "call_1", "raw": {"name": "add"}},
+        {"type": "tool_call_arguments_delta", "call_id": "call_1", "delta": '{"a":1,'},
+        {"type": "tool_call_arguments_delta", "call_id": "call_1", "delta": '"b":2}'},
+        {"type": "tool_call_done", "call_id": "call_1"},
+        {"type": "text_delta", "delta": "thinking"},
+        {"type": "done"},
+    ]
+
+
+def test_beta_run_tools_stream_starts_tools_at_tool_call_done(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    client = _client()
+    captured_calls: list[dict[str, Any]] = []
+    log: list[str] = []
+
+    def fake_create(**kwargs: Any) -> Any:
+        captured_calls.append(dict(kwargs))
+        events = _streamed_tool_round(len(captured_calls) - 1)
+
+        def generate() -> Any:
+            for event in events:
+                if event["type"] == "text_delta" and event["delta"] == "thinking":
+                    time.sleep(0.2)
+                yield ResponseStreamEvent(**event)
+
+        return generate()
+
+    monkeypatch.setattr(client.responses, "create", fake_create)
+
+    def add(a: int, b: int) -> int:
+        log.append("tool")
+        return a + b
+
+    stream = client.beta.chat.completions.run_tools(
+        model="gpt-5.3-codex",
+        messages=[{"role": "user", "content": "add"}],
+        tools=[add],
+        stream=True,
+    )
+    for event in stream:
+        log.append(event.type)
+
+    assert log.index("tool") < log.index("text_delta")
+    assert log[-4:] == ["tool_call_output", "response_started", "text_delta", "done"]
+    assert captured_calls[0]["stream"] is True
+    assert captured_calls[1]["previous_response_id"] == "resp_1"
+    assert captured_calls[1]["input"] == [
+        {"type": "function_call_output", "call_id": "call_1", "output": "3"}
+    ]
+
+
+@pytest.mark.asyncio
+async def test_beta_arun_tools_stream_overlaps_tools_with_generation(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    client = _async_client()
+    captured_calls: list[dict[str, Any]] = []
+
+    async def fake_create(**kwargs: Any) -> Any:
+        captured_calls.append(dict(kwargs))
+        events = _streamed_tool_round(len(captured_calls) - 1)
+
+        async def generate() -> Any:
+            for event in events:
+                if event["type"] == "text_delta" and event["delta"] == "thinking":
+                    await asyncio.sleep(0.3)
+                yield ResponseStreamEvent(**event)
+
+        return generate()
+
+    monkeypatch.setattr(client.responses, "create", fake_create)
+
+    async def add(a: int, b: int) -> int:
+        await asyncio.sleep(0.3)
+        return a + b
+
+    started = time.perf_counter()
+    stream = await client.beta.chat.completions.arun_tools(
+        model="gpt-5.3-codex",
+        messages=[{"role": "user", "content": "add"}],
+        tools=[add],
+        stream=True,
+    )
+    events = [event async for event in stream]
+    elapsed = time.perf_counter() - started
+
+    assert elapsed < 0.5
+    output = next(event for event in events if event.type == "tool_call_output")
+    assert output.call_id == "call_1"
+    assert output.raw == {"name": "add", "output": "3"}
+    assert "".join(e.delta or "" for e in events if e.type == "text_delta") == "thinkingsum is 3"
+    assert captured_calls[1]["previous_response_id"] == "resp_1"
+
+
+def test_beta_run_tools_stream_strips_chat_options_and_requires_response_id(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    client = _client()
+    captured_calls: list[dict[str, Any]] = []
+
+    def fake_create(**kwargs: Any) -> Any:
+        captured_calls.append(dict(kwargs))
+        events = [
+            event
+            for event in _streamed_tool_round(0)
+            if event["type"] != "response_started"
+        ]
+        return iter([ResponseStreamEvent(**event) for event in events])
+
+    monkeypatch.setattr(client.responses, "create", fake_create)
+
+    def add(a: int, b: int) -> int:
+        return a + b
+
+    stream = client.beta.chat.completions.run_tools(
+        model="gpt-5.3-codex",
+        messages=[{"role": "user", "content": "add"}],
+        tools=[add],
+        stream=True,
+        include_raw_response=True,
+    )
+    with pytest.raises(RuntimeError, match="response_id"):
+        list(stream)
+
+    assert len(captured_calls) == 1
+    assert "include_raw_response" not in captured_calls[0]
+
+
+@pytest.mark.asyncio
+async def test_beta_arun_tools_stream_requires_response_id(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    client = _async_client()
+    captured_calls: list[dict[str, Any]] = []
+
+    async def fake_create(**kwargs: Any) -> Any:
+        captured_calls.append(dict(kwargs))
+
+        async def generate() -> Any:
+            for event in _streamed_tool_round(0):
+                if event["type"] != "response_started":
+                    yield ResponseStreamEvent(**event)
+
+        return generate()
+
+    monkeypatch.setattr(client.responses, "create", fake_create)
+
+    async def add(a: int, b: int) -> int:
+        return a + b
+
+    stream = await client.beta.chat.completions.arun_tools(
+        model="gpt-5.3-codex",
+        messages=[{"role": "user", "content": "add"}],
+        tools=[add],
+        stream=True,
+    )
+    with pytest.raises(RuntimeError, match="response_id"):
+        [event async for event in stream]
+
+    assert len(captured_calls) == 1
+
+
+def test_beta_run_tools_stream_close_cancels_queued_tools(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    client = _client()
+    started: list[str] = []
+
+    def fake_create(**_kwargs: Any) -> Any:
+        events = [{"type": "response_started", "response_id": "resp_1"}]
+        for call_id in ("call_1", "call_2"):
+            events += [
+                {"type": "tool_call_started", "call_id": call_id, "raw": {"name": "slow"}},
+                {"type": "tool_call_arguments_delta", "call_id": call_id, "delta": "{}"},
+                {"type": "tool_call_done", "call_id": call_id},
+            ]
+        events.append({"type": "done"})
+        return iter([ResponseStreamEvent(**event) for event in events])
+
+    monkeypatch.setattr(client.responses, "create", fake_create)
+
+    def slow() -> str:
+        started.append("slow")
+        time.sleep(0.2)
+        return "ok"
+
+    stream = client.beta.chat.completions.run_tools(
+        model="gpt-5.3-codex",
+        messages=[{"role": "user", "content": "go"}],
+        tools=[slow],
+        stream=True,
+    )
+    done = 0
+    for event in stream:
+        if event.type == "tool_call_done":
+            done += 1
+            if done == 2:
+                break
+    stream.close()
+    time.sleep(0.4)
+
+    assert started == ["slow"]
@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+import httpx
+import pytest
+
+from conftest import InMemoryTokenStore
+from oauth_codex import (
+    APIConnectionError,
+    AsyncClient,
+    CircuitBreaker,
+    CircuitOpenError,
+    Client,
+    InternalServerError,
+    NotFoundError,
+)
+from oauth_codex._circuit_breaker import endpoint_key
+from oauth_codex.core_types import OAuthTokens
+
+
+def _tokens() -> OAuthTokens:
+    return OAuthTokens(access_token="a", refresh_token="r", expires_at=9_999_999_999)
+
+
+def _client(status: list[int], breaker: CircuitBreaker) -> tuple[Client, dict[str, int]]:
+    calls = {"n": 0}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls["n"] += 1
+        return httpx.Response(status[0], json={})
+
+    client = Client(
+        token_store=InMemoryTokenStore(_tokens()),
+        http_client=httpx.Client(transport=httpx.MockTransport(handler)),
+        max_retries=0,
+        circuit_breaker=breaker,
+    )
+    return client, calls
+
+
+def test_endpoint_key_templates_identifier_segments() -> None:
+    assert endpoint_key("get", "/vector_stores/vs_abc123/files") == "GET /vector_stores/{id}/files"
+    assert endpoint_key("post", "/responses") == "POST /responses"
+    assert endpoint_key("GET", "https://x.example/files/file-9?limit=2") == "GET /files/{id}"
+    assert endpoint_key("get", "/threads/123/runs") == "GET /threads/{id}/runs"
+    assert (
+        endpoint_key("get", "/files/0f8fad5b-d9cb-469f-a165-70867728950e")
+        == "GET /files/{id}"
+    )
+
+
+def test_endpoint_key_keeps_model_and_version_segments() -> None:
+    assert endpoint_key("get", "/models/gpt-5") == "GET /models/gpt-5"
+    assert endpoint_key("get", "/models/gpt-5.3-codex") == "GET /models/gpt-5.3-codex"
+    assert endpoint_key("get", "/v1/models/gpt-4o") == "GET /v1/models/gpt-4o"
+    assert endpoint_key("get", "/models/gpt-5") != endpoint_key("get", "/models/gpt-4o")
+
+
+def test_circuit_opens_after_threshold_and_fails_fast() -> None:
+    breaker = CircuitBreaker(failure_threshold=3, recovery_timeout=60.0)
+    client, calls = _client([503], breaker)
+
+    for _ in range(3):
+        with pytest.raises(InternalServerError):
+            client.request("POST", "/responses")
+
+    with pytest.raises(CircuitOpenError) as exc_info:
+        client.request("POST", "/responses")
+
+    assert calls["n"] == 3
+    assert exc_info.value.key == "POST /responses"
+    assert breaker.state("POST", "/responses") == "open"
+    assert breaker.snapshot()["POST /responses"].consecutive_failures == 3
+    # Other endpoints are unaffected.
+    assert breaker.state("GET", "/models") == "closed"
+
+
+def test_client_errors_do_not_trip_the_circuit() -> None:
+    breaker = CircuitBreaker(failure_threshold=1)
+    client, _ = _client([404], breaker)
+
+    with pytest.raises(NotFoundError):
+        client.request("GET", "/files/file-1")
+
+    assert breaker.state("GET", "/files/file-1") == "closed"
+
+
+def test_half_open_admits_probe_and_closes_on_success(monkeypatch: pytest.MonkeyPatch) -> None:
+    now = {"t": 1000.0}
+    monkeypatch.setattr("oauth_codex._circuit_breaker.time.time", lambda: now["t"])
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=10.0)
+    status = [500]
+    client, calls = _client(status, breaker)
+
+    with pytest.raises(InternalServerError):
+        client.request("GET", "/models")
+    with pytest.raises(CircuitOpenError):
+        client.request("GET", "/models")
+
+    now["t"] += 10.0
+    assert breaker.state("GET", "/models") == "half_open"
+    breaker.before_request("GET /models")
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request("GET /models")
+    breaker.record_failure("GET /models")
+    assert breaker.state("GET", "/models") == "open"
+
+    now["t"] += 10.0
+    status[0] = 200
+    client.request("GET", "/models")
+
+    assert breaker.state("GET", "/models") == "closed"
+    assert breaker.snapshot() == {}
+    assert calls["n"] == 2
+
+
+def test_open_circuit_stops_retrying_in_flight_request(monkeypatch: pytest.MonkeyPatch) -> None:
+    sleeps: list[float] = []
+    monkeypatch.setattr("oauth_codex._base_client.time.sleep", sleeps.append)
+    attempts = {"n": 0}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        attempts["n"] += 1
+        raise httpx.ConnectError("down", request=request)
+
+    client = Client(
+        token_store=InMemoryTokenStore(_tokens()),
+        http_client=httpx.Client(transport=httpx.MockTransport(handler)),
+        max_retries=5,
+        circuit_breaker=CircuitBreaker(failure_threshold=2),
+    )
+
+    with pytest.raises(APIConnectionError):
+        client.request("POST", "/responses")
+
+    assert attempts["n"] == 2
+    assert len(sleeps) == 1
+
+
+@pytest.mark.asyncio
+async def test_async_client_fails_fast_when_circuit_open() -> None:
+    async def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(502, json={})
+
+    client = AsyncClient(
+        token_store=InMemoryTokenStore(_tokens()),
+        http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        max_retries=0,
+        circuit_breaker=CircuitBreaker(failure_threshold=1),
+    )
+
+    with pytest.raises(InternalServerError):
+        await client.request("POST", "/responses")
+    with pytest.raises(CircuitOpenError):
+        await client.request("POST", "/responses")
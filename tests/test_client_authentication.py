@@ -1,11 +1,19 @@
 from __future__ import annotations
 
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
+import httpx
 import pytest
 
 from conftest import InMemoryTokenStore
-from oauth_codex import AsyncClient, Client
+from oauth_codex import AsyncClient, AuthenticationError, Client
+from oauth_codex.errors import TokenRefreshError
+from oauth_codex.auth import DiscoveryCache
+from oauth_codex.auth._oauth import _BACKGROUND_IDLE_SECONDS, OAuthProvider
 from oauth_codex.core_types import OAuthTokens
 
 
@@ -55,3 +63,378 @@ async def test_async_client_authenticate_delegates_to_auth_provider(
 
     assert out is None
     assert called == {"interactive": True}
+
+
+class _CountingTokenStore(InMemoryTokenStore):
+    def __init__(self, tokens: OAuthTokens | None = None) -> None:
+        super().__init__(tokens)
+        self.loads = 0
+
+    def load(self) -> OAuthTokens | None:
+        self.loads += 1
+        return super().load()
+
+
+def test_oauth_provider_caches_tokens_and_headers_between_requests() -> None:
+    store = _CountingTokenStore(_tokens())
+    provider = OAuthProvider(token_store=store)
+
+    first = provider.get_headers()
+    second = provider.get_headers()
+
+    assert first == {"Authorization": "Bearer a"}
+    assert second is first
+    assert store.loads == 1
+
+
+def test_oauth_provider_reloads_store_after_invalidate() -> None:
+    store = _CountingTokenStore(_tokens())
+    provider = OAuthProvider(token_store=store)
+    provider.get_headers()
+
+    store.tokens = OAuthTokens(
+        access_token="b", refresh_token="r", expires_at=9_999_999_999
+    )
+    assert provider.get_headers() == {"Authorization": "Bearer a"}
+
+    provider.invalidate()
+
+    assert provider.get_headers() == {"Authorization": "Bearer b"}
+    assert store.loads == 2
+
+
+def test_oauth_provider_goes_back_to_store_when_cached_tokens_expire(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    store = _CountingTokenStore(
+        OAuthTokens(access_token="old", refresh_token="r", expires_at=1.0)
+    )
+    provider = OAuthProvider(token_store=store)
+
+    def fake_refresh(tokens: OAuthTokens) -> OAuthTokens:
+        refreshed = OAuthTokens(
+            access_token="new", refresh_token="r", expires_at=time.time() + 3600
+        )
+        store.save(refreshed)
+        return refreshed
+
+    monkeypatch.setattr(provider, "_refresh_and_persist_sync", fake_refresh)
+
+    assert provider.get_headers() == {"Authorization": "Bearer new"}
+    assert provider.get_headers() == {"Authorization": "Bearer new"}
+    assert store.loads == 1
+
+
+def test_client_invalidates_cached_auth_after_401() -> None:
+    store = _CountingTokenStore(_tokens())
+
+    def handler(_request: httpx.Request) -> httpx.Response:
+        return httpx.Response(401, json={"error": {"message": "expired"}})
+
+    client = Client(
+        token_store=store,
+        http_client=httpx.Client(transport=httpx.MockTransport(handler)),
+    )
+
+    with pytest.raises(AuthenticationError):
+        client.request("GET", "/models")
+    with pytest.raises(AuthenticationError):
+        client.request("GET", "/models")
+
+    assert store.loads == 2
+
+
+@pytest.mark.asyncio
+async def test_oauth_provider_async_headers_use_cache() -> None:
+    store = _CountingTokenStore(_tokens())
+    provider = OAuthProvider(token_store=store)
+
+    await provider.aget_headers()
+    await provider.aget_headers()
+
+    assert store.loads == 1
+
+
+def _expiring_tokens() -> OAuthTokens:
+    # Inside the refresh leeway but not yet expired.
+    return OAuthTokens(access_token="old", refresh_token="r", expires_at=time.time() + 5)
+
+
+def test_concurrent_threads_share_a_single_refresh(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    store = InMemoryTokenStore(_expiring_tokens())
+    provider = OAuthProvider(token_store=store)
+    calls = {"n": 0}
+
+    def fake_refresh(tokens: OAuthTokens) -> OAuthTokens:
+        calls["n"] += 1
+        time.sleep(0.05)
+        refreshed = OAuthTokens(
+            access_token="new", refresh_token="r", expires_at=time.time() + 3600
+        )
+        store.save(refreshed)
+        return refreshed
+
+    monkeypatch.setattr(provider, "_refresh_and_persist_sync", fake_refresh)
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(lambda _: provider.get_headers(), range(16)))
+
+    assert calls["n"] == 1
+    assert all(headers == {"Authorization": "Bearer new"} for headers in results)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_coroutines_share_a_single_refresh(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    store = InMemoryTokenStore(_expiring_tokens())
+    provider = OAuthProvider(token_store=store)
+    calls = {"n": 0}
+
+    async def fake_refresh(tokens: OAuthTokens) -> OAuthTokens:
+        calls["n"] += 1
+        await asyncio.sleep(0.01)
+        refreshed = OAuthTokens(
+            access_token="new", refresh_token="r", expires_at=time.time() + 3600
+        )
+        store.save(refreshed)
+        return refreshed
+
+    monkeypatch.setattr(provider, "_refresh_and_persist_async", fake_refresh)
+
+    results = await asyncio.gather(*(provider.aget_headers() for _ in range(50)))
+
+    assert calls["n"] == 1
+    assert all(headers == {"Authorization": "Bearer new"} for headers in results)
+
+
+@pytest.mark.asyncio
+async def test_failed_refresh_keeps_still_valid_tokens_for_waiters(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    original = _expiring_tokens()
+    store = InMemoryTokenStore(original)
+    provider = OAuthProvider(token_store=store)
+    calls = {"n": 0}
+
+    async def failing_refresh(tokens: OAuthTokens) -> OAuthTokens:
+        calls["n"] += 1
+        await asyncio.sleep(0.01)
+        raise TokenRefreshError("refresh failed")
+
+    monkeypatch.setattr(provider, "_refresh_and_persist_async", failing_refresh)
+
+    results = await asyncio.gather(*(provider.aget_headers() for _ in range(10)))
+
+    assert calls["n"] == 1
+    assert all(headers == {"Authorization": "Bearer old"} for headers in results)
+    assert store.tokens == original
+
+
+def test_failed_refresh_uses_tokens_another_process_saved(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    store = InMemoryTokenStore(
+        OAuthTokens(access_token="old", refresh_token="r", expires_at=1.0)
+    )
+    provider = OAuthProvider(token_store=store)
+
+    def failing_refresh(tokens: OAuthTokens) -> OAuthTokens:
+        store.save(
+            OAuthTokens(
+                access_token="other", refresh_token="r2", expires_at=time.time() + 3600
+            )
+        )
+        raise TokenRefreshError("refresh token already rotated")
+
+    monkeypatch.setattr(provider, "_refresh_and_persist_sync", failing_refresh)
+
+    assert provider.get_headers() == {"Authorization": "Bearer other"}
+    assert store.tokens is not None
+    assert store.tokens.access_token == "other"
+
+
+def _soon_stale_tokens() -> OAuthTokens:
+    now = time.time()
+    return OAuthTokens(
+        access_token="old",
+        refresh_token="r",
+        expires_at=now + 100,
+        last_refresh=now - 900,
+    )
+
+
+def test_background_refresh_renews_tokens_before_expiry(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    store = InMemoryTokenStore(_soon_stale_tokens())
+    provider = OAuthProvider(token_store=store, background_refresh=True)
+    refreshed_event = threading.Event()
+
+    def fake_refresh(tokens: OAuthTokens) -> OAuthTokens:
+        refreshed = OAuthTokens(
+            access_token="new",
+            refresh_token="r",
+            expires_at=time.time() + 3600,
+            last_refresh=time.time(),
+        )
+        store.save(refreshed)
+        refreshed_event.set()
+        return refreshed
+
+    monkeypatch.setattr(provider, "_refresh_and_persist_sync", fake_refresh)
+
+    provider.get_headers()
+    assert refreshed_event.wait(timeout=2)
+    try:
+        for _ in range(100):
+            if provider.get_headers() == {"Authorization": "Bearer new"}:
+                break
+            time.sleep(0.01)
+        assert provider.get_headers() == {"Authorization": "Bearer new"}
+    finally:
+        provider.close()
+
+    assert provider._background_thread is None
+
+
+def test_background_refresh_idles_without_refresh_token() -> None:
+    now = time.time()
+    tokens = OAuthTokens(
+        access_token="a", refresh_token=None, expires_at=now + 300, last_refresh=now - 3000
+    )
+    provider = OAuthProvider(token_store=InMemoryTokenStore(tokens), background_refresh=True)
+    try:
+        provider.get_headers()
+        assert provider._background_thread is not None
+
+        assert provider._seconds_until_background_refresh() == _BACKGROUND_IDLE_SECONDS
+        assert provider._next_background_wait() == _BACKGROUND_IDLE_SECONDS
+        started = time.process_time()
+        time.sleep(0.2)
+        assert time.process_time() - started < 0.1
+    finally:
+        provider.close()
+
+
+def test_background_refresh_is_off_by_default() -> None:
+    provider = OAuthProvider(token_store=InMemoryTokenStore(_soon_stale_tokens()))
+
+    provider.get_headers()
+
+    assert provider._background_thread is None
+
+
+@pytest.mark.asyncio
+async def test_async_background_refresh_task_is_cancelled_on_close(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    store = InMemoryTokenStore(_soon_stale_tokens())
+    client = AsyncClient(token_store=store, background_token_refresh=True)
+    provider = client.auth
+    assert isinstance(provider, OAuthProvider)
+    refreshed = asyncio.Event()
+
+    async def fake_refresh(tokens: OAuthTokens) -> OAuthTokens:
+        refreshed.set()
+        return OAuthTokens(
+            access_token="new",
+            refresh_token="r",
+            expires_at=time.time() + 3600,
+            last_refresh=time.time(),
+        )
+
+    monkeypatch.setattr(provider, "_refresh_and_persist_async", fake_refresh)
+
+    assert await provider.aget_headers() == {"Authorization": "Bearer old"}
+    await asyncio.wait_for(refreshed.wait(), timeout=2)
+    await asyncio.sleep(0)
+    assert await provider.aget_headers() == {"Authorization": "Bearer new"}
+
+    task = provider._background_task
+    await client.close()
+
+    assert task is not None and task.done()
+
+
+def _token_endpoint_transport(seen: list[str]) -> httpx.MockTransport:
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.url.path)
+        if request.url.path.endswith("oauth-authorization-server"):
+            return httpx.Response(404)
+        return httpx.Response(
+            200,
+            json={"access_token": f"new-{len(seen)}", "refresh_token": "r", "expires_in": 1},
+        )
+
+    return httpx.MockTransport(handler)
+
+
+def test_oauth_provider_reuses_borrowed_http_client_for_refresh() -> None:
+    seen: list[str] = []
+    http_client = httpx.Client(transport=_token_endpoint_transport(seen))
+    provider = OAuthProvider(
+        token_store=InMemoryTokenStore(_expiring_tokens()),
+        http_client=http_client,
+        discovery_cache=DiscoveryCache(),
+    )
+
+    provider._refresh_and_persist_sync(_expiring_tokens())
+    provider._refresh_and_persist_sync(_expiring_tokens())
+    provider.close()
+
+    assert seen.count("/oauth/token") == 2
+    assert provider._http_client is http_client
+    assert not http_client.is_closed
+
+
+def test_oauth_provider_closes_its_own_http_client() -> None:
+    provider = OAuthProvider(token_store=InMemoryTokenStore(_tokens()))
+
+    first = provider._sync_http_client()
+    assert provider._sync_http_client() is first
+
+    provider.close()
+
+    assert first.is_closed
+    assert provider._http_client is None
+
+
+def test_client_auth_uses_its_own_http_client_by_default() -> None:
+    seen: list[str] = []
+    http_client = httpx.Client(transport=_token_endpoint_transport(seen))
+    client = Client(token_store=InMemoryTokenStore(_tokens()), http_client=http_client)
+    provider = client.auth
+    assert isinstance(provider, OAuthProvider)
+
+    auth_http_client = provider._sync_http_client()
+    client.close()
+
+    assert auth_http_client is not http_client
+    assert auth_http_client.is_closed
+    assert not http_client.is_closed
+    assert seen == []
+
+
+@pytest.mark.asyncio
+async def test_async_client_shares_its_http_client_with_oauth_provider_on_opt_in() -> None:
+    seen: list[str] = []
+    http_client = httpx.AsyncClient(transport=_token_endpoint_transport(seen))
+    client = AsyncClient(
+        token_store=InMemoryTokenStore(_tokens()),
+        http_client=http_client,
+        share_http_client_with_auth=True,
+    )
+    provider = client.auth
+    assert isinstance(provider, OAuthProvider)
+    provider._discovery_cache = DiscoveryCache()
+
+    await provider._refresh_and_persist_async(_expiring_tokens())
+    await client.close()
+
+    assert "/oauth/token" in seen
+    assert provider._async_http_client is http_client
+    assert not http_client.is_closed
+    await http_client.aclose()
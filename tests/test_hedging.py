@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+from collections.abc import AsyncIterator
+from typing import Any
+
+import httpx
+import pytest
+
+from conftest import InMemoryTokenStore
+from oauth_codex import AsyncClient, HedgePolicy
+from oauth_codex.core_types import OAuthTokens
+
+
+def _tokens() -> OAuthTokens:
+    return OAuthTokens(access_token="a", refresh_token="r", expires_at=9_999_999_999)
+
+
+def _client(handler: Any, policy: HedgePolicy) -> AsyncClient:
+    return AsyncClient(
+        token_store=InMemoryTokenStore(_tokens()),
+        http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        hedge_policy=policy,
+    )
+
+
+class _SlowFirstHandler:
+    def __init__(self, *, slow_seconds: float = 2.0, stream: bool = False) -> None:
+        self.slow_seconds = slow_seconds
+        self.stream = stream
+        self.calls = 0
+        self.cancelled = 0
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.calls += 1
+        call = self.calls
+        if call == 1:
+            try:
+                await asyncio.sleep(self.slow_seconds)
+            except asyncio.CancelledError:
+                self.cancelled += 1
+                raise
+        if self.stream:
+            return httpx.Response(
+                200,
+                headers={"content-type": "text/event-stream"},
+                content=self._events(call),
+            )
+        return httpx.Response(200, json={"id": f"resp_{call}", "output_text": "ok"})
+
+    async def _events(self, call: int) -> AsyncIterator[bytes]:
+        for event in ({"type": "text_delta", "delta": f"call-{call}"}, {"type": "done"}):
+            yield f"data: {json.dumps(event)}\n\n".encode()
+
+
+def test_hedge_delay_tracks_latency_percentile() -> None:
+    policy = HedgePolicy(percentile=0.9, initial_delay=1.5, min_samples=10, min_delay=0.0)
+    assert policy.delay() == 1.5
+
+    for index in range(10):
+        policy.record_latency(index / 10)
+
+    assert policy.delay() == pytest.approx(0.9)
+
+
+@pytest.mark.asyncio
+async def test_slow_request_is_hedged_and_loser_cancelled() -> None:
+    handler = _SlowFirstHandler()
+    policy = HedgePolicy(initial_delay=0.05)
+    client = _client(handler, policy)
+
+    started = time.perf_counter()
+    response = await client.responses.create(model="gpt-5.3-codex", input="hi", store=False)
+    elapsed = time.perf_counter() - started
+
+    assert response.id == "resp_2"
+    assert handler.calls == 2
+    assert handler.cancelled == 1
+    assert elapsed < 1.0
+    # The winning hedge's latency includes the hedge delay already spent.
+    assert policy._latencies[-1] >= 0.05
+
+
+@pytest.mark.asyncio
+async def test_requests_without_explicit_store_false_are_not_hedged() -> None:
+    handler = _SlowFirstHandler(slow_seconds=0.2)
+    client = _client(handler, HedgePolicy(initial_delay=0.01))
+
+    # `responses.create` always sends `store`; a payload without it is not
+    # known to be safe to duplicate.
+    body = await client._engine.aresponses_create(model="gpt-5.3-codex", input="hi")
+
+    assert body["id"] == "resp_1"
+    assert handler.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_stored_requests_are_never_hedged() -> None:
+    handler = _SlowFirstHandler(slow_seconds=0.2)
+    client = _client(handler, HedgePolicy(initial_delay=0.01))
+
+    response = await client.responses.create(model="gpt-5.3-codex", input="hi", store=True)
+
+    assert response.id == "resp_1"
+    assert handler.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_hedge_budget_limits_duplicate_requests() -> None:
+    handler = _SlowFirstHandler(slow_seconds=0.1)
+    client = _client(
+        handler, HedgePolicy(initial_delay=0.01, budget_capacity=0.0, budget_ratio=0.0)
+    )
+
+    response = await client.responses.create(model="gpt-5.3-codex", input="hi", store=False)
+
+    assert response.id == "resp_1"
+    assert handler.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_stream_is_hedged_on_first_event() -> None:
+    handler = _SlowFirstHandler(stream=True)
+    client = _client(handler, HedgePolicy(initial_delay=0.05))
+
+    stream = await client.responses.stream(model="gpt-5.3-codex", input="hi", store=False)
+    events = [event async for event in stream]
+
+    assert [event.type for event in events] == ["text_delta", "done"]
+    assert events[0].delta == "call-2"
+    assert handler.cancelled == 1
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+pytest.importorskip("h2")
+pytest.importorskip("cryptography")
+
+from _h2_server import LocalStreamServer  # noqa: E402
+from conftest import InMemoryTokenStore  # noqa: E402
+from oauth_codex import AsyncClient  # noqa: E402
+from oauth_codex.core_types import OAuthTokens  # noqa: E402
+
+
+def _tokens() -> OAuthTokens:
+    return OAuthTokens(access_token="a", refresh_token="r", expires_at=9_999_999_999)
+
+
+async def _consume(client: AsyncClient) -> list[str]:
+    stream = await client.responses.stream(model="gpt-5.3-codex", input="hi")
+    return [event.type async for event in stream]
+
+
+@pytest.mark.asyncio
+async def test_async_client_http2_multiplexes_streams_over_one_connection(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    async with LocalStreamServer(chunks=3, chunk_delay=0.01) as server:
+        monkeypatch.setenv("SSL_CERT_FILE", server.cafile)
+        client = AsyncClient(
+            token_store=InMemoryTokenStore(_tokens()),
+            base_url=server.base_url,
+            http2=True,
+        )
+        try:
+            await _consume(client)
+            results = await asyncio.gather(*(_consume(client) for _ in range(25)))
+        finally:
+            await client.close()
+
+    assert all(events[-1] == "done" and len(events) == 4 for events in results)
+    assert server.requests == 26
+    assert server.connections == 1
+    assert server.protocols == ["h2"]
+
+
+@pytest.mark.asyncio
+async def test_async_client_defaults_to_http1(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    async with LocalStreamServer() as server:
+        monkeypatch.setenv("SSL_CERT_FILE", server.cafile)
+        client = AsyncClient(
+            token_store=InMemoryTokenStore(_tokens()), base_url=server.base_url
+        )
+        try:
+            events = await _consume(client)
+        finally:
+            await client.close()
+
+    assert events[-1] == "done"
+    assert server.protocols == ["http/1.1"]
+
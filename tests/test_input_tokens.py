@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+import time
+
+import httpx
+import pytest
+
+from conftest import InMemoryTokenStore
+from oauth_codex import AsyncClient, Client
+from oauth_codex._sdk_client import INPUT_TOKEN_COUNT_CACHE_TTL_SECONDS
+from oauth_codex.core_types import OAuthTokens
+
+
+def _tokens() -> OAuthTokens:
+    return OAuthTokens(access_token="a", refresh_token="r", expires_at=9_999_999_999)
+
+
+class _Counter:
+    def __init__(self) -> None:
+        self.inputs: list[object] = []
+        self._lock = threading.Lock()
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        with self._lock:
+            self.inputs.append(body["input"])
+        tokens = len(str(body["input"]))
+        return httpx.Response(
+            200, json={"input_tokens": tokens, "cached_tokens": 0, "total_tokens": tokens}
+        )
+
+
+def test_count_is_cached_by_content() -> None:
+    backend = _Counter()
+    client = Client(
+        token_store=InMemoryTokenStore(_tokens()),
+        http_client=httpx.Client(transport=httpx.MockTransport(backend)),
+    )
+
+    first = client.responses.input_tokens.count(model="m", input="hello")
+    second = client.responses.input_tokens.count(model="m", input="hello")
+    other_model = client.responses.input_tokens.count(model="n", input="hello")
+    uncached = client.responses.input_tokens.count(model="m", input="hello", cache=False)
+
+    assert first.input_tokens == second.input_tokens == other_model.input_tokens == 5
+    assert uncached.input_tokens == 5
+    assert len(backend.inputs) == 3
+
+
+def test_cached_counts_expire(monkeypatch: pytest.MonkeyPatch) -> None:
+    backend = _Counter()
+    client = Client(
+        token_store=InMemoryTokenStore(_tokens()),
+        http_client=httpx.Client(transport=httpx.MockTransport(backend)),
+    )
+    now = time.time()
+
+    client.responses.input_tokens.count(model="m", input="hello")
+    monkeypatch.setattr(time, "time", lambda: now + INPUT_TOKEN_COUNT_CACHE_TTL_SECONDS + 1)
+    client.responses.input_tokens.count(model="m", input="hello")
+
+    assert len(backend.inputs) == 2
+
+
+def test_count_many_dedupes_and_preserves_order() -> None:
+    backend = _Counter()
+    client = Client(
+        token_store=InMemoryTokenStore(_tokens()),
+        http_client=httpx.Client(transport=httpx.MockTransport(backend)),
+    )
+
+    counts = client.responses.input_tokens.count_many(
+        ["a", "bbb", "a", [{"role": "user", "content": "cc"}], "bbb"],
+        model="m",
+        concurrency=3,
+    )
+
+    assert [count.input_tokens for count in counts[:3]] == [1, 3, 1]
+    assert counts[4].input_tokens == 3
+    assert len(backend.inputs) == 3
+    assert client.responses.input_tokens.count_many([], model="m") == []
+
+
+@pytest.mark.asyncio
+async def test_async_count_many_limits_concurrency() -> None:
+    in_flight = 0
+    peak = 0
+    calls = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, peak, calls
+        calls += 1
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        tokens = len(json.loads(request.content)["input"])
+        return httpx.Response(200, json={"input_tokens": tokens, "total_tokens": tokens})
+
+    client = AsyncClient(
+        token_store=InMemoryTokenStore(_tokens()),
+        http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+    )
+
+    inputs = ["x" * n for n in range(1, 9)] * 2
+    counts = await client.responses.input_tokens.count_many(inputs, model="m", concurrency=2)
+
+    assert [count.input_tokens for count in counts] == list(range(1, 9)) * 2
+    assert calls == 8
+    assert peak <= 2
+
+    await client.responses.input_tokens.count(model="m", input="x")
+    assert calls == 8
@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import json
+import sys
+from typing import Any
+
+import httpx
+import pytest
+
+from conftest import InMemoryTokenStore
+from oauth_codex import Client, ToolSet
+from oauth_codex._json import JSONCodec, encode_body, get_codec
+from oauth_codex.core_types import OAuthTokens
+
+
+def _tokens() -> OAuthTokens:
+    return OAuthTokens(access_token="a", refresh_token="r", expires_at=9_999_999_999)
+
+
+def _client(handler: Any, **kwargs: Any) -> Client:
+    return Client(
+        token_store=InMemoryTokenStore(_tokens()),
+        http_client=httpx.Client(transport=httpx.MockTransport(handler)),
+        **kwargs,
+    )
+
+
+def test_codec_selection(monkeypatch: pytest.MonkeyPatch) -> None:
+    assert get_codec("stdlib").name == "stdlib"
+    assert get_codec("auto").name in {"orjson", "msgspec", "stdlib"}
+    with pytest.raises(ValueError, match="Unknown json_codec"):
+        get_codec("yaml")
+
+    monkeypatch.setitem(sys.modules, "msgspec", None)
+    monkeypatch.setitem(sys.modules, "orjson", None)
+    assert get_codec("auto").name == "stdlib"
+    with pytest.raises(ImportError, match=r"oauth-codex\[orjson\]"):
+        get_codec("orjson")
+
+
+def test_codecs_round_trip_the_same_document() -> None:
+    document = {"input": [{"role": "user", "content": "héllo ✓"}], "n": 2**70, "f": 0.5}
+    for name in ("stdlib", "orjson", "msgspec"):
+        try:
+            codec = get_codec(name)
+        except ImportError:
+            continue
+        encoded = codec.dumps(document)
+        assert json.loads(encoded) == document
+        assert codec.loads(encoded) == document
+
+
+def test_request_body_is_encoded_once_across_retries() -> None:
+    bodies: list[bytes] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        bodies.append(request.content)
+        if len(bodies) == 1:
+            return httpx.Response(500, headers={"retry-after-ms": "0"}, json={"error": "x"})
+        return httpx.Response(200, json={"id": "resp_1", "output_text": "ok"})
+
+    client = _client(handler, max_retries=1, json_codec="stdlib")
+    encodes = 0
+    dumps = client.json_codec.dumps
+
+    def counting_dumps(value: Any) -> bytes:
+        nonlocal encodes
+        encodes += 1
+        return dumps(value)
+
+    client.json_codec.dumps = counting_dumps  # type: ignore[method-assign]
+    response = client.responses.create(model="gpt-5.3-codex", input="hi")
+
+    assert response.id == "resp_1"
+    assert encodes == 1
+    assert len(bodies) == 2 and bodies[0] == bodies[1]
+    assert json.loads(bodies[0])["input"] == "hi"
+
+
+def test_toolset_json_is_spliced_into_request_body() -> None:
+    sent: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        sent.append(request)
+        return httpx.Response(200, json={"id": "resp_1", "output_text": "ok"})
+
+    def lookup(key: str) -> str:
+        return key
+
+    tools = ToolSet([lookup])
+    _client(handler).responses.create(model="gpt-5.3-codex", input="hi", tools=tools)
+
+    assert tools.json in sent[0].content
+    assert sent[0].headers["content-type"] == "application/json"
+    assert json.loads(sent[0].content)["tools"] == json.loads(tools.json)
+    assert json.loads(encode_body(JSONCodec(), {"tools": tools.schemas})) == {
+        "tools": json.loads(tools.json)
+    }
+
+
+def test_every_codec_encodes_the_same_body() -> None:
+    def lookup(key: str) -> str:
+        return key
+
+    tools = ToolSet([lookup, {"type": "function", "name": "ünï", "parameters": {}}])
+    body = {"model": "gpt-5.3-codex", "input": "héllo ✓", "n": 2**70, "tools": tools.schemas}
+    expected = json.loads(encode_body(JSONCodec(), body))
+
+    for name in ("stdlib", "orjson", "msgspec"):
+        try:
+            codec = get_codec(name)
+        except ImportError:
+            continue
+        encoded = encode_body(codec, body)
+        assert json.loads(encoded) == expected
+        assert tools.schemas.encoded_by_codec[name] == codec.dumps(list(tools.schemas))
+        for bad in (float("nan"), float("inf")):
+            with pytest.raises(ValueError):
+                codec.dumps({"input": [{"temperature": bad}]})
+            with pytest.raises(ValueError):
+                encode_body(codec, {"temperature": bad, "tools": tools.schemas})
@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import time
+from email.utils import formatdate
+from pathlib import Path
+
+import httpx
+import pytest
+
+from conftest import InMemoryTokenStore
+from oauth_codex import AsyncClient, Client
+from oauth_codex.auth import DiscoveryCache, discover_endpoints, discover_endpoints_async
+from oauth_codex.auth.config import OAuthConfig
+
+_METADATA = {
+    "authorization_endpoint": "https://issuer.example/authorize",
+    "token_endpoint": "https://issuer.example/token",
+}
+
+
+def _counting_transport(
+    headers: dict[str, str] | None = None,
+) -> tuple[httpx.MockTransport, dict[str, int]]:
+    calls = {"n": 0}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls["n"] += 1
+        return httpx.Response(200, json=_METADATA, headers=headers or {})
+
+    return httpx.MockTransport(handler), calls
+
+
+def test_discovery_is_fetched_once_per_url() -> None:
+    transport, calls = _counting_transport()
+    cache = DiscoveryCache()
+    config = OAuthConfig()
+
+    with httpx.Client(transport=transport) as client:
+        first = discover_endpoints(client, config, cache=cache)
+        second = discover_endpoints(client, first, cache=cache)
+
+    assert calls["n"] == 1
+    assert first.token_endpoint == "https://issuer.example/token"
+    assert second is first
+
+
+def test_discovery_honours_max_age_and_no_store() -> None:
+    cache = DiscoveryCache()
+    response = httpx.Response(200, headers={"Cache-Control": "public, max-age=120", "Age": "20"})
+    expires_at = cache.expires_at(response)
+    assert expires_at is not None
+    assert 99 <= expires_at - time.time() <= 100
+
+    assert cache.expires_at(httpx.Response(200, headers={"Cache-Control": "no-store"})) is None
+    assert cache.expires_at(httpx.Response(200, headers={"Cache-Control": "max-age=0"})) is None
+
+    past = formatdate(time.time() - 60, usegmt=True)
+    assert cache.expires_at(httpx.Response(200, headers={"Expires": past})) is None
+
+    fallback = DiscoveryCache(ttl_seconds=10).expires_at(httpx.Response(200))
+    assert fallback is not None and 9 <= fallback - time.time() <= 10
+
+
+def test_uncacheable_discovery_is_fetched_every_time() -> None:
+    transport, calls = _counting_transport({"Cache-Control": "no-store"})
+    cache = DiscoveryCache()
+
+    with httpx.Client(transport=transport) as client:
+        discover_endpoints(client, OAuthConfig(), cache=cache)
+        discover_endpoints(client, OAuthConfig(), cache=cache)
+
+    assert calls["n"] == 2
+
+
+def test_discovery_cache_persists_to_disk(tmp_path: Path) -> None:
+    path = tmp_path / "discovery.json"
+    transport, calls = _counting_transport()
+
+    with httpx.Client(transport=transport) as client:
+        discover_endpoints(client, OAuthConfig(), cache=DiscoveryCache(path=path))
+        config = discover_endpoints(client, OAuthConfig(), cache=DiscoveryCache(path=path))
+
+    assert calls["n"] == 1
+    assert config.authorization_endpoint == "https://issuer.example/authorize"
+
+
+@pytest.mark.asyncio
+async def test_async_discovery_uses_cache() -> None:
+    transport, calls = _counting_transport()
+    cache = DiscoveryCache()
+
+    async with httpx.AsyncClient(transport=transport) as client:
+        await discover_endpoints_async(client, OAuthConfig(), cache=cache)
+        config = await discover_endpoints_async(client, OAuthConfig(), cache=cache)
+
+    assert calls["n"] == 1
+    assert config.token_endpoint == "https://issuer.example/token"
+
+
+def test_discovery_cache_stores_document_and_applies_fallbacks_on_read(
+    tmp_path: Path,
+) -> None:
+    path = tmp_path / "discovery.json"
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"token_endpoint": "https://issuer.example/token"})
+
+    with httpx.Client(transport=httpx.MockTransport(handler)) as client:
+        discover_endpoints(client, OAuthConfig(), cache=DiscoveryCache(path=path))
+
+    cache = DiscoveryCache(path=path)
+    assert cache.get(OAuthConfig().discovery_url) == {
+        "token_endpoint": "https://issuer.example/token"
+    }
+    fallback = OAuthConfig(authorization_endpoint="https://fallback.example/authorize")
+    with httpx.Client(transport=httpx.MockTransport(handler)) as client:
+        config = discover_endpoints(client, fallback, cache=cache)
+
+    assert config.authorization_endpoint == "https://fallback.example/authorize"
+    assert config.token_endpoint == "https://issuer.example/token"
+
+
+def test_clients_pass_discovery_cache_to_oauth_provider(tmp_path: Path) -> None:
+    cache = DiscoveryCache(path=tmp_path / "discovery.json")
+
+    for client_cls in (Client, AsyncClient):
+        client = client_cls(token_store=InMemoryTokenStore(), discovery_cache=cache)
+        assert client.auth._discovery_cache is cache
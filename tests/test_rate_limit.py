@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import asyncio
+
+import httpx
+import pytest
+
+from conftest import InMemoryTokenStore
+from oauth_codex import Client, RateLimiter
+from oauth_codex._rate_limit import estimate_request_tokens
+from oauth_codex.core_types import OAuthTokens
+
+
+def _tokens() -> OAuthTokens:
+    return OAuthTokens(access_token="a", refresh_token="r", expires_at=9_999_999_999)
+
+
+def test_estimate_request_tokens_uses_input_size_and_max_output_tokens() -> None:
+    payload = {
+        "model": "gpt-5.3-codex",
+        "instructions": "x" * 40,
+        "input": [{"role": "user", "content": [{"type": "input_text", "text": "y" * 400}]}],
+        "max_output_tokens": 256,
+    }
+
+    # 40 + 400 + len("user") + len("input_text") characters, four per token.
+    assert estimate_request_tokens(payload) == 114 + 256
+    assert estimate_request_tokens({"file_ids": ["f"]}) == 0
+    assert estimate_request_tokens(None) == 0
+
+
+def test_reservations_queue_callers_in_arrival_order() -> None:
+    limiter = RateLimiter(requests_per_minute=2)
+
+    delays = [limiter._reserve(0) for _ in range(4)]
+
+    assert delays[:2] == [0.0, 0.0]
+    assert delays[2] == pytest.approx(30.0, abs=0.1)
+    assert delays[3] == pytest.approx(60.0, abs=0.1)
+
+
+def test_token_bucket_paces_large_requests() -> None:
+    limiter = RateLimiter(tokens_per_minute=100)
+
+    assert limiter._reserve(80) == 0.0
+    assert limiter._reserve(80) == pytest.approx(36.0, abs=0.1)
+
+
+def test_limits_are_learned_from_response_headers() -> None:
+    limiter = RateLimiter()
+    assert limiter._reserve(1000) == 0.0
+
+    limiter.update_from_headers(
+        {
+            "x-ratelimit-limit-requests": "10",
+            "x-ratelimit-remaining-requests": "0",
+            "x-ratelimit-reset-requests": "6s",
+            "x-ratelimit-limit-tokens": "50000",
+        }
+    )
+
+    assert limiter.requests_per_minute == 10
+    assert limiter.tokens_per_minute == 50000
+    assert limiter._reserve(0) == pytest.approx(12.0, abs=0.1)
+
+
+def test_configured_limit_caps_learned_limit() -> None:
+    limiter = RateLimiter(requests_per_minute=5)
+
+    limiter.update_from_headers({"x-ratelimit-limit-requests": "500"})
+
+    assert limiter.requests_per_minute == 5
+
+
+def test_client_waits_on_limiter_before_sending(monkeypatch: pytest.MonkeyPatch) -> None:
+    sleeps: list[float] = []
+    monkeypatch.setattr("oauth_codex._rate_limit.time.sleep", sleeps.append)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            200,
+            json={"ok": True},
+            headers={"x-ratelimit-limit-requests": "60", "x-ratelimit-remaining-requests": "0"},
+        )
+
+    client = Client(
+        token_store=InMemoryTokenStore(_tokens()),
+        http_client=httpx.Client(transport=httpx.MockTransport(handler)),
+        rate_limiter=RateLimiter(),
+    )
+
+    client.request("GET", "/models")
+    client.request("GET", "/models")
+
+    assert len(sleeps) == 1
+    assert sleeps[0] == pytest.approx(1.0, abs=0.1)
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_returns_its_reservation() -> None:
+    limiter = RateLimiter(requests_per_minute=1)
+    await limiter.aacquire()
+
+    waiter = asyncio.create_task(limiter.aacquire())
+    await asyncio.sleep(0)
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+
+    assert limiter._reserve(0) == pytest.approx(60.0, abs=0.1)
@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+import json
+import time
+from pathlib import Path
+
+import httpx
+import pytest
+
+from conftest import InMemoryTokenStore
+from oauth_codex import AsyncClient, Client
+from oauth_codex.cache import (
+    LRUResponseCache,
+    SQLiteResponseCache,
+    response_cache_key,
+)
+from oauth_codex.core_types import OAuthTokens
+
+
+def _tokens() -> OAuthTokens:
+    return OAuthTokens(access_token="a", refresh_token="r", expires_at=9_999_999_999)
+
+
+class _Backend:
+    def __init__(self, status: str = "completed") -> None:
+        self.calls = 0
+        self.status = status
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.calls += 1
+        body = json.loads(request.content)
+        return httpx.Response(
+            200,
+            json={"id": f"resp_{self.calls}", "output_text": body["input"], "status": self.status},
+        )
+
+
+def _client(backend: _Backend, cache: object) -> Client:
+    return Client(
+        token_store=InMemoryTokenStore(_tokens()),
+        http_client=httpx.Client(transport=httpx.MockTransport(backend)),
+        response_cache=cache,  # type: ignore[arg-type]
+    )
+
+
+def test_cache_key_is_canonical() -> None:
+    assert response_cache_key({"a": 1, "b": [1, 2]}) == response_cache_key({"b": [1, 2], "a": 1})
+    assert response_cache_key({"a": 1}) != response_cache_key({"a": 2})
+
+
+def test_identical_requests_are_served_from_cache() -> None:
+    backend = _Backend()
+    cache = LRUResponseCache()
+    client = _client(backend, cache)
+
+    first = client.responses.create(model="gpt-5.3-codex", input="hi", temperature=0)
+    second = client.responses.create(model="gpt-5.3-codex", input="hi", temperature=0)
+    other = client.responses.create(model="gpt-5.3-codex", input="bye", temperature=0)
+
+    assert backend.calls == 2
+    assert first.id == second.id == "resp_1"
+    assert other.id == "resp_2"
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.entries) == (1, 2, 2)
+    assert stats.bytes > 0
+
+
+def test_per_call_cache_false_bypasses_cache() -> None:
+    backend = _Backend()
+    client = _client(backend, LRUResponseCache())
+
+    client.responses.create(model="m", input="hi")
+    out = client.responses.create(model="m", input="hi", cache=False)
+
+    assert backend.calls == 2
+    assert out.id == "resp_2"
+
+
+def test_incomplete_responses_are_not_cached() -> None:
+    backend = _Backend(status="incomplete")
+    client = _client(backend, LRUResponseCache())
+
+    client.responses.create(model="m", input="hi")
+    client.responses.create(model="m", input="hi")
+
+    assert backend.calls == 2
+
+
+def test_lru_evicts_by_entries_bytes_and_ttl(monkeypatch: pytest.MonkeyPatch) -> None:
+    cache = LRUResponseCache(max_entries=2, max_bytes=10, ttl_seconds=60)
+    cache.set("a", b"1234")
+    cache.set("b", b"1234")
+    cache.get("a")
+    cache.set("c", b"1234")
+
+    assert cache.get("b") is None
+    assert cache.get("a") == b"1234"
+
+    cache.set("d", b"12345678")
+    assert cache.stats().bytes <= 10
+
+    now = time.time()
+    monkeypatch.setattr("oauth_codex.cache.time.time", lambda: now + 120)
+    assert cache.get("d") is None
+    assert cache.stats().entries == 0
+
+
+def test_sqlite_cache_is_shared_between_instances(tmp_path: Path) -> None:
+    path = tmp_path / "responses.sqlite3"
+    backend = _Backend()
+
+    _client(backend, SQLiteResponseCache(path)).responses.create(model="m", input="hi")
+    other = SQLiteResponseCache(path)
+    response = _client(backend, other).responses.create(model="m", input="hi")
+
+    assert backend.calls == 1
+    assert response.id == "resp_1"
+    assert other.stats().hits == 1
+    assert other.stats().entries == 1
+
+
+def test_sqlite_cache_evicts_least_recently_used(tmp_path: Path) -> None:
+    cache = SQLiteResponseCache(tmp_path / "c.sqlite3", max_entries=2)
+    cache.set("a", b"1")
+    time.sleep(0.01)
+    cache.set("b", b"2")
+    time.sleep(0.01)
+    cache.get("a")
+    cache.set("c", b"3")
+
+    assert cache.get("b") is None
+    assert cache.get("a") == b"1"
+    assert cache.stats().entries == 2
+    cache.close()
+
+
+@pytest.mark.asyncio
+async def test_async_client_uses_response_cache() -> None:
+    backend = _Backend()
+    client = AsyncClient(
+        token_store=InMemoryTokenStore(_tokens()),
+        http_client=httpx.AsyncClient(transport=httpx.MockTransport(backend)),
+        response_cache=LRUResponseCache(),
+    )
+
+    await client.responses.create(model="m", input="hi")
+    response = await client.responses.create(model="m", input="hi")
+
+    assert backend.calls == 1
+    assert response.id == "resp_1"
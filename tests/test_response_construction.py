@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import httpx
+
+from conftest import InMemoryTokenStore
+from oauth_codex import Client
+from oauth_codex.core_types import OAuthTokens
+from oauth_codex.resources.responses._helpers import response_from_engine
+from oauth_codex.types.shared import TokenUsage
+
+
+def _body(items: int = 3) -> dict:
+    return {
+        "id": "resp_1",
+        "output": [
+            {
+                "type": "message",
+                "role": "assistant",
+                "content": [{"type": "output_text", "text": f"part {index}"}],
+            }
+            for index in range(items)
+        ],
+        "output_text": "part 0part 1part 2",
+        "usage": {"input_tokens": 10, "output_tokens": 5, "total_tokens": 15},
+        "finish_reason": "stop",
+    }
+
+
+def test_trusted_construction_matches_validated() -> None:
+    validated = response_from_engine(_body())
+    trusted = response_from_engine(_body(), trusted=True)
+
+    assert trusted.to_dict() == validated.to_dict()
+    assert trusted.output_text == "part 0part 1part 2"
+    assert isinstance(trusted.usage, TokenUsage)
+    assert trusted.usage.total_tokens == 15
+    assert trusted.reasoning_items == []
+
+
+def test_trusted_construction_reuses_output_items() -> None:
+    body = _body()
+    trusted = response_from_engine(body, trusted=True)
+
+    assert trusted.output is body["output"]
+    assert response_from_engine(body).output is not body["output"]
+
+
+def test_client_trusted_responses_option() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json=_body(items=500))
+
+    client = Client(
+        token_store=InMemoryTokenStore(
+            OAuthTokens(access_token="a", refresh_token="r", expires_at=9_999_999_999)
+        ),
+        http_client=httpx.Client(transport=httpx.MockTransport(handler)),
+        trusted_responses=True,
+    )
+
+    response = client.responses.create(model="gpt-5.3-codex", input="hi")
+
+    assert response.id == "resp_1"
+    assert len(response.output) == 500
+    assert response.usage is not None and response.usage.input_tokens == 10
@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import time
+from email.utils import formatdate
+
+import httpx
+import pytest
+
+from conftest import InMemoryTokenStore
+from oauth_codex import AsyncClient, Client, InternalServerError, RateLimitError, RetryPolicy
+from oauth_codex._retry import _parse_duration
+from oauth_codex.core_types import OAuthTokens
+
+
+def _tokens() -> OAuthTokens:
+    return OAuthTokens(access_token="a", refresh_token="r", expires_at=9_999_999_999)
+
+
+def _client(
+    responses: list[httpx.Response],
+    *,
+    max_retries: int = 2,
+    retry_policy: RetryPolicy | None = None,
+) -> tuple[Client, dict[str, int]]:
+    calls = {"n": 0}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls["n"] += 1
+        return responses[min(calls["n"], len(responses)) - 1]
+
+    client = Client(
+        token_store=InMemoryTokenStore(_tokens()),
+        http_client=httpx.Client(transport=httpx.MockTransport(handler)),
+        max_retries=max_retries,
+        retry_policy=retry_policy,
+    )
+    return client, calls
+
+
+@pytest.fixture
+def sleeps(monkeypatch: pytest.MonkeyPatch) -> list[float]:
+    recorded: list[float] = []
+    monkeypatch.setattr("oauth_codex._base_client.time.sleep", recorded.append)
+    return recorded
+
+
+def test_parse_rate_limit_reset_durations() -> None:
+    assert _parse_duration("1s") == 1.0
+    assert _parse_duration("6m0s") == 360.0
+    assert _parse_duration("1h2m3.5s") == 3723.5
+    assert _parse_duration("250ms") == 0.25
+    assert _parse_duration("2.5") == 2.5
+    assert _parse_duration("soon") is None
+
+
+def test_retry_after_ms_is_honoured(sleeps: list[float]) -> None:
+    client, calls = _client(
+        [
+            httpx.Response(429, headers={"retry-after-ms": "1500"}),
+            httpx.Response(200, json={"ok": True}),
+        ]
+    )
+
+    assert client.request("GET", "/models").json() == {"ok": True}
+    assert calls["n"] == 2
+    assert sleeps == [1.5]
+
+
+def test_retry_after_http_date_and_rate_limit_reset_headers() -> None:
+    policy = RetryPolicy()
+    future = formatdate(time.time() + 30, usegmt=True)
+    delay = policy.server_delay_seconds(httpx.Response(503, headers={"retry-after": future}))
+    assert delay is not None and 28 <= delay <= 30
+
+    response = httpx.Response(
+        429,
+        headers={
+            "x-ratelimit-remaining-requests": "10",
+            "x-ratelimit-reset-requests": "1s",
+            "x-ratelimit-remaining-tokens": "0",
+            "x-ratelimit-reset-tokens": "6m0s",
+        },
+    )
+    assert policy.server_delay_seconds(response) == 360.0
+
+
+def test_hint_beyond_total_sleep_cap_is_not_retried(sleeps: list[float]) -> None:
+    client, calls = _client(
+        [httpx.Response(429, headers={"retry-after": "120"})],
+        retry_policy=RetryPolicy(max_total_sleep=30.0),
+    )
+
+    with pytest.raises(RateLimitError):
+        client.request("GET", "/models")
+
+    assert calls["n"] == 1
+    assert sleeps == []
+
+
+def test_x_should_retry_false_disables_retry(sleeps: list[float]) -> None:
+    client, calls = _client([httpx.Response(503, headers={"x-should-retry": "false"})])
+
+    with pytest.raises(InternalServerError):
+        client.request("GET", "/models")
+
+    assert calls["n"] == 1
+
+
+def test_retry_budget_limits_retries_across_requests(sleeps: list[float]) -> None:
+    client, calls = _client(
+        [httpx.Response(503)],
+        max_retries=3,
+        retry_policy=RetryPolicy(budget_capacity=2.0, budget_ratio=0.0),
+    )
+
+    for _ in range(3):
+        with pytest.raises(InternalServerError):
+            client.request("GET", "/models")
+
+    # Two retries drain the budget; later requests fail fast.
+    assert calls["n"] == 5
+    assert len(sleeps) == 2
+
+
+@pytest.mark.asyncio
+async def test_async_client_honours_retry_after(monkeypatch: pytest.MonkeyPatch) -> None:
+    sleeps: list[float] = []
+
+    async def fake_sleep(delay: float) -> None:
+        sleeps.append(delay)
+
+    monkeypatch.setattr("oauth_codex._base_client.asyncio.sleep", fake_sleep)
+    responses = [
+        httpx.Response(503, headers={"retry-after": "2"}),
+        httpx.Response(200, json={"ok": True}),
+    ]
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        return responses.pop(0)
+
+    client = AsyncClient(
+        token_store=InMemoryTokenStore(_tokens()),
+        http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+    )
+
+    response = await client.request("GET", "/models")
+
+    assert response.json() == {"ok": True}
+    assert sleeps == [2.0]
@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import json
+from collections.abc import AsyncIterator, Iterator
+from typing import Any
+
+import httpx
+import pytest
+
+from conftest import InMemoryTokenStore
+from oauth_codex import AsyncClient, Client
+from oauth_codex._streaming import SSEDecoder
+from oauth_codex.core_types import OAuthTokens
+
+
+def _tokens() -> OAuthTokens:
+    return OAuthTokens(access_token="a", refresh_token="r", expires_at=9_999_999_999)
+
+
+def _sse(event: dict[str, Any]) -> bytes:
+    return f"data: {json.dumps(event)}\n\n".encode()
+
+
+def test_sse_decoder_joins_multiline_data_and_skips_comments() -> None:
+    decoder = SSEDecoder()
+    lines = [": keep-alive", "event: text_delta", "data: {\"a\":", "data: 1}", ""]
+
+    events = [sse for sse in map(decoder.decode, lines) if sse is not None]
+
+    assert len(events) == 1
+    assert events[0].event == "text_delta"
+    assert events[0].data == '{"a":\n1}'
+
+
+def test_sync_stream_yields_events_before_body_completes() -> None:
+    produced: list[int] = []
+
+    def body() -> Iterator[bytes]:
+        for index, event in enumerate(
+            [
+                {"type": "text_delta", "delta": "Hel"},
+                {"type": "text_delta", "delta": "lo"},
+                {"type": "done"},
+            ]
+        ):
+            produced.append(index)
+            yield _sse(event)
+        yield b"data: [DONE]\n\n"
+
+    captured: dict[str, Any] = {}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        captured["body"] = json.loads(request.content)
+        captured["authorization"] = request.headers.get("authorization")
+        return httpx.Response(
+            200, headers={"content-type": "text/event-stream"}, content=body()
+        )
+
+    client = Client(token_store=InMemoryTokenStore(_tokens()))
+    client._client = httpx.Client(transport=httpx.MockTransport(handler))
+
+    stream = client.responses.stream(model="gpt-5.3-codex", input="hi")
+    first = next(stream)
+
+    assert first.type == "text_delta"
+    assert first.delta == "Hel"
+    assert produced == [0]
+    assert captured["body"]["stream"] is True
+    assert captured["authorization"] == "Bearer a"
+
+    rest = list(stream)
+    assert [event.type for event in rest] == ["text_delta", "done"]
+    assert produced == [0, 1, 2]
+
+
+def test_sync_stream_closes_response_when_abandoned() -> None:
+    closed = {"value": False}
+
+    class _Body(httpx.SyncByteStream):
+        def __iter__(self) -> Iterator[bytes]:
+            yield _sse({"type": "text_delta", "delta": "a"})
+            yield _sse({"type": "text_delta", "delta": "b"})
+
+        def close(self) -> None:
+            closed["value"] = True
+
+    def handler(_request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            200, headers={"content-type": "text/event-stream"}, stream=_Body()
+        )
+
+    client = Client(token_store=InMemoryTokenStore(_tokens()))
+    client._client = httpx.Client(transport=httpx.MockTransport(handler))
+
+    stream = client.responses.stream(model="gpt-5.3-codex", input="hi")
+    next(stream)
+    stream.close()
+
+    assert closed["value"] is True
+
+
+@pytest.mark.asyncio
+async def test_async_stream_reads_lazily_and_closes_when_abandoned() -> None:
+    produced: list[int] = []
+    closed = {"value": False}
+
+    class _Body(httpx.AsyncByteStream):
+        async def __aiter__(self) -> AsyncIterator[bytes]:
+            for index in range(3):
+                produced.append(index)
+                yield _sse({"type": "text_delta", "delta": str(index)})
+
+        async def aclose(self) -> None:
+            closed["value"] = True
+
+    def handler(_request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            200, headers={"content-type": "text/event-stream"}, stream=_Body()
+        )
+
+    client = AsyncClient(token_store=InMemoryTokenStore(_tokens()))
+    client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    stream = await client.responses.stream(model="gpt-5.3-codex", input="hi")
+    first = await anext(stream)
+
+    assert first.delta == "0"
+    assert produced == [0]
+
+    await stream.aclose()
+
+    assert closed["value"] is True
+    assert produced == [0]
@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import time
+
+import httpx
+
+from conftest import InMemoryTokenStore
+from oauth_codex import Client
+from oauth_codex._token_estimate import TokenEstimator
+from oauth_codex.core_types import OAuthTokens
+
+
+def _tokens() -> OAuthTokens:
+    return OAuthTokens(access_token="a", refresh_token="r", expires_at=9_999_999_999)
+
+
+def test_estimate_weighs_scripts_and_attachments() -> None:
+    estimator = TokenEstimator()
+
+    assert estimator.estimate(input="a" * 400) == 104
+    # Three UTF-8 bytes per CJK character -> roughly one token each.
+    assert estimator.estimate(input="漢" * 100) == 104
+    image = {"type": "input_image", "image_url": "data:image/png;base64," + "A" * 100_000}
+    message = [{"role": "user", "content": [image, {"type": "input_text", "text": "a" * 40}]}]
+    assert estimator.estimate(input=message) < 800
+    assert estimator.estimate(input="hi", tools=[{"type": "function", "name": "f"}]) > (
+        estimator.estimate(input="hi")
+    )
+
+
+def test_estimate_handles_megabyte_inputs_quickly() -> None:
+    estimator = TokenEstimator()
+    text = "The quick brown fox jumps over the lazy dog. " * 23_000
+    messages = [{"role": "user", "content": [{"type": "input_text", "text": "x" * 100}]}] * 5_000
+
+    started = time.perf_counter()
+    estimator.estimate(input=text)
+    estimator.estimate(input=messages)
+    assert time.perf_counter() - started < 0.5
+
+
+def test_calibration_converges_on_observed_counts() -> None:
+    estimator = TokenEstimator()
+    raw = estimator.estimate(input="a" * 400, model="m")
+
+    for _ in range(50):
+        estimator.observe(input="a" * 400, actual_tokens=156, model="m")
+
+    assert estimator.samples("m") == 50
+    assert estimator.estimate(input="a" * 800, model="m") == 306
+    assert estimator.estimate(input="a" * 400, model="other") == raw
+
+
+def test_client_calibrates_from_counts_and_usage() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/input_tokens"):
+            return httpx.Response(200, json={"input_tokens": 208})
+        return httpx.Response(
+            200, json={"id": "resp_1", "output_text": "ok", "usage": {"input_tokens": 208}}
+        )
+
+    client = Client(
+        token_store=InMemoryTokenStore(_tokens()),
+        http_client=httpx.Client(transport=httpx.MockTransport(handler)),
+    )
+    input_tokens = client.responses.input_tokens
+
+    assert input_tokens.estimate(input="a" * 400, model="m") == 104
+    input_tokens.count(input="a" * 400, model="m")
+    assert input_tokens.estimate(input="a" * 400, model="m") == 208
+
+    client.responses.create(model="n", input="a" * 400)
+    assert input_tokens.estimate(input="a" * 400, model="n") == 208
+
+    input_tokens.calibrate(input="a" * 400, actual_tokens=104, model="x")
+    assert input_tokens.estimate(input="a" * 400, model="x") == 104
+
+
+def test_usage_calibration_skips_idle_estimators_and_server_context() -> None:
+    estimator = TokenEstimator()
+    body = {"usage": {"input_tokens": 4000}}
+
+    estimator.observe_usage({"model": "m", "input": "a" * 400}, body)
+    assert estimator.samples("m") == 0
+
+    estimator.estimate(input="a" * 400, model="m")
+    for _ in range(30):
+        estimator.observe_usage(
+            {"model": "m", "input": "a" * 400, "previous_response_id": "resp_1"}, body
+        )
+        estimator.observe_usage({"model": "m", "input": "a" * 400, "conversation": "c"}, body)
+    assert estimator.samples("m") == 0
+    assert estimator.scale("m") == 1.0
+
+    estimator.observe_usage({"model": "m", "input": "a" * 400}, {"usage": {"input_tokens": 208}})
+    assert estimator.samples("m") == 1
@@ -0,0 +1,191 @@
+from __future__ import annotations
+
+import copy
+import gc
+import json
+from typing import Any
+
+import httpx
+import pytest
+from pydantic import BaseModel
+
+import oauth_codex.tooling as tooling
+from conftest import InMemoryTokenStore
+from oauth_codex import Client
+from oauth_codex.core_types import OAuthTokens
+from oauth_codex.tooling import callable_to_tool_schema
+
+
+class _Query(BaseModel):
+    city: str
+    days: int = 1
+
+
+def _count_builds(monkeypatch: pytest.MonkeyPatch) -> list[Any]:
+    built: list[Any] = []
+    original = tooling._build_tool_schema
+
+    def counting(func: Any) -> Any:
+        built.append(func)
+        return original(func)
+
+    monkeypatch.setattr(tooling, "_build_tool_schema", counting)
+    return built
+
+
+def test_tool_schema_is_memoized_per_function(monkeypatch: pytest.MonkeyPatch) -> None:
+    built = _count_builds(monkeypatch)
+
+    def forecast(query: _Query) -> str:
+        """Get the forecast."""
+        return query.city
+
+    first = callable_to_tool_schema(forecast)
+    first["parameters"]["properties"]["city"]["type"] = "integer"
+    second = callable_to_tool_schema(forecast)
+
+    assert built == [forecast]
+    assert second["description"] == "Get the forecast."
+    assert second["parameters"]["properties"]["city"]["type"] == "string"
+
+
+def test_tool_schema_cache_does_not_keep_functions_alive() -> None:
+    def add(a: int, b: int) -> int:
+        return a + b
+
+    callable_to_tool_schema(add)
+    assert add in tooling._TOOL_SCHEMA_CACHE
+    before = len(tooling._TOOL_SCHEMA_CACHE)
+
+    del add
+    gc.collect()
+
+    assert len(tooling._TOOL_SCHEMA_CACHE) == before - 1
+
+
+def test_bound_methods_share_a_cache_entry(monkeypatch: pytest.MonkeyPatch) -> None:
+    built = _count_builds(monkeypatch)
+
+    class Tools:
+        def lookup(self, key: str) -> str:
+            return key
+
+    tools = Tools()
+    schema = callable_to_tool_schema(tools.lookup)
+    callable_to_tool_schema(tools.lookup)
+    callable_to_tool_schema(Tools().lookup)
+
+    assert len(built) == 1
+    assert list(schema["parameters"]["properties"]) == ["key"]
+
+
+def test_uncacheable_callables_still_get_schemas(monkeypatch: pytest.MonkeyPatch) -> None:
+    built = _count_builds(monkeypatch)
+
+    class Slotted:
+        __slots__ = ()
+        __name__ = "slotted"
+
+        def __call__(self, value: int) -> int:
+            return value
+
+    tool = Slotted()
+    callable_to_tool_schema(tool)
+    schema = callable_to_tool_schema(tool)
+
+    assert len(built) == 2
+    assert schema["parameters"]["properties"] == {"value": {"type": "integer"}}
+
+
+def test_strict_response_format_is_compiled_once_per_model(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    compiled: list[Any] = []
+    original = tooling._compile_strict_response_format
+
+    def counting(output_schema: Any) -> Any:
+        compiled.append(output_schema)
+        return original(output_schema)
+
+    monkeypatch.setattr(tooling, "_compile_strict_response_format", counting)
+
+    class Answer(BaseModel):
+        text: str
+        score: float
+
+    shared = tooling.cached_strict_response_format(Answer)
+    assert tooling.cached_strict_response_format(Answer) is shared
+    built = tooling.build_strict_response_format(Answer)
+    built["schema"]["required"].append("extra")
+
+    assert compiled == [Answer]
+    assert shared["schema"]["required"] == ["text", "score"]
+    assert shared == tooling.build_strict_response_format(Answer)
+    with pytest.raises(TypeError):
+        shared["name"] = "other"
+    with pytest.raises(TypeError):
+        shared["schema"]["required"].append("extra")
+
+
+def test_strict_response_format_caches_dict_schemas_by_content() -> None:
+    schema = {"type": "object", "properties": {"a": {"type": "string"}}}
+    reordered = {"properties": {"a": {"type": "string"}}, "type": "object"}
+
+    first = tooling.cached_strict_response_format(schema)
+
+    assert tooling.cached_strict_response_format(reordered) is first
+    assert first["schema"]["additionalProperties"] is False
+    assert "additionalProperties" not in schema
+    assert json.loads(json.dumps(first)) == first
+    assert copy.deepcopy(first) == first
+    copy.deepcopy(first)["schema"]["required"].append("b")
+
+
+def test_toolset_compiles_schemas_and_dispatch_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    def add(a: int, b: int) -> int:
+        """Add two numbers."""
+        return a + b
+
+    web_search = {"type": "web_search"}
+    tools = tooling.ToolSet([add, web_search])
+    built = _count_builds(monkeypatch)
+
+    assert [schema.get("name") for schema in tools] == ["add", None]
+    assert tools.schemas[0]["parameters"]["required"] == ["a", "b"]
+    assert tools.functions == {"add": add}
+    assert json.loads(tools.json) == tools.schemas
+    assert tools.json is tools.json
+    assert len(tools) == 2
+    assert built == []
+    with pytest.raises(TypeError):
+        tools.schemas.append({})
+
+
+def test_toolset_rejects_duplicate_names() -> None:
+    def lookup(key: str) -> str:
+        return key
+
+    with pytest.raises(ValueError, match="Duplicate tool name"):
+        tooling.ToolSet([lookup, lookup])
+
+
+def test_responses_create_sends_toolset_schemas() -> None:
+    sent: list[Any] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        sent.append(json.loads(request.content)["tools"])
+        return httpx.Response(200, json={"id": "resp_1", "output_text": "ok"})
+
+    def lookup(key: str) -> str:
+        return key
+
+    tools = tooling.ToolSet([lookup])
+    client = Client(
+        token_store=InMemoryTokenStore(
+            OAuthTokens(access_token="a", refresh_token="r", expires_at=9_999_999_999)
+        ),
+        http_client=httpx.Client(transport=httpx.MockTransport(handler)),
+    )
+    client.responses.create(model="gpt-5.3-codex", input="hi", tools=tools)
+
+    assert sent == [json.loads(tools.json)]